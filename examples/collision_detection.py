@@ -60,7 +60,7 @@ def run_demo():
 
     # Safe position
     player_pos_2 = (20, 20)
-    if player_pos_2 in world - c_obstacles:
+    if world.contains_except(player_pos_2, c_obstacles):
         print(f"\n[v] Player safe at {player_pos_2}")
 
     # 5. Analysis
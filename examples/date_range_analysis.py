@@ -50,7 +50,7 @@ def main():
     # Calculate coverage statistics
     total_time = expected_range.length()
     covered_time = data_ranges.measure()
-    missing_time = sum(gap.length() for gap in gaps)
+    missing_time = gaps.measure()
 
     print(f"\nCoverage Statistics:")
     print(f"  Total time: {total_time:.0f} seconds")
@@ -103,7 +103,7 @@ def main():
     # Recalculate coverage
     new_covered = merged_data.measure()
     new_gaps = merged_data.complement(IntervalSet([expected_range]))
-    new_missing = sum(gap.length() for gap in new_gaps)
+    new_missing = new_gaps.measure()
 
     print(f"\nUpdated Coverage:")
     print(
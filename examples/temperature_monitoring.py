@@ -3,20 +3,25 @@ Example: Temperature Range Monitoring
 
 This example demonstrates using intervals for monitoring
 temperature ranges, validating readings, and detecting anomalies.
+
+Run it as a module from the repository root:
+
+    python -m examples.temperature_monitoring
 """
 
 import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from array import array
 
 from src.intervals import Interval, IntervalSet
 
 
 def main():
-    print("=" * 60)
-    print("Temperature Monitoring System")
-    print("=" * 60)
+    # Collect the report lines and write them to stdout once at the end
+    out = []
+
+    out.append("=" * 60)
+    out.append("Temperature Monitoring System")
+    out.append("=" * 60)
 
     # Define temperature ranges (in Celsius)
     optimal_range = Interval(18, 25)  # Ideal: 18-25°C
@@ -26,138 +31,145 @@ def main():
     critical_range = IntervalSet(
         [Interval(-10, 10), Interval(35, 50)]  # Critical cold  # Critical hot
     )
-
-    print("\nTemperature Range Definitions:")
-    print(f"  Optimal:    {optimal_range}°C")
-    print(f"  Acceptable: {acceptable_range}°C")
-    print(f"  Warning:    {warning_cold}°C or {warning_hot}°C")
-    print(f"  Critical:   < 10°C or > 35°C")
-
-    # Simulate temperature readings
-    temperature_readings = [
-        (8, "Server Room A"),
-        (22, "Server Room B"),
-        (16, "Storage Area"),
-        (29, "Office Space"),
-        (38, "Data Center"),
-        (12, "Backup Room"),
-        (24, "Control Room"),
+    # Both warning bands as one set, so each reading needs a single lookup
+    warning_range = IntervalSet([warning_cold, warning_hot])
+
+    out.append("\nTemperature Range Definitions:")
+    out.append(f"  Optimal:    {optimal_range}°C")
+    out.append(f"  Acceptable: {acceptable_range}°C")
+    out.append(f"  Warning:    {warning_cold}°C or {warning_hot}°C")
+    out.append(f"  Critical:   < 10°C or > 35°C")
+
+    # Simulate temperature readings, kept as parallel sequences: a packed
+    # array of doubles for the values and a list of locations
+    temps = array("d", [8, 22, 16, 29, 38, 12, 24])
+    locations = [
+        "Server Room A",
+        "Server Room B",
+        "Storage Area",
+        "Office Space",
+        "Data Center",
+        "Backup Room",
+        "Control Room",
     ]
 
-    print("\n" + "=" * 60)
-    print("Analyzing Temperature Readings")
-    print("=" * 60)
-
-    optimal_count = 0
-    acceptable_count = 0
-    warning_count = 0
-    critical_count = 0
-
-    for temp, location in temperature_readings:
-        status = ""
-        symbol = ""
-
-        if temp in critical_range:
-            status = "CRITICAL"
-            symbol = "🚨"
-            critical_count += 1
-        elif temp in warning_cold or temp in warning_hot:
-            status = "WARNING"
-            symbol = "⚠️ "
-            warning_count += 1
-        elif temp in optimal_range:
-            status = "OPTIMAL"
-            symbol = "✓ "
-            optimal_count += 1
-        elif temp in acceptable_range:
-            status = "ACCEPTABLE"
-            symbol = "○ "
-            acceptable_count += 1
+    out.append("\n" + "=" * 60)
+    out.append("Analyzing Temperature Readings")
+    out.append("=" * 60)
+
+    # Status codes index into these label/symbol tables
+    OPTIMAL, ACCEPTABLE, WARNING, CRITICAL, UNKNOWN = range(5)
+    LABELS = ("OPTIMAL", "ACCEPTABLE", "WARNING", "CRITICAL", "UNKNOWN")
+    SYMBOLS = ("✓ ", "○ ", "⚠️ ", "🚨", "? ")
+
+    # Classify all readings with one batched membership call per range
+    is_critical = critical_range.contains_many(temps)
+    is_warning = warning_range.contains_many(temps)
+    is_optimal = optimal_range.contains_many(temps)
+    is_acceptable = acceptable_range.contains_many(temps)
+
+    statuses = []
+    for crit, warn, opt, acc in zip(is_critical, is_warning, is_optimal, is_acceptable):
+        if crit:
+            statuses.append(CRITICAL)
+        elif warn:
+            statuses.append(WARNING)
+        elif opt:
+            statuses.append(OPTIMAL)
+        elif acc:
+            statuses.append(ACCEPTABLE)
         else:
-            status = "UNKNOWN"
-            symbol = "? "
+            statuses.append(UNKNOWN)
 
-        print(f"{symbol} {location:20s} {temp:5.1f}°C - {status}")
+    out.extend(
+        f"{SYMBOLS[s]} {location:20s} {temp:5.1f}°C - {LABELS[s]}"
+        for temp, location, s in zip(temps, locations, statuses)
+    )
+
+    # Tally every status in one pass over the codes
+    counts = [0] * len(LABELS)
+    for s in statuses:
+        counts[s] += 1
+    optimal_count, acceptable_count, warning_count, critical_count, _ = counts
 
     # Summary statistics
-    total = len(temperature_readings)
-    print(f"\n" + "=" * 60)
-    print("Summary")
-    print("=" * 60)
-    print(f"  Total readings: {total}")
-    print(f"  Optimal:        {optimal_count} ({optimal_count/total*100:.0f}%)")
-    print(f"  Acceptable:     {acceptable_count} ({acceptable_count/total*100:.0f}%)")
-    print(f"  Warning:        {warning_count} ({warning_count/total*100:.0f}%)")
-    print(f"  Critical:       {critical_count} ({critical_count/total*100:.0f}%)")
+    total = len(temps)
+    out.append(f"\n" + "=" * 60)
+    out.append("Summary")
+    out.append("=" * 60)
+    out.append(f"  Total readings: {total}")
+    out.append(f"  Optimal:        {optimal_count} ({optimal_count/total*100:.0f}%)")
+    out.append(
+        f"  Acceptable:     {acceptable_count} ({acceptable_count/total*100:.0f}%)"
+    )
+    out.append(f"  Warning:        {warning_count} ({warning_count/total*100:.0f}%)")
+    out.append(f"  Critical:       {critical_count} ({critical_count/total*100:.0f}%)")
 
     if critical_count > 0:
-        print(f"\n🚨 ALERT: {critical_count} critical temperature(s) detected!")
+        out.append(f"\n🚨 ALERT: {critical_count} critical temperature(s) detected!")
     elif warning_count > 0:
-        print(f"\n⚠️  WARNING: {warning_count} temperature(s) need attention")
+        out.append(f"\n⚠️  WARNING: {warning_count} temperature(s) need attention")
     else:
-        print(f"\n✓ All temperatures within acceptable range")
+        out.append(f"\n✓ All temperatures within acceptable range")
 
     # Calculate safe operating range
-    print(f"\n" + "=" * 60)
-    print("Operating Range Analysis")
-    print("=" * 60)
+    out.append(f"\n" + "=" * 60)
+    out.append("Operating Range Analysis")
+    out.append("=" * 60)
 
     # Intersection of acceptable ranges shows the safest zone
     safe_zone = optimal_range & acceptable_range
-    print(f"\nSafest operating zone: {safe_zone}°C")
+    out.append(f"\nSafest operating zone: {safe_zone}°C")
 
     # Find the range that needs the most attention
-    # (temperatures outside optimal but inside acceptable)
-    needs_adjustment = acceptable_range - optimal_range
-
-    print(f"\nRanges needing adjustment to reach optimal:")
-    if isinstance(needs_adjustment, IntervalSet):
-        for i, range_adj in enumerate(needs_adjustment, 1):
-            if range_adj.end <= optimal_range.start:
-                print(f"  {i}. {range_adj}°C (too cold - increase heating)")
-            else:
-                print(f"  {i}. {range_adj}°C (too hot - increase cooling)")
-    else:
-        # Single interval result
-        if needs_adjustment.end <= optimal_range.start:
-            print(f"  1. {needs_adjustment}°C (too cold - increase heating)")
+    # (temperatures outside optimal but inside acceptable).
+    # Wrapping the result in an IntervalSet lets a single Interval and a
+    # multi-piece result be iterated the same way.
+    needs_adjustment = IntervalSet([acceptable_range - optimal_range])
+
+    out.append(f"\nRanges needing adjustment to reach optimal:")
+    for i, range_adj in enumerate(needs_adjustment, 1):
+        if range_adj.end <= optimal_range.start:
+            out.append(f"  {i}. {range_adj}°C (too cold - increase heating)")
         else:
-            print(f"  1. {needs_adjustment}°C (too hot - increase cooling)")
+            out.append(f"  {i}. {range_adj}°C (too hot - increase cooling)")
 
     # Find operating margin
-    print(f"\n" + "=" * 60)
-    print("Safety Margins")
-    print("=" * 60)
+    out.append(f"\n" + "=" * 60)
+    out.append("Safety Margins")
+    out.append("=" * 60)
 
     # Distance from optimal to warning zones
     cold_margin = optimal_range.distance(warning_cold)
     hot_margin = optimal_range.distance(warning_hot)
 
-    print(f"\nMargin before warning:")
-    print(f"  Cold side: {cold_margin:.1f}°C")
-    print(f"  Hot side:  {hot_margin:.1f}°C")
+    out.append(f"\nMargin before warning:")
+    out.append(f"  Cold side: {cold_margin:.1f}°C")
+    out.append(f"  Hot side:  {hot_margin:.1f}°C")
 
     # Check specific temperature scenario
-    print(f"\n" + "=" * 60)
-    print("Scenario Analysis")
-    print("=" * 60)
+    out.append(f"\n" + "=" * 60)
+    out.append("Scenario Analysis")
+    out.append("=" * 60)
 
     test_temp = 17.5
-    print(f"\nIf temperature drops to {test_temp}°C:")
+    out.append(f"\nIf temperature drops to {test_temp}°C:")
 
     if test_temp in optimal_range:
-        print("  ✓ Still in optimal range")
+        out.append("  ✓ Still in optimal range")
     elif test_temp in acceptable_range:
         distance_to_optimal = optimal_range.start - test_temp
-        print(f"  ○ Acceptable, but {distance_to_optimal:.1f}°C below optimal")
-        print(f"    Action: Increase temperature by {distance_to_optimal:.1f}°C")
+        out.append(f"  ○ Acceptable, but {distance_to_optimal:.1f}°C below optimal")
+        out.append(f"    Action: Increase temperature by {distance_to_optimal:.1f}°C")
     elif test_temp in warning_cold:
         distance_to_acceptable = acceptable_range.start - test_temp
-        print(f"  ⚠️  Warning! {distance_to_acceptable:.1f}°C below acceptable")
-        print(f"    Action: Immediately increase temperature")
+        out.append(f"  ⚠️  Warning! {distance_to_acceptable:.1f}°C below acceptable")
+        out.append(f"    Action: Immediately increase temperature")
     elif test_temp in critical_range:
-        print(f"  🚨 CRITICAL! Temperature dangerously low")
-        print(f"    Action: Emergency heating required")
+        out.append(f"  🚨 CRITICAL! Temperature dangerously low")
+        out.append(f"    Action: Emergency heating required")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ A Python library for working with intervals and points on the real number line.
 Supports continuous intervals with open/closed boundaries and disjoint interval collections.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 from .intervals import Interval, IntervalSet
-from .multidimensional import Box, BoxSet
 from .errors import (
     IntervalError,
     InvalidIntervalError,
@@ -16,6 +17,32 @@ from .errors import (
 )
 from .utils import Config, config
 
+if TYPE_CHECKING:
+    # Seen by type checkers and IDEs only; at runtime these stay lazy
+    from .multidimensional import Box, BoxSet
+
+# Multi-dimensional types are imported on first access (PEP 562), so code that
+# only needs Interval/IntervalSet skips loading the Box and R-tree modules.
+_LAZY = {
+    "Box": ".multidimensional",
+    "BoxSet": ".multidimensional",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Core classes
     "Interval",
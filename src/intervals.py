@@ -1,7 +1,11 @@
 """Core classes for interval arithmetic and set operations."""
 
+import bisect
+import heapq
 import math
-from typing import Union, List, Optional, Iterator, Iterable
+import weakref
+from collections import OrderedDict
+from typing import Union, List, Optional, Iterator, Iterable, Tuple
 from .errors import InvalidIntervalError
 from .utils import intervals_are_adjacent
 
@@ -22,6 +26,10 @@ class Interval:
         >>> Point(5)                # [5, 5] - degenerate interval (point)
     """
 
+    # Intervals are created in bulk by every set operation; without a
+    # per-instance __dict__ each one is much smaller and faster to build.
+    __slots__ = ("_start", "_end", "_open_start", "_open_end", "_repr")
+
     def __init__(
         self,
         start: float,
@@ -77,6 +85,24 @@ class Interval:
         self._open_start = open_start
         self._open_end = open_end
 
+    @classmethod
+    def _from_bounds(
+        cls, start: float, end: float, open_start: bool, open_end: bool
+    ) -> "Interval":
+        """
+        Build an interval from bounds derived from existing intervals.
+
+        Skips the conversion and validation in __init__. Callers guarantee
+        float bounds with start <= end, open infinite ends, and no empty
+        (open degenerate) result.
+        """
+        interval = cls.__new__(cls)
+        interval._start = start
+        interval._end = end
+        interval._open_start = open_start
+        interval._open_end = open_end
+        return interval
+
     @classmethod
     def point(cls, value: float) -> "Interval":
         """
@@ -210,22 +236,28 @@ class Interval:
         else:
             return False
 
-    def _contains_value(self, value: float) -> bool:
-        """Check if interval contains a numeric value."""
-        if self.is_empty():
-            return False
-
-        # Check bounds
-        if value < self._start or value > self._end:
-            return False
+    def contains_many(self, values: Iterable[float]) -> List[bool]:
+        """
+        Check many values at once.
 
-        # Check boundaries
-        if value == self._start and self._open_start:
-            return False
-        if value == self._end and self._open_end:
-            return False
+        Returns one bool per value, equivalent to ``[v in self for v in values]``
+        but with the bounds read once instead of per call.
+        """
+        lo, hi = self._start, self._end
+        closed_lo, closed_hi = not self._open_start, not self._open_end
+        return [
+            (lo < v or (closed_lo and v == lo)) and (v < hi or (closed_hi and v == hi))
+            for v in values
+        ]
 
-        return True
+    def _contains_value(self, value: float) -> bool:
+        """Check if interval contains a numeric value."""
+        # Straight-line bound test. The canonical empty interval, (0, 0) with
+        # both ends open, fails it for every value, NaN included.
+        start, end = self._start, self._end
+        return (start < value or (value == start and not self._open_start)) and (
+            value < end or (value == end and not self._open_end)
+        )
 
     def _contains_interval(self, other: "Interval") -> bool:
         """Check if this interval completely contains another interval."""
@@ -454,7 +486,7 @@ class Interval:
         if start == end:
             return Point(start)
 
-        return Interval(start, end, open_start=open_start, open_end=open_end)
+        return Interval._from_bounds(start, end, open_start, open_end)
 
     def union(self, other: "Interval") -> Union["Interval", "IntervalSet"]:
         """
@@ -488,7 +520,7 @@ class Interval:
         else:
             open_end = other._open_end
 
-        return Interval(start, end, open_start=open_start, open_end=open_end)
+        return Interval._from_bounds(start, end, open_start, open_end)
 
     def difference(self, other: "Interval") -> Union["Interval", "IntervalSet"]:
         """
@@ -595,6 +627,8 @@ class Interval:
 
     def __contains__(self, item) -> bool:
         """Support 'in' operator."""
+        if isinstance(item, (int, float)):
+            return self._contains_value(item)
         return self.contains(item)
 
     def interior(self) -> "Interval":
@@ -611,10 +645,12 @@ class Interval:
         """
         Return the closure of the interval.
         The closure of an interval is the smallest closed interval containing it.
-        Returns a new closed interval.
+        Returns a new closed interval, or this one if it is closed already.
         """
         if self.is_empty():
             return self
+        if not (self._open_start or self._open_end):
+            return self
         return Interval(self.start, self.end, open_start=False, open_end=False)
 
     def boundary(self) -> "IntervalSet":
@@ -647,12 +683,21 @@ class Interval:
 
     def __repr__(self) -> str:
         """String representation using mathematical notation."""
-        if self.is_empty():
-            return "∅"
+        # Intervals are immutable, so the text is rendered once and kept in
+        # the (initially unset) _repr slot.
+        try:
+            return self._repr
+        except AttributeError:
+            pass
 
-        left = "(" if self._open_start else "["
-        right = ")" if self._open_end else "]"
-        return f"{left}{self._start}, {self._end}{right}"
+        if self.is_empty():
+            text = "∅"
+        else:
+            left = "(" if self._open_start else "["
+            right = ")" if self._open_end else "]"
+            text = f"{left}{self._start}, {self._end}{right}"
+        self._repr = text
+        return text
 
     def __str__(self) -> str:
         """String representation."""
@@ -786,6 +831,8 @@ class Point(Interval):
     It inherits from Interval and can be used in all set operations.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Create a new point.
@@ -831,6 +878,16 @@ class IntervalSet:
             elements: List of Intervals, numeric values (points), or other Sets
         """
         self._intervals: List[Interval] = []
+        # Flat column of interval starts for binary searches, built lazily and
+        # tied to the list object it was built from (see _start_bounds()).
+        self._starts: List[float] = []
+        self._starts_of: Optional[List[Interval]] = None
+        # Cached measure(), tied to the list object like the starts column.
+        self._length: float = 0.0
+        self._length_of: Optional[List[Interval]] = None
+        # Bumped whenever an in-place operation replaces the intervals, so
+        # caches kept outside the set can tell it has changed.
+        self._version = 0
 
         if elements:
             for element in elements:
@@ -930,22 +987,22 @@ class IntervalSet:
             return
 
         # Sort by start point, then by end point
-        self._intervals.sort(key=lambda i: (i.start, i.end, i.open_start, i.open_end))
-
-        # Merge overlapping and adjacent intervals
-        merged = []
-        current = self._intervals[0]
+        self._intervals.sort(key=_sort_key)
+        self._intervals = _merge_sorted(self._intervals)
 
-        for next_interval in self._intervals[1:]:
-            if current.overlaps(next_interval) or current.is_adjacent(next_interval):
-                current = current.union(next_interval)  # type: ignore
-            else:
-                # No overlap/adjacency, save current and move to next
-                merged.append(current)
-                current = next_interval
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[Interval]) -> "IntervalSet":
+        """
+        Build a set from intervals already ordered by ``_sort_key``.
 
-        merged.append(current)
-        self._intervals = merged
+        Elements are filtered as in the constructor, but the sort in
+        ``_normalize`` is skipped and only the merge sweep runs.
+        """
+        result = cls()
+        for interval in intervals:
+            result._add_element(interval)
+        result._intervals = _merge_sorted(result._intervals)
+        return result
 
     def is_empty(self) -> bool:
         """Check if this set is empty."""
@@ -968,13 +1025,21 @@ class IntervalSet:
 
         Returns:
             True if the value is contained in this set
+
+        Complexity: O(log n) for a value or an interval, a binary search over
+        the sorted starts; O(m log n) for a set of m intervals.
         """
         if isinstance(value, (int, float)):
-            return any(interval.contains(value) for interval in self._intervals)
+            for interval in self._around(value):
+                if interval._contains_value(value):
+                    return True
+            return False
         elif isinstance(value, Interval):
             if value.is_empty():
                 return True
-            return any(interval.contains(value) for interval in self._intervals)
+            return any(
+                interval.contains(value) for interval in self._around(value._start)
+            )
         elif isinstance(value, IntervalSet):
             if value.is_empty():
                 return True
@@ -982,15 +1047,86 @@ class IntervalSet:
         else:
             return False
 
+    def contains_many(self, values: Iterable[float]) -> List[bool]:
+        """
+        Check many values at once.
+
+        Returns one bool per value, equivalent to ``[v in self for v in values]``.
+        The interval starts are collected once and every value is located by
+        binary search, O(m log n) for m values.
+        """
+        intervals = self._intervals
+        starts = self._start_bounds()
+        results = []
+        for v in values:
+            j = bisect.bisect_right(starts, v)
+            results.append(
+                any(
+                    interval._contains_value(v)
+                    for interval in intervals[max(j - 2, 0) : j]
+                )
+            )
+        return results
+
+    def _around(self, x: float) -> List[Interval]:
+        """
+        Return the only intervals that can contain ``x``.
+
+        The intervals are sorted and disjoint, so a binary search on the
+        starts finds the last one starting at or before ``x``; its
+        predecessor is kept for a start that is open exactly at ``x``.
+        """
+        j = bisect.bisect_right(self._start_bounds(), x)
+        return self._intervals[max(j - 2, 0) : j]
+
+    def _start_bounds(self) -> List[float]:
+        """
+        Return the sorted starts of the intervals as a flat list of floats.
+
+        Operations only ever replace ``_intervals`` with a new list once it is
+        normalized, so the column is rebuilt whenever the list object changes.
+        """
+        if self._starts_of is not self._intervals:
+            self._starts = [interval._start for interval in self._intervals]
+            self._starts_of = self._intervals
+        return self._starts
+
+    def _insert(self, interval: Interval) -> None:
+        """
+        Merge one non-empty interval of a normalized set into this set.
+
+        Only the intervals from the last one starting before ``interval`` to
+        the last one starting at or before its end can overlap or touch it.
+        That window is located by binary search on the starts and merged
+        with it. The list is replaced, not mutated, and the starts column is
+        spliced alongside.
+        """
+        intervals = self._intervals
+        starts = self._start_bounds()
+        lo = max(bisect.bisect_left(starts, interval._start) - 1, 0)
+        hi = bisect.bisect_right(starts, interval._end)
+        merged = _merge_sorted(heapq.merge(intervals[lo:hi], [interval], key=_sort_key))
+        self._intervals = intervals[:lo] + merged + intervals[hi:]
+        self._starts = starts[:lo] + [m._start for m in merged] + starts[hi:]
+        self._starts_of = self._intervals
+        self._version += 1
+
+    def _replace(self, result: Union[Interval, "IntervalSet"]) -> "IntervalSet":
+        """Take over the intervals of the result of an in-place operation."""
+        if isinstance(result, Interval):
+            self._intervals = [result]
+        else:
+            self._intervals = result._intervals
+        self._version += 1
+        return self
+
     def overlaps(self, other: "IntervalSet") -> bool:
         """Check if this set overlaps with another set."""
         if self.is_empty() or other.is_empty():
             return False
 
-        for our_interval in self._intervals:
-            for their_interval in other._intervals:
-                if our_interval.overlaps(their_interval):
-                    return True
+        for _ in _overlapping_pairs(self._intervals, other._intervals):
+            return True
         return False
 
     def intersection(self, other: "IntervalSet") -> Union[Interval, "IntervalSet"]:
@@ -1007,13 +1143,14 @@ class IntervalSet:
         if self.is_empty() or other.is_empty():
             return IntervalSet()
 
+        # Both sides are sorted and disjoint: a merge over the two lists
+        # visits each overlapping pair once, and the pieces come out sorted.
         result_intervals = []
-
-        for our_interval in self._intervals:
-            for their_interval in other._intervals:
-                intersection = our_interval.intersection(their_interval)
-                if isinstance(intersection, Interval):
-                    result_intervals.append(intersection)
+        for our_interval, their_interval in _overlapping_pairs(
+            self._intervals, other._intervals
+        ):
+            # overlaps() guarantees a non-empty Interval here
+            result_intervals.append(our_interval.intersection(their_interval))
 
         # Return appropriate type based on result
         filtered_intervals = [
@@ -1024,7 +1161,7 @@ class IntervalSet:
         elif len(filtered_intervals) == 1:
             return filtered_intervals[0]  # Single interval
         else:
-            return IntervalSet(filtered_intervals)  # Multiple intervals
+            return IntervalSet._from_sorted(filtered_intervals)  # Multiple intervals
 
     def union(self, other: "IntervalSet") -> Union[Interval, "IntervalSet"]:
         """
@@ -1050,9 +1187,10 @@ class IntervalSet:
             else:
                 return IntervalSet(self._intervals)
 
-        # Combine all intervals and let normalization handle merging
-        all_intervals = self._intervals + other._intervals
-        result = IntervalSet(all_intervals)
+        # Both operands are already sorted: merge the two runs and sweep once
+        result = IntervalSet._from_sorted(
+            heapq.merge(self._intervals, other._intervals, key=_sort_key)
+        )
 
         # Return appropriate type
         if len(result._intervals) == 1:
@@ -1079,18 +1217,42 @@ class IntervalSet:
             else:
                 return IntervalSet(self._intervals)
 
-        result_intervals = list(self._intervals)
+        result_intervals: List[Interval] = []
+        theirs = other._intervals
+        n_theirs = len(theirs)
+        j = 0
 
-        # Subtract each interval in other from our result
-        for their_interval in other._intervals:
-            new_result = []
-            for our_interval in result_intervals:
-                difference_result = our_interval.difference(their_interval)
-                if isinstance(difference_result, Interval):
-                    new_result.append(difference_result)
-                else:
-                    new_result.extend(difference_result._intervals)
-            result_intervals = new_result
+        # Both operands are sorted and disjoint, so a single sweep suffices:
+        # each of our intervals is only cut by the subtrahends it meets.
+        for our_interval in self._intervals:
+            # Skip subtrahends lying entirely to the left of this interval
+            while j < n_theirs and _entirely_before(theirs[j], our_interval):
+                j += 1
+
+            remainder: Optional[Interval] = our_interval
+            k = j
+            while remainder is not None and k < n_theirs:
+                their_interval = theirs[k]
+                if _entirely_before(remainder, their_interval):
+                    break
+                difference_result = remainder.difference(their_interval)
+                pieces = (
+                    [difference_result]
+                    if isinstance(difference_result, Interval)
+                    else difference_result._intervals
+                )
+                # Pieces left of the subtrahend are final; a piece to its
+                # right is still exposed to the next subtrahends.
+                remainder = None
+                for piece in pieces:
+                    if _entirely_before(piece, their_interval):
+                        result_intervals.append(piece)
+                    else:
+                        remainder = piece
+                k += 1
+
+            if remainder is not None:
+                result_intervals.append(remainder)
 
         # Return appropriate type based on result
         if len(result_intervals) == 0:
@@ -1148,39 +1310,26 @@ class IntervalSet:
     # In-place operators
     def __ior__(self, other: "IntervalSet") -> "IntervalSet":
         """In-place union |="""
-        result = self.union(other)
-        if isinstance(result, Interval):
-            self._intervals = [result]
-        else:
-            self._intervals = result._intervals
-        return self
+        if len(other._intervals) ** 2 <= len(self._intervals):
+            # A few intervals are spliced in by binary search instead of
+            # merging the whole set again; each splice copies the lists in
+            # C, so this pays off up to about sqrt(n) of them
+            for interval in other._intervals:
+                self._insert(interval)
+            return self
+        return self._replace(self.union(other))
 
     def __iand__(self, other: "IntervalSet") -> "IntervalSet":
         """In-place intersection &="""
-        result = self.intersection(other)
-        if isinstance(result, Interval):
-            self._intervals = [result]
-        else:
-            self._intervals = result._intervals
-        return self
+        return self._replace(self.intersection(other))
 
     def __isub__(self, other: "IntervalSet") -> "IntervalSet":
         """In-place difference -="""
-        result = self.difference(other)
-        if isinstance(result, Interval):
-            self._intervals = [result]
-        else:
-            self._intervals = result._intervals
-        return self
+        return self._replace(self.difference(other))
 
     def __ixor__(self, other: "IntervalSet") -> "IntervalSet":
         """In-place symmetric difference ^="""
-        result = self ^ other
-        if isinstance(result, Interval):
-            self._intervals = [result]
-        else:
-            self._intervals = result._intervals
-        return self
+        return self._replace(self ^ other)
 
     # Comparison operators
     def __eq__(self, other) -> bool:
@@ -1263,10 +1412,19 @@ class IntervalSet:
         """
         Get the total measure (length) of this set.
 
+        The component intervals are never empty, so the lengths are summed
+        straight from the stored bounds. The sum is cached until
+        ``_intervals`` is replaced.
+
         Returns:
             Sum of lengths of all intervals
         """
-        return sum(interval.length() for interval in self._intervals)
+        if self._length_of is not self._intervals:
+            self._length = sum(
+                interval._end - interval._start for interval in self._intervals
+            )
+            self._length_of = self._intervals
+        return self._length
 
     def volume(self) -> float:
         """
@@ -1286,13 +1444,15 @@ class IntervalSet:
         """Get the infimum (greatest lower bound) of this set."""
         if self.is_empty():
             return None
-        return min(interval.start for interval in self._intervals)
+        # Intervals are kept sorted and disjoint, so the first one starts lowest
+        return self._intervals[0].start
 
     def supremum(self) -> Optional[float]:
         """Get the supremum (least upper bound) of this set."""
         if self.is_empty():
             return None
-        return max(interval.end for interval in self._intervals)
+        # ...and the last one reaches furthest
+        return self._intervals[-1].end
 
     def essential_supremum(self) -> Optional[float]:
         """For compatibility with measure theory."""
@@ -1538,10 +1698,29 @@ class IntervalSet:
         """
         Compute the Hausdorff distance between two sets.
         d_H(A, B) = max( sup_{x in A} d(x, B), sup_{y in B} d(y, A) )
+
+        Results are kept in a small LRU cache for the most recent pairs of
+        sets, until either set is changed, so solver loops that re-query the
+        same pairs pay only once. The cache holds no strong references.
         """
         if self.is_empty() or other.is_empty():
             return float("inf")
 
+        # The distance is symmetric: one entry serves both argument orders
+        a, b = (self, other) if id(self) <= id(other) else (other, self)
+        key = (id(a), id(b))
+        entry = _HAUSDORFF_CACHE.get(key)
+        if entry is not None:
+            ref_a, ref_b, version_a, version_b, distance = entry
+            if (
+                ref_a() is a
+                and ref_b() is b
+                and version_a == a._version
+                and version_b == b._version
+            ):
+                _HAUSDORFF_CACHE.move_to_end(key)
+                return distance
+
         def directed_hausdorff(source: "IntervalSet", target: "IntervalSet") -> float:
             max_dist = 0.0
             for interval in source._intervals:
@@ -1575,7 +1754,18 @@ class IntervalSet:
                         max_dist = max(max_dist, target.distance_to_point(midpoint))
             return max_dist
 
-        return max(directed_hausdorff(self, other), directed_hausdorff(other, self))
+        distance = max(directed_hausdorff(self, other), directed_hausdorff(other, self))
+        _HAUSDORFF_CACHE[key] = (
+            weakref.ref(a),
+            weakref.ref(b),
+            a._version,
+            b._version,
+            distance,
+        )
+        _HAUSDORFF_CACHE.move_to_end(key)
+        if len(_HAUSDORFF_CACHE) > _HAUSDORFF_CACHE_SIZE:
+            _HAUSDORFF_CACHE.popitem(last=False)
+        return distance
 
     def distance_to_point(self, point: float) -> float:
         """Calculate minimum distance from a point to this set."""
@@ -1600,6 +1790,68 @@ class IntervalSet:
         return min_dist
 
 
+# Recent Hausdorff distances by the ids of the two sets (smaller id first):
+# weak references to both, their versions when computed, and the distance.
+_HAUSDORFF_CACHE_SIZE = 64
+_HAUSDORFF_CACHE: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+
+
+def _sort_key(interval: Interval) -> tuple:
+    """Canonical ordering of intervals: by start point, then by end point."""
+    return (interval.start, interval.end, interval.open_start, interval.open_end)
+
+
+def _entirely_before(a: Interval, b: Interval) -> bool:
+    """Check that ``a`` lies completely to the left of ``b`` (no shared point)."""
+    return a._end < b._start or (a._end == b._start and (a._open_end or b._open_start))
+
+
+def _ends_before(a: Interval, b: Interval) -> bool:
+    """Check that ``a`` stops strictly before ``b`` does (an open end first)."""
+    return a._end < b._end or (a._end == b._end and a._open_end and not b._open_end)
+
+
+def _overlapping_pairs(left: List[Interval], right: List[Interval]) -> Iterator[tuple]:
+    """
+    Yield every overlapping ``(a, b)`` pair of two sorted, disjoint lists.
+
+    A two-pointer merge: whichever interval stops first cannot meet anything
+    further along the other list, so it is dropped. O(n + m).
+    """
+    i = j = 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        if a.overlaps(b):
+            yield a, b
+        if _ends_before(a, b):
+            i += 1
+        elif _ends_before(b, a):
+            j += 1
+        else:
+            i += 1
+            j += 1
+
+
+def _merge_sorted(intervals: Iterable[Interval]) -> List[Interval]:
+    """Greedily merge overlapping/adjacent intervals given in sorted order."""
+    merged: List[Interval] = []
+    current: Optional[Interval] = None
+
+    for next_interval in intervals:
+        if current is None:
+            current = next_interval
+        elif current.overlaps(next_interval) or current.is_adjacent(next_interval):
+            current = current.union(next_interval)  # type: ignore
+        else:
+            # No overlap/adjacency, save current and move to next
+            merged.append(current)
+            current = next_interval
+
+    if current is not None:
+        merged.append(current)
+    return merged
+
+
 # Helper functions to avoid circular imports
 def _create_empty_set():
     """Create an empty IntervalSet."""
@@ -2,9 +2,23 @@
 Multi-dimensional interval arithmetic (Boxes and Regions).
 """
 
-from typing import Sequence, List, Union, Tuple, Optional, Iterable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Sequence,
+    List,
+    Union,
+    Tuple,
+    Optional,
+    Iterable,
+    Iterator,
+)
+import bisect
+import functools
 import math
-from .intervals import Interval, IntervalSet
+from operator import add, itemgetter, lt, sub
+from .intervals import Interval, IntervalSet, Point
 from .spatial import RTree
 
 
@@ -22,6 +36,17 @@ class Box:
     - Point (N degenerate intervals)
     """
 
+    __slots__ = (
+        "_intervals",
+        "_dimension",
+        "_lo",
+        "_hi",
+        "_closed",
+        "_empty",
+        "_volume",
+        "_hash",
+    )
+
     def __init__(self, intervals: Sequence[Interval]):
         """
         Create a new Box intersection of intervals.
@@ -34,11 +59,58 @@ class Box:
         if not intervals:
             raise ValueError("Box must have at least 1 dimension")
 
-        if not all(isinstance(i, Interval) for i in intervals):
-            raise TypeError("All elements must be Interval objects")
-
         self._intervals = tuple(intervals)
         self._dimension: int = len(intervals)
+        # Struct-of-arrays view of the bounds: one flat tuple of lower bounds
+        # and one of upper bounds. Hot predicates compare these floats directly
+        # instead of dereferencing an Interval per dimension.
+        # Closedness of every bound packed into one int: bit 2*d is set when
+        # the lower bound of dimension d is closed, bit 2*d + 1 for the upper.
+        # Boxes are immutable, so emptiness is decided once here. All of it
+        # comes from a single pass over the interval slots.
+        lo, hi = [], []
+        closed, bit, empty = 0, 1, False
+        for interval in self._intervals:
+            if not isinstance(interval, Interval):
+                raise TypeError("All elements must be Interval objects")
+            start, end = interval._start, interval._end
+            lo.append(start)
+            hi.append(end)
+            if not interval._open_start:
+                closed |= bit
+            if not interval._open_end:
+                closed |= bit << 1
+            if start == end and interval.is_empty():
+                empty = True
+            bit <<= 2
+        self._lo: Tuple[float, ...] = tuple(lo)
+        self._hi: Tuple[float, ...] = tuple(hi)
+        self._closed: int = closed
+        self._empty: bool = empty
+
+    @classmethod
+    def _from_columns(
+        cls,
+        intervals: List[Interval],
+        lo: Tuple[float, ...],
+        hi: Tuple[float, ...],
+        closed: int,
+    ) -> "Box":
+        """
+        Build a non-empty box whose bound columns are already known.
+
+        Skips the validation and column extraction in __init__. Callers
+        guarantee that ``lo``, ``hi`` and ``closed`` describe ``intervals``
+        and that none of them is empty.
+        """
+        box = cls.__new__(cls)
+        box._intervals = tuple(intervals)
+        box._dimension = len(box._intervals)
+        box._lo = lo
+        box._hi = hi
+        box._closed = closed
+        box._empty = False
+        return box
 
     @property
     def dimension(self) -> int:
@@ -60,33 +132,47 @@ class Box:
         Check if the box is empty.
         A box is empty if ANY of its component intervals are empty.
         """
-        return any(i.is_empty() for i in self._intervals)
+        return self._empty
 
     def volume(self) -> float:
         """
         Compute the N-dimensional volume (measure).
         """
-        if self.is_empty():
-            return 0.0
-
-        vol = 1.0
-        for i in self._intervals:
-            vol *= i.length()
-        return vol
+        # Computed on first use and kept in the (initially unset) _volume
+        # slot, so fragments that are discarded never pay for it.
+        try:
+            return self._volume
+        except AttributeError:
+            pass
+        if self._empty:
+            self._volume = 0.0
+        else:
+            self._volume = math.prod(map(sub, self._hi, self._lo))
+        return self._volume
 
     def is_bounded(self) -> bool:
         """Check if the box is bounded (all component intervals bounded)."""
-        if self.is_empty():
+        if self._empty:
             return True
-        return all(i.is_bounded() for i in self._intervals)
+        return -math.inf < min(self._lo) and max(self._hi) < math.inf
 
     def is_open(self) -> bool:
         """Check if the box is open."""
-        return not self.is_empty() and self == self.interior()
+        # Equal to its interior: no closed bound (infinite ones are stored
+        # open) and no degenerate axis, whose interior would be empty
+        return not self._empty and not self._closed and all(map(lt, self._lo, self._hi))
 
     def is_closed(self) -> bool:
         """Check if the box is closed."""
-        return not self.is_empty() and self == self.closure()
+        if self._empty:
+            return False
+        # Equal to its closure: every finite bound is closed
+        closed = self._closed
+        for lo, hi in zip(self._lo, self._hi):
+            if not closed & 1 and lo != -math.inf or not closed & 2 and hi != math.inf:
+                return False
+            closed >>= 2
+        return True
 
     def is_compact(self) -> bool:
         """Check if the box is compact (closed and bounded)."""
@@ -97,19 +183,20 @@ class Box:
         Check if an N-dimensional point or Box/BoxSet is contained in this box.
         """
         if isinstance(item, Box):
-            if item.is_empty():
+            if item._empty:
                 return True
-            if item.dimension != self.dimension:
+            if item._dimension != self._dimension or self._empty:
                 return False
-            for i1, i2 in zip(self._intervals, item._intervals):
-                if not i1.contains(i2):
-                    return False
-            return True
+            return _inside_kernel(self._dimension)(
+                self._lo, self._hi, item._lo, item._hi, item._closed & ~self._closed
+            )
 
         if isinstance(item, BoxSet):
             if item.is_empty():
                 return True
-            return all(self.contains(b) for b in item.boxes)
+            # The hull is the smallest box around the set, so it fits in this
+            # (convex) box exactly when every component does
+            return self.contains(item.convex_hull())
 
         # Point check
         point = item
@@ -118,14 +205,12 @@ class Box:
                 f"Point dimension {len(point)} must match Box dimension {self._dimension}"
             )
 
-        if self.is_empty():
+        if self._empty:
             return False
 
-        # Point is in box iff x_i in I_i for all i
-        for val, interval in zip(point, self._intervals):
-            if not interval.contains(val):
-                return False
-        return True
+        # Point is in box iff x_i in I_i for all i; a point on a bound is
+        # resolved from the packed closedness bits.
+        return _point_kernel(self._dimension)(self._lo, self._hi, self._closed, point)
 
     def __contains__(self, item: Union[Sequence[float], "Box", "BoxSet"]) -> bool:
         return self.contains(item)
@@ -144,10 +229,17 @@ class Box:
                 f"Cannot compare Box(dim={self._dimension}) with Box(dim={other._dimension})"
             )
 
-        if self.is_empty() or other.is_empty():
+        if self._empty or other._empty:
             return False
 
-        return all(i1.overlaps(i2) for i1, i2 in zip(self._intervals, other.intervals))
+        # Bit 2*d + 1 of a_up is set when our upper and their lower bound are
+        # both closed in dimension d (b_up likewise the other way round), so
+        # touching bounds are settled without consulting the Intervals.
+        a_up = self._closed & (other._closed << 1)
+        b_up = other._closed & (self._closed << 1)
+        return _overlap_kernel(self._dimension)(
+            self._lo, self._hi, other._lo, other._hi, a_up, b_up
+        )
 
     def intersection(self, other: "Box") -> "Box":
         """
@@ -159,32 +251,15 @@ class Box:
                 f"Dimension mismatch: {self._dimension} vs {other._dimension}"
             )
 
-        # B_new = (I1 & J1) x (I2 & J2) ...
-        # If any resulting interval I_k & J_k is convex (Interval), we assume Interval intersection returns Interval or simple BoxSet.
-        # But Interval.intersection returns Interval or Point or empty...
-        # Wait, Interval.intersection currently returns Interval or BoxSet (if empty).
-        # We need component intersections to be Intervals.
-        # Fortunately, the intersection of two Intervals is ALWAYS a single Interval (possibly empty).
-        # It is Union that creates multiple intervals.
-
-        new_intervals = []
-        for i1, i2 in zip(self._intervals, other.intervals):
-            inter = i1.intersection(i2)
-            # inter creates a Point if single point, or Interval or empty BoxSet?
-            # Interval.intersection returns empty BoxSet if empty...
-            # We need to normalize this back to Interval to store in Box.
-
-            # If inter is a BoxSet (likely empty set from intersection), we check is_empty
-            if hasattr(inter, "is_empty") and inter.is_empty():
-                new_intervals.append(Interval.empty())
-            else:
-                # It must be an Interval or Point (subclass of Interval)
-                if isinstance(inter, Interval):
-                    new_intervals.append(inter)
-                else:
-                    new_intervals.append(Interval.empty())
+        if self._empty or other._empty:
+            return _empty_box(self._dimension)
 
-        return Box(new_intervals)
+        # B_new = (I1 & J1) x (I2 & J2) ..., computed on the bound columns by
+        # the unrolled kernel; Intervals are built only for a non-empty result.
+        inter = _intersection_kernel(self._dimension)(self, other)
+        if inter is None:
+            return _empty_box(self._dimension)
+        return inter
 
     def interior(self) -> "Box":
         """
@@ -200,9 +275,10 @@ class Box:
         Return the closure of the box.
         The closure is the Cartesian product of the closure of its intervals.
         """
-        if self.is_empty():
+        if self._empty:
             return self
-        return Box([interval.closure() for interval in self._intervals])
+        # Same bound columns, closed wherever the bound is finite
+        return _bounding_box(self._lo, self._hi)
 
     def boundary(self) -> "BoxSet":
         """
@@ -221,24 +297,18 @@ class Box:
         """Return the maximum distance between any two points in the box."""
         if self.is_empty():
             return 0.0
-        return math.sqrt(sum(i.length() ** 2 for i in self._intervals))
+        # Distance between the two extreme corners of the bound columns
+        return math.dist(self._lo, self._hi)
 
     def distance_to_point(self, point: Sequence[float]) -> float:
         """Return the minimum Euclidean distance from a point to this box."""
-        if self.is_empty():
+        if self._empty:
             return float("inf")
-        if len(point) != self.dimension:
-            raise ValueError(f"Dimension mismatch: {len(point)} vs {self.dimension}")
-
-        d2 = 0.0
-        for i in range(self.dimension):
-            iv = self._intervals[i]
-            p = point[i]
-            if p < iv.start:
-                d2 += (iv.start - p) ** 2
-            elif p > iv.end:
-                d2 += (p - iv.end) ** 2
-        return math.sqrt(d2)
+        if len(point) != self._dimension:
+            raise ValueError(f"Dimension mismatch: {len(point)} vs {self._dimension}")
+
+        # The point is a degenerate box, so the box gap kernel applies
+        return math.sqrt(_gap_kernel(self._dimension)(self._lo, self._hi, point, point))
 
     def minkowski_sum(self, other: Union["Box", Sequence[float], float]) -> "Box":
         """
@@ -248,63 +318,93 @@ class Box:
         if self.is_empty():
             return self
 
+        # Sum the bound columns: a translation keeps the closed flags, a box
+        # sum is closed only where both summands are (x + y hits the bound)
+        terms: Sequence[Union[Interval, float]]
         if isinstance(other, (int, float)):
-            return Box([interval.minkowski_sum(other) for interval in self._intervals])
-
-        if isinstance(other, (list, tuple)):
+            terms = [other] * self._dimension
+            lo = [x + other for x in self._lo]
+            hi = [x + other for x in self._hi]
+            closed = self._closed
+        elif isinstance(other, (list, tuple)):
             if len(other) != self.dimension:
                 raise ValueError(
                     f"Vector dimension {len(other)} must match Box dimension {self.dimension}"
                 )
-            return Box(
-                [
-                    self._intervals[i].minkowski_sum(other[i])
-                    for i in range(self.dimension)
-                ]
-            )
+            if not all(isinstance(x, (int, float)) for x in other):
+                # Per-axis summands such as Intervals take the Interval sum
+                return Box([a.minkowski_sum(b) for a, b in zip(self._intervals, other)])
+            terms = other
+            lo = list(map(add, self._lo, other))
+            hi = list(map(add, self._hi, other))
+            closed = self._closed
+        else:
+            if not isinstance(other, Box):
+                raise TypeError(f"Minkowski sum requires Box, got {type(other)}")
 
-        if not isinstance(other, Box):
-            raise TypeError(f"Minkowski sum requires Box, got {type(other)}")
+            if other.is_empty():
+                return other
 
-        if other.is_empty():
-            return other
+            if other.dimension != self.dimension:
+                raise ValueError(
+                    f"Box dimension {other.dimension} must match {self.dimension}"
+                )
+            return self._plus(other)
 
-        if other.dimension != self.dimension:
-            raise ValueError(
-                f"Box dimension {other.dimension} must match {self.dimension}"
-            )
+        return self._from_sums(lo, hi, closed, terms)
 
-        return Box(
-            [
-                self._intervals[i].minkowski_sum(other._intervals[i])
-                for i in range(self.dimension)
-            ]
+    def _plus(self, other: "Box") -> "Box":
+        """
+        Minkowski sum with a non-empty box of the same dimension, unchecked.
+
+        Used by BoxSet.minkowski_sum, which validates its operands once
+        instead of once per pair.
+        """
+        return self._from_sums(
+            list(map(add, self._lo, other._lo)),
+            list(map(add, self._hi, other._hi)),
+            self._closed & other._closed,
+            other._intervals,
         )
 
+    def _from_sums(
+        self,
+        lo: List[float],
+        hi: List[float],
+        closed: int,
+        terms: Sequence[Union[Interval, float]],
+    ) -> "Box":
+        """
+        Build the Minkowski sum of this box with ``terms`` (one summand per
+        axis) from its already summed bound columns and closedness bits.
+        """
+        # Infinite (or overflowing) and degenerate results go through
+        # Interval, which normalizes their open ends and emptiness
+        if not (-math.inf < min(lo) and max(hi) < math.inf and all(map(lt, lo, hi))):
+            return Box([a.minkowski_sum(b) for a, b in zip(self._intervals, terms)])
+
+        intervals = [
+            Interval._from_bounds(
+                start, end, not closed >> 2 * d & 1, not closed >> 2 * d & 2
+            )
+            for d, (start, end) in enumerate(zip(lo, hi))
+        ]
+        return Box._from_columns(intervals, tuple(lo), tuple(hi), closed)
+
     def distance(self, other: "Box") -> float:
         """Compute the minimum Euclidean distance between two boxes."""
-        if self.is_empty() or other.is_empty():
+        if self._empty or other._empty:
             return float("inf")
-        if self.dimension != other.dimension:
+        if self._dimension != other._dimension:
             raise ValueError(
-                f"Dimension mismatch: {self.dimension} vs {other.dimension}"
+                f"Dimension mismatch: {self._dimension} vs {other._dimension}"
             )
 
-        d2 = 0.0
-        for i in range(self.dimension):
-            iv = self._intervals[i]
-            jv = other.intervals[i]
-
-            # 1D distance between intervals
-            if iv.overlaps(jv) or iv.is_adjacent(jv):
-                dist_i = 0.0
-            elif iv.end < jv.start:
-                dist_i = jv.start - iv.end
-            else:  # jv.end < iv.start
-                dist_i = iv.start - jv.end
-
-            d2 += dist_i**2
-        return math.sqrt(d2)
+        # Per-axis gap between the bounds; it is zero wherever the intervals
+        # overlap or touch, whatever the openness of the touching ends.
+        return math.sqrt(
+            _gap_kernel(self._dimension)(self._lo, self._hi, other._lo, other._hi)
+        )
 
     def minkowski_difference(self, other: "Box") -> "Box":
         """
@@ -325,14 +425,42 @@ class Box:
                 f"Box dimension {other.dimension} must match {self.dimension}"
             )
 
-        results = []
-        for i in range(self.dimension):
-            diff = self._intervals[i].minkowski_difference(other._intervals[i])
-            if diff.is_empty():
-                return Box([Interval.empty()] * self.dimension)
-            results.append(diff)
+        result = self._minus(other)
+        if result is None:
+            return Box([Interval.empty()] * self.dimension)
+        return result
 
-        return Box(results)
+    def _minus(self, other: "Box") -> Optional["Box"]:
+        """
+        Minkowski difference with a non-empty box of the same dimension,
+        unchecked. Returns None instead of an empty box.
+
+        Used by the BoxSet erosions, which validate the structuring box once
+        instead of once per component.
+        """
+        lo = tuple(map(sub, self._lo, other._lo))
+        hi = tuple(map(sub, self._hi, other._hi))
+        # x + B stays inside A at a bound A closes or B leaves open
+        closed = (self._closed | ~other._closed) & ((1 << 2 * self._dimension) - 1)
+
+        # Infinite (or overflowing) and degenerate results go through
+        # Interval, which normalizes their open ends and emptiness
+        if not (-math.inf < min(lo) and max(hi) < math.inf and all(map(lt, lo, hi))):
+            results = []
+            for a, b in zip(self._intervals, other._intervals):
+                diff = a.minkowski_difference(b)
+                if diff.is_empty():
+                    return None
+                results.append(diff)
+            return Box(results)
+
+        intervals = [
+            Interval._from_bounds(
+                start, end, not closed >> 2 * d & 1, not closed >> 2 * d & 2
+            )
+            for d, (start, end) in enumerate(zip(lo, hi))
+        ]
+        return Box._from_columns(intervals, lo, hi, closed)
 
     def dilate(self, other: Union["Box", Sequence[float], float]) -> "Box":
         """Alias for minkowski_sum"""
@@ -358,6 +486,14 @@ class Box:
             return False
         return self._intervals == other._intervals
 
+    def __hash__(self) -> int:
+        """Hash function for use in sets and dicts."""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._intervals)
+            return self._hash
+
     def __len__(self) -> int:
         """Return the dimension of the box."""
         return self._dimension
@@ -382,69 +518,611 @@ class Box:
                 f"Dimension mismatch: {self._dimension} vs {other._dimension}"
             )
 
-        # if not self.overlaps(other): # Optimization
-        #     return [self]
-
         inter = self.intersection(other)
         if inter.is_empty():
             return [self]
 
-        result_boxes = []
+        return _slice_off(self, inter)
+
+
+def _compile_kernel(source: str, namespace: Dict[str, Any]) -> Any:
+    """
+    Execute the generated source of a per-dimension kernel and return the
+    ``kernel`` function it defines.
+
+    The source is assembled only from fixed templates and the integer axis
+    indices and bit masks of ``range(dimension)`` (which rejects anything
+    but an int), never from caller data, so running it is safe.
+    """
+    exec(source, namespace)  # nosec B102 - trusted, generated from an int only
+    return namespace["kernel"]
+
+
+_SeparatedKernel = Callable[
+    [Tuple[float, ...], Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]], bool
+]
+_SEPARATED_KERNELS: Dict[int, _SeparatedKernel] = {}
+
+
+def _separated_kernel(dimension: int) -> _SeparatedKernel:
+    """
+    Return ``k(a_lo, a_hi, b_lo, b_hi)``, true when two boxes of this
+    dimension are separated along some axis.
+
+    The kernel is generated once per dimension as a single unrolled boolean
+    expression, so the hot rejection test runs without a per-axis loop.
+    """
+    kernel = _SEPARATED_KERNELS.get(dimension)
+    if kernel is None:
+        terms = " or ".join(
+            f"a_hi[{d}] < b_lo[{d}] or b_hi[{d}] < a_lo[{d}]" for d in range(dimension)
+        )
+        kernel = _SEPARATED_KERNELS[dimension] = _compile_kernel(
+            f"def kernel(a_lo, a_hi, b_lo, b_hi):\n    return {terms}\n", {}
+        )
+    return kernel
+
+
+_OverlapKernel = Callable[
+    [
+        Tuple[float, ...],
+        Tuple[float, ...],
+        Tuple[float, ...],
+        Tuple[float, ...],
+        int,
+        int,
+    ],
+    bool,
+]
+_OVERLAP_KERNELS: Dict[int, _OverlapKernel] = {}
+
+
+def _overlap_kernel(dimension: int) -> _OverlapKernel:
+    """
+    Return ``k(a_lo, a_hi, b_lo, b_hi, a_up, b_up)``, true when two non-empty
+    boxes of this dimension overlap.
+
+    Like _separated_kernel, the per-axis tests are unrolled into one boolean
+    expression. Bounds that only touch overlap when bit ``2*d + 1`` of the
+    matching closedness word (see Box.overlaps) is set.
+    """
+    kernel = _OVERLAP_KERNELS.get(dimension)
+    if kernel is None:
+        terms = " and ".join(
+            f"(a_hi[{d}] > b_lo[{d}] or a_hi[{d}] == b_lo[{d}] and a_up & {2 << 2 * d})"
+            f" and (b_hi[{d}] > a_lo[{d}] or b_hi[{d}] == a_lo[{d}] and b_up & {2 << 2 * d})"
+            for d in range(dimension)
+        )
+        kernel = _OVERLAP_KERNELS[dimension] = _compile_kernel(
+            f"def kernel(a_lo, a_hi, b_lo, b_hi, a_up, b_up):\n"
+            f"    return bool({terms})\n",
+            {},
+        )
+    return kernel
+
+
+_PointKernel = Callable[
+    [Tuple[float, ...], Tuple[float, ...], int, Sequence[float]], bool
+]
+_POINT_KERNELS: Dict[int, _PointKernel] = {}
+
+
+def _point_kernel(dimension: int) -> _PointKernel:
+    """
+    Return ``k(lo, hi, closed, point)``, true when ``point`` lies in the
+    non-empty box with these bound columns and closedness bits.
+
+    Unrolled per dimension like _separated_kernel; a coordinate on a bound
+    is inside when the matching bit of ``closed`` is set.
+    """
+    kernel = _POINT_KERNELS.get(dimension)
+    if kernel is None:
+        terms = " and ".join(
+            f"(lo[{d}] < p[{d}] < hi[{d}] or p[{d}] == lo[{d}] and closed & {1 << 2 * d}"
+            f" or p[{d}] == hi[{d}] and closed & {2 << 2 * d})"
+            for d in range(dimension)
+        )
+        kernel = _POINT_KERNELS[dimension] = _compile_kernel(
+            f"def kernel(lo, hi, closed, p):\n    return bool({terms})\n", {}
+        )
+    return kernel
 
-        # We start with the full 'self' box and whittle it down
-        # We define 'remainder' as the part of A that matches O in the dimensions processed so far
-        current_intervals = list(self._intervals)
-
-        overlap_intervals = inter.intervals
-
-        for d in range(self._dimension):
-            # Current dimension interval for the remainder of A
-            r_int = current_intervals[d]
-            # Overlap interval in this dimension
-            o_int = overlap_intervals[d]
-
-            # 1. Slice Left (Before Overlap)
-            # Boundary: [r_start, o_start).
-            left_open_end = not o_int.open_start
-
-            # Create left interval.
-            # Safety: r_int.start <= o_int.start (subset).
-            # Code is unreachable if InvalidIntervalError is raised, but we expect validity.
-            # We explicitly check for emptiness instead of rely on exception flow.
-            # Using Interval constructor directly as it is robust.
-
-            left_int = Interval(
-                r_int.start,
-                o_int.start,
-                open_start=r_int.open_start,
-                open_end=left_open_end,
-            )
 
-            if not left_int.is_empty():
-                new_slice = list(current_intervals)
-                new_slice[d] = left_int
-                result_boxes.append(Box(new_slice))
+_InsideKernel = Callable[
+    [
+        Tuple[float, ...],
+        Tuple[float, ...],
+        Tuple[float, ...],
+        Tuple[float, ...],
+        int,
+    ],
+    bool,
+]
+_INSIDE_KERNELS: Dict[int, _InsideKernel] = {}
 
-            # 2. Slice Right (After Overlap)
-            # Starts at o_int.end.
-            right_open_start = not o_int.open_end
 
-            right_int = Interval(
-                o_int.end,
-                r_int.end,
-                open_start=right_open_start,
-                open_end=r_int.open_end,
+def _inside_kernel(dimension: int) -> _InsideKernel:
+    """
+    Return ``k(a_lo, a_hi, b_lo, b_hi, bad)``, true when the non-empty box B
+    lies inside the box A of this dimension.
+
+    ``bad`` holds the bounds closed in B but open in A (``b & ~a`` on the
+    closedness words); B may only share such a bound with A if it is not
+    set. The per-axis tests are unrolled like _separated_kernel.
+    """
+    kernel = _INSIDE_KERNELS.get(dimension)
+    if kernel is None:
+        terms = " and ".join(
+            f"(a_lo[{d}] < b_lo[{d}] or a_lo[{d}] == b_lo[{d}] and not bad & {1 << 2 * d})"
+            f" and (b_hi[{d}] < a_hi[{d}] or b_hi[{d}] == a_hi[{d}] and not bad & {2 << 2 * d})"
+            for d in range(dimension)
+        )
+        kernel = _INSIDE_KERNELS[dimension] = _compile_kernel(
+            f"def kernel(a_lo, a_hi, b_lo, b_hi, bad):\n    return bool({terms})\n",
+            {},
+        )
+    return kernel
+
+
+_GapKernel = Callable[
+    [Sequence[float], Sequence[float], Sequence[float], Sequence[float]], float
+]
+_GAP_KERNELS: Dict[int, _GapKernel] = {}
+
+
+def _gap_kernel(dimension: int) -> _GapKernel:
+    """
+    Return ``k(a_lo, a_hi, b_lo, b_hi)``, the squared Euclidean distance
+    between two non-empty boxes of this dimension.
+
+    Each axis adds the square of the gap between the bounds, which is zero
+    wherever the boxes overlap or touch. A point is the degenerate box with
+    equal bounds. The per-axis branches are unrolled like _separated_kernel.
+    """
+    kernel = _GAP_KERNELS.get(dimension)
+    if kernel is None:
+        axes = "".join(
+            f"    g = b_lo[{d}] - a_hi[{d}]\n"
+            "    if g > 0.0:\n"
+            "        s += g * g\n"
+            "    else:\n"
+            f"        g = a_lo[{d}] - b_hi[{d}]\n"
+            "        if g > 0.0:\n"
+            "            s += g * g\n"
+            for d in range(dimension)
+        )
+        kernel = _GAP_KERNELS[dimension] = _compile_kernel(
+            f"def kernel(a_lo, a_hi, b_lo, b_hi):\n    s = 0.0\n{axes}    return s\n",
+            {},
+        )
+    return kernel
+
+
+_IntersectionKernel = Callable[[Box, Box], Optional[Box]]
+_INTERSECTION_KERNELS: Dict[int, _IntersectionKernel] = {}
+
+
+def _intersection_kernel(dimension: int) -> _IntersectionKernel:
+    """
+    Return ``k(a, b)``, the intersection of two non-empty boxes of this
+    dimension, or None when it is empty.
+
+    Per axis the tighter bound wins, closed only when every bound at that
+    value is closed; the axes are unrolled like _separated_kernel and the
+    first empty one ends the call before any Interval is built.
+    """
+    kernel = _INTERSECTION_KERNELS.get(dimension)
+    if kernel is None:
+        lines = [
+            "def kernel(a, b):",
+            "    a_lo, a_hi, am = a._lo, a._hi, a._closed",
+            "    b_lo, b_hi, bm = b._lo, b._hi, b._closed",
+            "    c = 0",
+        ]
+        for d in range(dimension):
+            lo_bit, hi_bit = 1 << 2 * d, 2 << 2 * d
+            both = lo_bit | hi_bit
+            lines += [
+                f"    x, y = a_lo[{d}], b_lo[{d}]",
+                f"    if x > y:\n        s{d} = x\n        c |= am & {lo_bit}",
+                f"    elif x < y:\n        s{d} = y\n        c |= bm & {lo_bit}",
+                f"    else:\n        s{d} = x\n        c |= am & bm & {lo_bit}",
+                f"    x, y = a_hi[{d}], b_hi[{d}]",
+                f"    if x < y:\n        e{d} = x\n        c |= am & {hi_bit}",
+                f"    elif x > y:\n        e{d} = y\n        c |= bm & {hi_bit}",
+                f"    else:\n        e{d} = x\n        c |= am & bm & {hi_bit}",
+                f"    if s{d} > e{d} or s{d} == e{d} and c & {both} != {both}:",
+                "        return None",
+            ]
+        intervals = ", ".join(
+            f"Point(s{d}) if s{d} == e{d} else"
+            f" from_bounds(s{d}, e{d}, not c & {1 << 2 * d}, not c & {2 << 2 * d})"
+            for d in range(dimension)
+        )
+        lo = "".join(f"s{d}, " for d in range(dimension))
+        hi = "".join(f"e{d}, " for d in range(dimension))
+        lines.append(f"    return from_columns([{intervals}], ({lo}), ({hi}), c)")
+        namespace = {
+            "Point": Point,
+            "from_bounds": Interval._from_bounds,
+            "from_columns": Box._from_columns,
+        }
+        kernel = _INTERSECTION_KERNELS[dimension] = _compile_kernel(
+            "\n".join(lines) + "\n", namespace
+        )
+    return kernel
+
+
+def _closed_mask(intervals: Sequence[Interval]) -> int:
+    """Pack the closed/open flags of ``intervals`` into bits, two per dimension."""
+    mask = 0
+    for d, interval in enumerate(intervals):
+        if not interval._open_start:
+            mask |= 1 << (2 * d)
+        if not interval._open_end:
+            mask |= 2 << (2 * d)
+    return mask
+
+
+def _bounding_box(lo: Tuple[float, ...], hi: Tuple[float, ...]) -> Box:
+    """
+    Build the closed box spanning ``lo`` to ``hi`` (an index MBR).
+
+    Equivalent to ``Box([Interval(l, h) for l, h in zip(lo, hi)])`` for bounds
+    taken from non-empty boxes, without re-validating every component.
+    """
+    intervals = [
+        Interval._from_bounds(l, h, math.isinf(l), math.isinf(h))
+        for l, h in zip(lo, hi)
+    ]
+    return Box._from_columns(intervals, lo, hi, _closed_mask(intervals))
+
+
+@functools.lru_cache(maxsize=None)
+def _empty_box(dimension: int) -> Box:
+    """The empty box of this dimension, shared by the results that are empty."""
+    return Box.empty(dimension)
+
+
+@functools.lru_cache(maxsize=128)
+def _epsilon_box(epsilon: float, dimension: int) -> Box:
+    """The centred cube [-epsilon, epsilon]^dimension, shared across calls."""
+    return Box([Interval.closed(-epsilon, epsilon)] * dimension)
+
+
+def _hilbert_key(coords: List[int], bits: int) -> int:
+    """
+    Position of the grid cell ``coords`` (each in ``[0, 2**bits)``) along the
+    Hilbert curve of the same dimension (Skilling's transpose algorithm).
+    """
+    x = list(coords)
+    n = len(x)
+    # Inverse undo of the excess work, from the top bit down
+    q = 1 << (bits - 1)
+    while q > 1:
+        p = q - 1
+        for i in range(n):
+            if x[i] & q:
+                x[0] ^= p
+            else:
+                t = (x[0] ^ x[i]) & p
+                x[0] ^= t
+                x[i] ^= t
+        q >>= 1
+    # Gray encode
+    for i in range(1, n):
+        x[i] ^= x[i - 1]
+    t = 0
+    q = 1 << (bits - 1)
+    while q > 1:
+        if x[n - 1] & q:
+            t ^= q - 1
+        q >>= 1
+    # Interleave the transposed bits into a single index
+    key = 0
+    for b in range(bits - 1, -1, -1):
+        for i in range(n):
+            key = (key << 1) | (((x[i] ^ t) >> b) & 1)
+    return key
+
+
+def _hilbert_order(boxes: List[Box], bits: Optional[int] = None) -> List[Box]:
+    """
+    Return ``boxes`` sorted along a Hilbert curve through their centres.
+
+    Neighbouring boxes end up next to each other, which groups them into
+    tight nodes when they are inserted into the R-tree in this order.
+    Infinite bounds are clamped to the finite extent of the boxes, and
+    centres and extents are taken of halved bounds so that coordinates near
+    the float limits do not overflow. By default the curve has a few cells
+    per box (at most 2**10 per axis), so small sets are not ranked on a
+    needlessly fine grid.
+    """
+    dimension = boxes[0]._dimension
+    if bits is None:
+        bits = min(10, (len(boxes).bit_length() + dimension - 1) // dimension + 1)
+    top = (1 << bits) - 1
+    spans = []
+    for d in range(dimension):
+        finite = [v for b in boxes for v in (b._lo[d], b._hi[d]) if not math.isinf(v)]
+        low, high = (min(finite), max(finite)) if finite else (0.0, 0.0)
+        half = high / 2 - low / 2
+        spans.append((low, high, top / half if half > 0 else 0.0))
+
+    def key(box: Box) -> int:
+        cell = []
+        for lo, hi, (low, high, scale) in zip(box._lo, box._hi, spans):
+            centre = min(max(lo, low), high) / 2 + min(max(hi, low), high) / 2
+            # max() puts a NaN from an infinite scale to 0 on the grid
+            cell.append(int(min(top, max(0.0, (centre / 2 - low / 2) * scale))))
+        return _hilbert_key(cell, bits)
+
+    return sorted(boxes, key=key)
+
+
+def _sweep_intersection(first: List[Box], second: List[Box], axis: int) -> List[Box]:
+    """
+    Pairwise intersections of two lists of disjoint non-empty boxes.
+
+    Both lists are merged in order of their lower bound along ``axis``, so a
+    box is only tested against the boxes of the other list that start before
+    it ends there. The pieces are disjoint, like the operands.
+    """
+    if not (first and second):
+        return []
+    overlap = _overlap_kernel(first[0]._dimension)
+    events = [(b._lo[axis], 0, b) for b in first]
+    events += [(b._lo[axis], 1, b) for b in second]
+    events.sort(key=lambda event: event[0])
+    n = len(events)
+    result_boxes = []
+    for pos, (_, side, a) in enumerate(events):
+        a_lo, a_hi, a_closed = a._lo, a._hi, a._closed
+        a_up = a_closed << 1
+        a_end = a_hi[axis]
+        for q in range(pos + 1, n):
+            b_start, b_side, b = events[q]
+            if b_start > a_end:
+                break
+            b_closed = b._closed
+            if b_side != side and overlap(
+                a_lo, a_hi, b._lo, b._hi, a_closed & (b_closed << 1), b_closed & a_up
+            ):
+                result_boxes.append(a.intersection(b))
+    return result_boxes
+
+
+def _start_order(box: Box) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Sort key of boxes by lower corner, then upper corner."""
+    return box._lo, box._hi
+
+
+def _stale_limit(count: int) -> int:
+    """
+    Longest tail of unindexed boxes a set of ``count`` boxes scans linearly
+    before its index is packed again.
+    """
+    return max(16, count // 8)
+
+
+def _slice_off(box: Box, overlap: Box) -> List[Box]:
+    r"""
+    Recursive slicing kernel behind Box.difference.
+
+    Returns disjoint boxes covering ``box \ overlap``, where ``overlap`` is the
+    (non-empty) intersection of ``box`` with the subtracted box. Callers that
+    already computed the intersection pass it in directly instead of paying
+    for it again inside Box.difference.
+    """
+    result_boxes = []
+
+    # We start with the full box and whittle it down. The remainder (the part
+    # of A matching O in the dimensions processed so far) is tracked as flat
+    # bound columns and a closedness mask, so every slice is assembled from
+    # floats and bits without re-validating Intervals or Boxes.
+    intervals = list(box._intervals)
+    lo = list(box._lo)
+    hi = list(box._hi)
+    closed = box._closed
+    overlap_closed = overlap._closed
+
+    for d, o_int in enumerate(overlap._intervals):
+        shift = 2 * d
+        r_lo, r_hi = lo[d], hi[d]
+        o_lo, o_hi = o_int._start, o_int._end
+        r_bits = (closed >> shift) & 3
+        o_bits = (overlap_closed >> shift) & 3
+        others = closed & ~(3 << shift)
+
+        # 1. Slice Left (Before Overlap): [r_lo, o_lo), closed at o_lo iff the
+        # overlap is open there. Safe to build unchecked: r_lo <= o_lo since
+        # O is a subset of A, and a degenerate slice is kept only as a point.
+        left_bits = (r_bits & 1) | (0 if o_bits & 1 else 2)
+        if r_lo < o_lo or left_bits == 3:
+            new_intervals = list(intervals)
+            new_intervals[d] = Interval._from_bounds(
+                r_lo, o_lo, not r_bits & 1, bool(o_bits & 1)
             )
+            new_hi = list(hi)
+            new_hi[d] = o_lo
+            result_boxes.append(
+                Box._from_columns(
+                    new_intervals, tuple(lo), tuple(new_hi), others | left_bits << shift
+                )
+            )
+
+        # 2. Slice Right (After Overlap): (o_hi, r_hi], mirrored.
+        right_bits = (0 if o_bits & 2 else 1) | (r_bits & 2)
+        if o_hi < r_hi or right_bits == 3:
+            new_intervals = list(intervals)
+            new_intervals[d] = Interval._from_bounds(
+                o_hi, r_hi, bool(o_bits & 2), not r_bits & 2
+            )
+            new_lo = list(lo)
+            new_lo[d] = o_hi
+            result_boxes.append(
+                Box._from_columns(
+                    new_intervals,
+                    tuple(new_lo),
+                    tuple(hi),
+                    others | right_bits << shift,
+                )
+            )
+
+        # 3. Shrink the remainder to the overlap in this dimension
+        intervals[d] = o_int
+        lo[d] = o_lo
+        hi[d] = o_hi
+        closed = others | o_bits << shift
+
+    return result_boxes
+
+
+def _shift_keeps_order(boxes: List[Box], shift: Sequence[float]) -> bool:
+    """
+    Check that translating ``boxes`` by ``shift`` keeps every bound distinct.
+
+    Rounded addition is monotone, so it can only turn two different bounds
+    on an axis into equal ones; as long as no value collapses, every
+    comparison between the bounds comes out the same after the shift.
+    """
+    for d, t in enumerate(shift):
+        if not math.isfinite(t):
+            return False
+        values = {b._lo[d] for b in boxes} | {b._hi[d] for b in boxes}
+        if len({v + t for v in values}) != len(values):
+            return False
+    return True
 
-            if not right_int.is_empty():
-                new_slice = list(current_intervals)
-                new_slice[d] = right_int
-                result_boxes.append(Box(new_slice))
 
-            # 3. Update 'current_intervals' for next dimension extraction
-            current_intervals[d] = o_int
+def _least_overlap_axis(
+    boxes: List[Box], bbox_lo: Tuple[float, ...], bbox_hi: Tuple[float, ...]
+) -> int:
+    """
+    Axis along which ``boxes`` overlap least, given their bounding box.
+
+    Scores each axis by the summed box widths relative to the extent of
+    the boxes, so a sweep along it meets the fewest candidates; axes with
+    an infinite bound only win when every axis has one.
+    """
+    best, best_score = 0, math.inf
+    for d, (low, high) in enumerate(zip(bbox_lo, bbox_hi)):
+        if not (-math.inf < low and high < math.inf) or high == low:
+            continue
+        score = sum(b._hi[d] - b._lo[d] for b in boxes) / (high - low)
+        if score < best_score:
+            best, best_score = d, score
+    return best
 
-        return result_boxes
+
+def _carve(box: Box, cutters: Iterable[Box], separated: _SeparatedKernel) -> List[Box]:
+    """
+    Return disjoint boxes covering ``box`` minus the union of ``cutters``.
+
+    ``separated`` is the separation kernel of the dimension. Cutters apart
+    from ``box`` are skipped, and so are the fragments that earlier slices
+    already cut away from a cutter; the rest are sliced by ``_slice_off``.
+    """
+    lo, hi = box._lo, box._hi
+    fragments = [box]
+    for cutter in cutters:
+        c_lo, c_hi = cutter._lo, cutter._hi
+        if separated(lo, hi, c_lo, c_hi):
+            continue
+        next_fragments = []
+        for frag in fragments:
+            if separated(frag._lo, frag._hi, c_lo, c_hi):
+                next_fragments.append(frag)
+                continue
+            inter = frag.intersection(cutter)
+            if inter.is_empty():
+                next_fragments.append(frag)
+            else:
+                next_fragments.extend(_slice_off(frag, inter))
+        fragments = next_fragments
+        if not fragments:
+            break
+    return fragments
+
+
+def _cross(
+    o: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]
+) -> float:
+    """Z component of (a - o) x (b - o); > 0 for a counter-clockwise turn."""
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _akl_toussaint_filter(
+    points: List[Tuple[float, float]],
+) -> List[Tuple[float, float]]:
+    """
+    Akl-Toussaint heuristic: drop points strictly inside the polygon spanned
+    by the extremes along x, y, x + y and x - y. Those points cannot be hull
+    vertices, and for box corners they are usually the vast majority.
+    """
+    if len(points) <= 8:
+        return points
+
+    # Extremes in counter-clockwise order, starting from the leftmost point
+    octagon = [
+        min(points, key=lambda p: p[0]),
+        min(points, key=lambda p: p[0] + p[1]),
+        min(points, key=lambda p: p[1]),
+        max(points, key=lambda p: p[0] - p[1]),
+        max(points, key=lambda p: p[0]),
+        max(points, key=lambda p: p[0] + p[1]),
+        max(points, key=lambda p: p[1]),
+        min(points, key=lambda p: p[0] - p[1]),
+    ]
+    polygon = [p for i, p in enumerate(octagon) if p != octagon[i - 1]]
+    if len(polygon) < 3:
+        return points
+
+    edges = list(zip(polygon, polygon[1:] + polygon[:1]))
+    return [p for p in points if not all(_cross(a, b, p) > 0 for a, b in edges)]
+
+
+def _convex_hull_2d(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """
+    Andrew's monotone chain. Returns the strictly convex hull vertices in
+    counter-clockwise order (collinear points are dropped).
+    """
+    pts = sorted(set(_akl_toussaint_filter(points)))
+    if len(pts) <= 2:
+        return pts
+
+    lower: List[Tuple[float, float]] = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+
+    upper: List[Tuple[float, float]] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    return lower[:-1] + upper[:-1]
+
+
+def _hull_diameter_2d(hull: List[Tuple[float, float]]) -> float:
+    """Rotating calipers: farthest pair of a convex polygon in O(h)."""
+    h = len(hull)
+    if h < 2:
+        return 0.0
+    if h == 2:
+        return math.dist(hull[0], hull[1])
+
+    best = 0.0
+    j = 1
+    for i in range(h):
+        p, q = hull[i], hull[(i + 1) % h]
+        # Advance the antipodal vertex while it moves away from edge p-q
+        while _cross(p, q, hull[(j + 1) % h]) > _cross(p, q, hull[j]):
+            j = (j + 1) % h
+        best = max(best, math.dist(p, hull[j]), math.dist(q, hull[j]))
+    return best
 
 
 class BoxSet:
@@ -455,6 +1133,11 @@ class BoxSet:
     Invariants:
     - All boxes in the set are pairwise disjoint.
     - All boxes have the same dimension.
+
+    Results that keep the boxes disjoint by construction (translations,
+    interiors, intersections, slices of a difference, erosions) are built
+    with _from_disjoint, which trusts the invariant instead of re-checking
+    it box by box in add().
     """
 
     def __init__(
@@ -467,12 +1150,58 @@ class BoxSet:
         """
         self._dimension: Optional[int] = None
         self._boxes: List[Box] = []
-        self._index: Optional[RTree[Box, Box]] = None
+        # Spatial index over the boxes, built on first use through _index.
+        self._rtree: Optional[RTree[Box, Box]] = None
+        # Number of leading boxes held by the index; later ones are scanned.
+        self._indexed = 0
+        # Lazily built struct-of-arrays view of the component bounds.
+        self._lo: Optional[List[Tuple[float, ...]]] = None
+        self._hi: Optional[List[Tuple[float, ...]]] = None
+        # Memoized derived geometry, reset by _invalidate() on mutation.
+        self._hull: Optional[Box] = None
+        self._diameter: Optional[float] = None
+        # 1D only: the boxes sorted by start, with the starts, for bisection.
+        # Built on first use and kept in order by _append() from then on.
+        self._ordered: Optional[Tuple[List[Box], List[float]]] = None
+        # Running total of the component volumes, kept up to date by add().
+        self._volume = 0.0
+        # Bounding box of all components, grown by add(); None while empty.
+        self._bbox_lo: Optional[Tuple[float, ...]] = None
+        self._bbox_hi: Optional[Tuple[float, ...]] = None
 
         if boxes:
-            for box in boxes:
+            items = list(boxes)
+            if all(isinstance(b, Box) for b in items):
+                # Insert in lexicographic order of the lower corner so the
+                # tiling, the box order and the R-tree are deterministic.
+                items.sort(key=lambda b: b._lo)
+                items = [b for b in items if not b._empty]
+                if len({b._dimension for b in items}) == 1:
+                    self._add_sorted(items)
+                    return
+            for box in items:
                 self.add(box)
 
+    @classmethod
+    def _from_disjoint(cls, boxes: Iterable[Box]) -> "BoxSet":
+        """
+        Build a set from boxes already known to be pairwise disjoint.
+
+        Skips the fragmentation in add(). Empty boxes are dropped and the rest
+        are stored in the lower-corner order __init__ would use.
+        """
+        result = cls()
+        items = sorted((b for b in boxes if not b._empty), key=lambda b: b._lo)
+        if not items:
+            return result
+        # Store the whole batch first so the index is built in one go
+        result._dimension = items[0]._dimension
+        result._boxes = items
+        result._volume = sum(box.volume() for box in items)
+        result._bbox_lo = tuple(map(min, zip(*(box._lo for box in items))))
+        result._bbox_hi = tuple(map(max, zip(*(box._hi for box in items))))
+        return result
+
     @property
     def dimension(self) -> Optional[int]:
         return self._dimension
@@ -485,9 +1214,32 @@ class BoxSet:
     def is_empty(self) -> bool:
         return not self._boxes
 
+    def _invalidate(self) -> None:
+        """Drop the cached views derived from the component boxes."""
+        self._lo = self._hi = None
+        self._hull = None
+        self._diameter = None
+
+    def _bounds(self) -> Tuple[List[Tuple[float, ...]], List[Tuple[float, ...]]]:
+        """
+        Return the struct-of-arrays view ``(lo, hi)`` of the component boxes.
+
+        ``lo[i]`` and ``hi[i]`` hold the per-dimension lower and upper bounds of
+        the i-th box. The view is built on first use and reset by add().
+        """
+        if self._lo is None or self._hi is None:
+            self._lo = [b._lo for b in self._boxes]
+            self._hi = [b._hi for b in self._boxes]
+        return self._lo, self._hi
+
     def volume(self) -> float:
-        """Total volume of the region."""
-        return sum(box.volume() for box in self._boxes)
+        """
+        Total volume of the region.
+
+        Boxes are disjoint and only ever appended, so add() keeps a running
+        total of the fragment volumes and this is O(1).
+        """
+        return self._volume
 
     def is_measurable(self) -> bool:
         """All Sets are Lebesgue measurable."""
@@ -508,25 +1260,41 @@ class BoxSet:
         Complexity: O(n * 2^d) where n is the number of boxes and d is dimension.
         Each addition can fragment the incoming box into up to 2^d disjoint pieces.
         """
-        if isinstance(item, BoxSet):
-            for b in item.boxes:
-                self.add(b)
-            return
-
-        if isinstance(item, Interval):
-            item = Box([item])
-        elif isinstance(item, IntervalSet):
-            for i in item:
-                self.add(Box([i]))
-            return
-
         box = item
-        if not isinstance(box, Box):
-            raise TypeError(
-                f"Cannot add {type(item)} to BoxSet. Expected Box, BoxSet, Interval or IntervalSet."
-            )
+        # Plain Boxes (including every fragment the set operations add) skip
+        # the promotion chain below with a single type lookup.
+        if type(item) is not Box:
+            if isinstance(item, BoxSet):
+                if not self._boxes:
+                    # Disjoint already, so its boxes are stored as they are
+                    self._dimension = item._dimension
+                    pieces = item._boxes
+                elif item._dimension == self._dimension:
+                    # One difference() pass carves all the incoming boxes by
+                    # the components instead of one add() at a time
+                    pieces = item.difference(self)._boxes
+                else:
+                    for b in item.boxes:
+                        self.add(b)
+                    return
+                if pieces:
+                    self._invalidate()
+                for piece in pieces:
+                    self._append(piece)
+                return
+
+            if isinstance(item, Interval):
+                box = Box([item])
+            elif isinstance(item, IntervalSet):
+                for i in item:
+                    self.add(Box([i]))
+                return
+            elif not isinstance(item, Box):
+                raise TypeError(
+                    f"Cannot add {type(item)} to BoxSet. Expected Box, BoxSet, Interval or IntervalSet."
+                )
 
-        if box.is_empty():
+        if box._empty:
             return
 
         if self._dimension is None:
@@ -536,40 +1304,129 @@ class BoxSet:
                 f"Dimension mismatch: BoxSet({self._dimension}) vs Box({box.dimension})"
             )
 
-        # We want to add 'box' to our collection.
-        # Use spatial index to find overlapping boxes if it exists.
-        search_target = self._boxes
-        if self._index:
-            search_target = self._index.search(box)
-
-        fragments = [box]
-
-        for existing in search_target:
-            if not fragments:
-                break
+        # Strictly outside the bounding box of the set, the box cannot overlap
+        # any component: skip the candidate search and the slicing.
+        separated = _separated_kernel(self._dimension)
+        if self._bbox_lo is None or separated(
+            box._lo, box._hi, self._bbox_lo, self._bbox_hi
+        ):
+            self._invalidate()
+            self._append(box)
+            return
 
-            new_fragments = []
-            for frag in fragments:
-                if frag.overlaps(existing):
-                    diffs = frag.difference(existing)
-                    new_fragments.extend(diffs)
-                else:
-                    new_fragments.append(frag)
-            fragments = new_fragments
+        # Keep the parts of 'box' that no nearby component already covers
+        fragments = _carve(box, self._candidates(box), separated)
+        if fragments:
+            self._invalidate()
 
         # Add the remaining disjoint fragments
         for frag in fragments:
-            self._boxes.append(frag)
-            if self._index:
-                self._index.insert(frag)
-            elif len(self._boxes) > 10:  # Build index after 10 boxes
-                self._build_index()
+            self._append(frag)
+
+    def _add_sorted(self, boxes: List[Box]) -> None:
+        """
+        Fill an empty set with non-empty boxes of one dimension.
+
+        Same result as adding ``boxes`` one by one in this order, but every
+        overlapping pair is found up front by a single sweep: a box meeting
+        no earlier one is stored as is, and the others are only sliced by
+        the surviving pieces of the earlier boxes they overlap.
+        """
+        n = len(boxes)
+        dimension = boxes[0]._dimension
+        self._dimension = dimension
+        bbox_lo = tuple(map(min, zip(*(b._lo for b in boxes))))
+        bbox_hi = tuple(map(max, zip(*(b._hi for b in boxes))))
+        axis = _least_overlap_axis(boxes, bbox_lo, bbox_hi)
+
+        # earlier[i] lists the boxes before box i that overlap it
+        earlier: List[List[int]] = [[] for _ in range(n)]
+        overlap = _overlap_kernel(dimension)
+        order = sorted(range(n), key=lambda i: boxes[i]._lo[axis])
+        for pos, i in enumerate(order):
+            a = boxes[i]
+            a_lo, a_hi, a_closed = a._lo, a._hi, a._closed
+            a_end, a_up = a_hi[axis], a_closed << 1
+            for q in range(pos + 1, n):
+                j = order[q]
+                b = boxes[j]
+                if b._lo[axis] > a_end:
+                    break
+                b_closed = b._closed
+                if overlap(
+                    a_lo,
+                    a_hi,
+                    b._lo,
+                    b._hi,
+                    a_closed & (b_closed << 1),
+                    b_closed & a_up,
+                ):
+                    earlier[max(i, j)].append(min(i, j))
+
+        separated = _separated_kernel(dimension)
+        pieces: List[List[Box]] = []
+        for box, before in zip(boxes, earlier):
+            if before:
+                cutters = [p for j in sorted(before) for p in pieces[j]]
+                fragments = _carve(box, cutters, separated)
+            else:
+                fragments = [box]
+            pieces.append(fragments)
+            for fragment in fragments:
+                self._append(fragment)
+
+    def _append(self, box: Box) -> None:
+        """Store a box already known to be disjoint from every component."""
+        self._boxes.append(box)
+        self._volume += box.volume()
+        if self._bbox_lo is None:
+            self._bbox_lo, self._bbox_hi = box._lo, box._hi
+        else:
+            self._bbox_lo = tuple(map(min, self._bbox_lo, box._lo))
+            self._bbox_hi = tuple(map(max, self._bbox_hi, box._hi))
+        if self._ordered is not None:
+            # Slot the box into the sorted 1D view instead of sorting again
+            ordered, starts = self._ordered
+            i = bisect.bisect(ordered, _start_order(box), key=_start_order)
+            ordered.insert(i, box)
+            starts.insert(i, box._lo[0])
+
+    def _is_1d_with(self, other: "BoxSet") -> bool:
+        """
+        Whether both operands are 1D sets.
+
+        Only the dimension is compared: a set gets one with its first box, so
+        an empty set (dimension None) never passes and the operands are
+        non-empty as well.
+        """
+        return self._dimension == 1 and other._dimension == 1
+
+    def _to_interval_set(self) -> IntervalSet:
+        """View a 1D BoxSet as the IntervalSet of its component intervals."""
+        return IntervalSet([box.intervals[0] for box in self._boxes])
+
+    @classmethod
+    def _from_interval_set(cls, intervals: Union[Interval, IntervalSet]) -> "BoxSet":
+        """
+        Build a 1D BoxSet from a normalized IntervalSet (or the single
+        Interval that IntervalSet operators collapse to).
+
+        Its intervals are already sorted and disjoint, so they are appended
+        directly instead of going through the slicing in add().
+        """
+        if isinstance(intervals, Interval):
+            intervals = IntervalSet([intervals])
+        result = cls()
+        for interval in intervals:
+            result._dimension = 1
+            result._append(Box([interval]))
+        return result
 
     def is_bounded(self) -> bool:
         """Check if the set is bounded."""
-        if self.is_empty():
+        if self._bbox_lo is None:
             return True
-        return all(b.is_bounded() for b in self._boxes)
+        return -math.inf < min(self._bbox_lo) and max(self._bbox_hi) < math.inf
 
     def is_open(self) -> bool:
         """Check if the set is open."""
@@ -592,7 +1449,44 @@ class BoxSet:
         if not isinstance(other, BoxSet):
             other = BoxSet([other])
 
-        return min(b1.distance(b2) for b1 in self._boxes for b2 in other.boxes)
+        if self._dimension != other._dimension:
+            raise ValueError(
+                f"Dimension mismatch: {self._dimension} vs {other._dimension}"
+            )
+        # Squared gaps are compared throughout, with a single square root of
+        # the smallest at the end
+        gap = _gap_kernel(self._dimension)
+        best = float("inf")
+
+        probe, indexed = (other, self) if self._index else (self, other)
+        if indexed._index is None:
+            # All pairs in one pass over the bound columns; a box no closer
+            # to the bounding box of the other side than the best pair so far
+            # cannot improve on it and skips its row.
+            others = [(b._lo, b._hi) for b in other._boxes]
+            o_lo, o_hi = other._bbox_lo, other._bbox_hi
+            for b1 in self._boxes:
+                a_lo, a_hi = b1._lo, b1._hi
+                if gap(a_lo, a_hi, o_lo, o_hi) >= best:
+                    continue
+                for b_lo, b_hi in others:
+                    d2 = gap(a_lo, a_hi, b_lo, b_hi)
+                    if d2 < best:
+                        best = d2
+                        if d2 == 0.0:
+                            return 0.0
+            return math.sqrt(best)
+
+        # Branch-and-bound: each probe box descends the R-tree of the other
+        # side, pruning subtrees no closer than the best pair found so far.
+        for b in probe._boxes:
+            lo, hi = b._lo, b._hi
+            _, best = indexed._index.nearest(
+                lambda mbr: gap(lo, hi, mbr._lo, mbr._hi), best
+            )
+            if best == 0.0:
+                break
+        return math.sqrt(best)
 
     def interior(self) -> "BoxSet":
         """
@@ -603,7 +1497,7 @@ class BoxSet:
             return self
         # Create a new BoxSet from the interiors of component boxes.
         # Since component boxes are disjoint, their interiors are also disjoint.
-        return BoxSet([box.interior() for box in self._boxes])
+        return BoxSet._from_disjoint(box.interior() for box in self._boxes)
 
     def closure(self) -> "BoxSet":
         """
@@ -623,6 +1517,44 @@ class BoxSet:
             return self
         return self.closure() - self.interior()
 
+    def boundary_faces(self) -> Iterator[Box]:
+        """
+        Lazily yield the closed faces of the component boxes.
+
+        Their union is boundary(): disjoint boxes cannot reach into each
+        other's interiors, so removing those interiors from the closures
+        leaves exactly the faces, including the ones between touching
+        boxes. A face met twice is yielded once. Faces at infinity are
+        omitted and a degenerate side yields a single face.
+        """
+        seen = set()
+        for box, d, value, key in self._iter_faces():
+            if key not in seen:
+                seen.add(key)
+                intervals = [iv.closure() for iv in box.intervals]
+                intervals[d] = Interval(value, value)
+                yield Box(intervals)
+
+    def boundary_face_count(self) -> int:
+        """Return the number of faces boundary_faces() would yield."""
+        return len({key for *_, key in self._iter_faces()})
+
+    def _iter_faces(self) -> Iterator[Tuple[Box, int, float, tuple]]:
+        """
+        Yield ``(box, axis, coordinate, key)`` for every finite face.
+
+        ``key`` is ``(axis, coordinate, extents of the other axes)``, equal
+        for the faces of two boxes that coincide.
+        """
+        for box in self._boxes:
+            lo, hi = box._lo, box._hi
+            for d in range(len(lo)):
+                rest = (lo[:d] + lo[d + 1 :], hi[:d] + hi[d + 1 :])
+                values = (lo[d],) if lo[d] == hi[d] else (lo[d], hi[d])
+                for value in values:
+                    if not math.isinf(value):
+                        yield box, d, value, (d, value, rest)
+
     def convex_hull(self) -> Box:
         """Return the smallest convex box containing this set."""
         if self.is_empty():
@@ -632,41 +1564,121 @@ class BoxSet:
             # Should be handled by is_empty check, but for typing:
             return Box.empty(1)
 
-        intervals = []
-        for d in range(self._dimension):
-            inf_d = min(b.intervals[d].start for b in self._boxes)
-            sup_d = max(b.intervals[d].end for b in self._boxes)
+        if self._hull is not None:
+            return self._hull
 
-            has_closed_start = any(
-                b.intervals[d].start == inf_d and not b.intervals[d].open_start
-                for b in self._boxes
-            )
-            has_closed_end = any(
-                b.intervals[d].end == sup_d and not b.intervals[d].open_end
-                for b in self._boxes
-            )
-
-            intervals.append(
+        # The extreme bounds are the tracked bounding box; a hull bound is
+        # closed if any box reaching it is closed there. One pass over the
+        # boxes collects those closedness bits into a single mask.
+        inf, sup = self._bbox_lo, self._bbox_hi
+        closed = 0
+        for box in self._boxes:
+            mask = box._closed
+            bit = 1
+            for lo, hi, lo_d, hi_d in zip(box._lo, box._hi, inf, sup):
+                if lo == lo_d:
+                    closed |= mask & bit
+                if hi == hi_d:
+                    closed |= mask & (bit << 1)
+                bit <<= 2
+
+        self._hull = Box(
+            [
                 Interval(
-                    inf_d,
-                    sup_d,
-                    open_start=not has_closed_start,
-                    open_end=not has_closed_end,
+                    inf[d],
+                    sup[d],
+                    open_start=not closed >> (2 * d) & 1,
+                    open_end=not closed >> (2 * d) & 2,
                 )
-            )
-        return Box(intervals)
+                for d in range(self._dimension)
+            ]
+        )
+        return self._hull
 
     def diameter(self) -> float:
-        """Return the maximum distance between any two points in the set."""
+        """
+        Return the maximum distance between any two points in the set.
+
+        The farthest pair of a union of boxes is always a pair of box corners.
+        In 2D this runs rotating calipers over the convex hull of the corners,
+        O(n log n); other dimensions compare the farthest corners of every
+        pair of boxes, O(n^2 * d). The result is cached until the next add().
+        """
         if self.is_empty():
             return 0.0
-        return self.convex_hull().diameter()
+        if self._diameter is None:
+            self._diameter = self._compute_diameter()
+        return self._diameter
+
+    def _compute_diameter(self) -> float:
+        """Uncached diameter() of a non-empty set."""
+        if len(self._boxes) == 1:
+            return self._boxes[0].diameter()
+        if not self.is_bounded():
+            return float("inf")
+
+        lo, hi = self._bounds()
+        if self._dimension == 2:
+            corners = [
+                (x, y)
+                for b_lo, b_hi in zip(lo, hi)
+                for x in (b_lo[0], b_hi[0])
+                for y in (b_lo[1], b_hi[1])
+            ]
+            return _hull_diameter_2d(_convex_hull_2d(corners))
+
+        # Farthest corners of each pair: per axis the larger of the two
+        # cross spans, reduced by math.hypot without a Python-level loop.
+        # No pair is farther apart than either box is from the far side of
+        # the bounding box of the set, so boxes are visited by decreasing
+        # reach to it and both loops stop once that cannot beat the best pair.
+        set_lo, set_hi = self._bbox_lo, self._bbox_hi
+        rows = sorted(
+            (
+                (
+                    math.hypot(
+                        *map(max, map(sub, a_hi, set_lo), map(sub, set_hi, a_lo))
+                    ),
+                    a_lo,
+                    a_hi,
+                )
+                for a_lo, a_hi in zip(lo, hi)
+            ),
+            key=itemgetter(0),
+            reverse=True,
+        )
+        best = 0.0
+        for i, (reach, a_lo, a_hi) in enumerate(rows):
+            if reach <= best:
+                break
+            for b_reach, b_lo, b_hi in rows[i:]:
+                if b_reach <= best:
+                    break
+                d = math.hypot(*map(max, map(sub, a_hi, b_lo), map(sub, b_hi, a_lo)))
+                if d > best:
+                    best = d
+        return best
 
     def distance_to_point(self, point: Sequence[float]) -> float:
         """Return the minimum Euclidean distance from a point to this set."""
         if self.is_empty():
             return float("inf")
-        return min(b.distance_to_point(point) for b in self._boxes)
+        if len(point) != self._dimension:
+            raise ValueError(f"Dimension mismatch: {len(point)} vs {self._dimension}")
+        # Squared distances throughout, and a single square root at the end
+        gap = _gap_kernel(self._dimension)
+        if self._index:
+            _, d2 = self._index.nearest(lambda mbr: gap(mbr._lo, mbr._hi, point, point))
+            return math.sqrt(d2)
+        # Scan the bound columns of every box
+        best = float("inf")
+        for box in self._boxes:
+            d2 = gap(box._lo, box._hi, point, point)
+            if d2 < best:
+                best = d2
+                if d2 == 0.0:
+                    break
+        return math.sqrt(best)
 
     def contains(self, item: Union[Sequence[float], Box, "BoxSet"]) -> bool:
         """Check if point, Box, or BoxSet is contained in this BoxSet."""
@@ -676,12 +1688,19 @@ class BoxSet:
             # Box is in BoxSet if it's contained in the UNION of component boxes.
             if self.is_empty():
                 return item.is_empty()
-            return (BoxSet([item]) - self).is_empty()
+            if item.dimension != self._dimension:
+                raise ValueError("Dimension mismatch")
+            return self._covers(item)
 
         if isinstance(item, BoxSet):  # BoxSet-like
             if item.is_empty():
                 return True
-            return all(self.contains(b) for b in item.boxes)
+            if self.is_empty():
+                return False
+            if item._dimension != self._dimension:
+                raise ValueError("Dimension mismatch")
+            # Checked once for the whole set, so each box goes to _covers
+            return all(map(self._covers, item._boxes))
 
         # Point check
         point = item
@@ -693,17 +1712,182 @@ class BoxSet:
                 f"Point dimension {len(point)} must match BoxSet dimension {self._dimension}"
             )
 
-        search_target = self._boxes
+        if self._dimension == 1:
+            # A binary search over the sorted starts beats the tree walk
+            return self._contains_1d(point)
+
+        inside = _point_kernel(self._dimension)
         if self._index:
-            # Create a degenerate box for the point to search the R-tree
-            p_box = Box([Interval(p, p) for p in point])
-            search_target = self._index.search(p_box)
+            # Index MBRs are closed at their finite bounds (an infinite one is
+            # never reached), so the exact test also prunes the nodes. The
+            # boxes are disjoint: the first one holding the point settles it.
+            return (
+                self._index.find(
+                    lambda mbr: inside(mbr._lo, mbr._hi, mbr._closed, point)
+                )
+                is not None
+            )
 
-        for box in search_target:
-            if box.contains(point):
+        for box in self._boxes:
+            if inside(box._lo, box._hi, box._closed, point):
                 return True
         return False
 
+    def contains_many(self, points: Iterable[Sequence[float]]) -> List[bool]:
+        """
+        Check many points at once.
+
+        Returns one bool per point, equivalent to ``[p in self for p in points]``.
+        In 1D the disjoint boxes are sorted once and each point is located by
+        binary search, O((n + m) log n) instead of O(n * m).
+        """
+        points = list(points)
+        if self._dimension != 1:
+            return [self.contains(p) for p in points]
+
+        results = []
+        for point in points:
+            if len(point) != 1:
+                raise ValueError(
+                    f"Point dimension {len(point)} must match BoxSet dimension 1"
+                )
+            results.append(self._contains_1d(point))
+        return results
+
+    def _sorted_1d(self) -> Tuple[List[Box], List[float]]:
+        """
+        Return the boxes of a 1D set sorted by start, with their starts.
+
+        Built on first use; add() slots new boxes into both lists. Disjoint
+        1D boxes sorted by start also have non-decreasing ends.
+        """
+        if self._ordered is None:
+            ordered = sorted(self._boxes, key=_start_order)
+            self._ordered = (ordered, [b._lo[0] for b in ordered])
+        return self._ordered
+
+    def _contains_1d(self, point: Sequence[float]) -> bool:
+        """
+        Check a point against a non-empty 1D set by binary search.
+
+        Only the few boxes before the point that still reach it are tested.
+        """
+        ordered, starts = self._sorted_1d()
+
+        x = point[0]
+        inside = _point_kernel(1)
+        j = bisect.bisect_right(starts, x) - 1
+        # Walk back over the few boxes that still reach x
+        while j >= 0 and ordered[j]._hi[0] >= x:
+            box = ordered[j]
+            if inside(box._lo, box._hi, box._closed, point):
+                return True
+            j -= 1
+        return False
+
+    def contains_except(
+        self,
+        point: Sequence[float],
+        other: Union[Box, "BoxSet", Interval, IntervalSet],
+    ) -> bool:
+        """
+        Check ``point in (self - other)`` without building the difference.
+
+        Two membership probes replace the O(n * m) slicing of a difference
+        that would be thrown away right after the test.
+        """
+        if not isinstance(other, (Box, BoxSet)):
+            other = BoxSet([other])
+        return self.contains(point) and not other.contains(point)
+
+    def _candidates(self, box: Box) -> List[Box]:
+        """
+        Return the component boxes that may overlap ``box`` (broad phase).
+
+        Uses the spatial index when it exists, otherwise every box is a
+        candidate. 1D sets bisect their sorted starts instead and never build
+        the tree for this. Callers still run the exact overlap test on the
+        result.
+        """
+        if self._dimension == 1 and len(self._boxes) > 10:
+            ordered, starts = self._sorted_1d()
+            lo, hi = box._lo[0], box._hi[0]
+            i = bisect.bisect_left(starts, lo)
+            if i and ordered[i - 1]._hi[0] >= lo:
+                # Only the last box starting before lo can still reach it
+                i -= 1
+            return ordered[i : bisect.bisect_right(starts, hi)]
+        if self._rtree is None:
+            if len(self._boxes) <= 10:
+                return self._boxes
+            self._build_index()
+        elif len(self._boxes) - self._indexed > _stale_limit(len(self._boxes)):
+            # Repacking from scratch beats inserting a long tail one by one
+            self._build_index()
+        # The boxes added since the index was packed come unfiltered
+        candidates = self._rtree.search(box)  # type: ignore
+        candidates.extend(self._boxes[self._indexed :])
+        return candidates
+
+    def _covers(self, box: Box) -> bool:
+        """
+        Check that a non-empty box of this dimension lies in the union of the
+        components of this (non-empty) set.
+
+        Answers at once when one component contains the whole box; otherwise
+        slices the box by the nearby components like difference() does, and
+        stops as soon as no fragment is left.
+        """
+        lo, hi, closed = box._lo, box._hi, box._closed
+        separated = _separated_kernel(self._dimension)
+        inside = _inside_kernel(self._dimension)
+        candidates = []
+        for c in self._candidates(box):
+            if separated(lo, hi, c._lo, c._hi):
+                continue
+            if inside(c._lo, c._hi, lo, hi, closed & ~c._closed):
+                return True
+            candidates.append(c)
+
+        fragments = [box]
+        for c in candidates:
+            c_lo, c_hi = c._lo, c._hi
+            next_fragments = []
+            for frag in fragments:
+                if separated(frag._lo, frag._hi, c_lo, c_hi):
+                    next_fragments.append(frag)
+                    continue
+                inter = frag.intersection(c)
+                if inter.is_empty():
+                    next_fragments.append(frag)
+                else:
+                    next_fragments.extend(_slice_off(frag, inter))
+            fragments = next_fragments
+            if not fragments:
+                return True
+        return False
+
+    @property
+    def _index(self) -> Optional[RTree[Box, Box]]:
+        """
+        The spatial index, or None for sets of at most 10 boxes.
+
+        Built in one go on first use, so results that are never queried
+        (components, intermediate erosions, ...) do not pay for it. Boxes
+        added since are inserted here (or packed again with the rest once
+        they pile up), so every box is found through it.
+        """
+        if self._rtree is None:
+            if len(self._boxes) > 10:
+                self._build_index()
+        elif len(self._boxes) - self._indexed > _stale_limit(len(self._boxes)):
+            self._build_index()
+        elif self._indexed < len(self._boxes):
+            for box in self._boxes[self._indexed :]:
+                self._rtree.insert(box)
+            self._indexed = len(self._boxes)
+        return self._rtree
+
     def _build_index(self) -> None:
         """Construct the spatial index for the current boxes."""
         if not self._boxes:
@@ -717,27 +1901,59 @@ class BoxSet:
         def expand_mbr(m1: Optional[Box], m2: Box) -> Box:
             if m1 is None:
                 return m2
-            intervals = []
-            for i in range(m1.dimension):
-                i1, i2 = m1.intervals[i], m2.intervals[i]
-                start = min(i1.start, i2.start)
-                end = max(i1.end, i2.end)
-                intervals.append(Interval(start, end))
-            return Box(intervals)
+            return _bounding_box(
+                tuple(map(min, m1._lo, m2._lo)), tuple(map(max, m1._hi, m2._hi))
+            )
 
         def get_volume(box: Box) -> float:
             return box.volume()
 
+        # Entries and queries share the dimension of the set, so the search
+        # runs the unrolled kernel without the checks in Box.overlaps
+        overlap = _overlap_kernel(self._dimension)
+
         def overlaps(b1: Box, b2: Box) -> bool:
-            return b1.overlaps(b2)
+            if b2._empty:
+                return False
+            c1, c2 = b1._closed, b2._closed
+            return overlap(
+                b1._lo, b1._hi, b2._lo, b2._hi, c1 & (c2 << 1), c2 & (c1 << 1)
+            )
 
-        self._index = RTree(get_mbr, expand_mbr, get_volume, overlaps)
-        for box in self._boxes:
-            self._index.insert(box)
+        self._rtree = RTree(get_mbr, expand_mbr, get_volume, overlaps)
+        # Pack the boxes along a Hilbert curve so spatially close boxes
+        # share nodes; later additions join the scanned tail.
+        self._rtree.bulk_load(_hilbert_order(self._boxes))
+        self._indexed = len(self._boxes)
 
     def __contains__(self, item: Union[Sequence[float], Box, "BoxSet"]) -> bool:
         return self.contains(item)
 
+    def overlaps(self, other: Union[Box, "BoxSet", Interval, IntervalSet]) -> bool:
+        """
+        Check if this set overlaps with another set or box.
+
+        Equivalent to ``not (self & other).is_empty()`` but stops at the first
+        colliding pair instead of materializing the intersection.
+        """
+        if not isinstance(other, BoxSet):
+            other = BoxSet([other])
+
+        if self.is_empty() or other.is_empty():
+            return False
+
+        if self._dimension != other.dimension:
+            raise ValueError("Dimension mismatch")
+
+        if self._dimension == 1:
+            # Search the larger side through its sorted starts
+            probe, indexed = sorted((self, other), key=lambda s: len(s._boxes))
+        else:
+            probe, indexed = (other, self) if self._index else (self, other)
+        return any(
+            b1.overlaps(b2) for b1 in probe._boxes for b2 in indexed._candidates(b1)
+        )
+
     def intersection(
         self, other: Union[Box, "BoxSet", "Interval", "IntervalSet"]
     ) -> "BoxSet":
@@ -753,6 +1969,22 @@ class BoxSet:
         if self._dimension and other.dimension and self._dimension != other.dimension:
             raise ValueError("Dimension mismatch")
 
+        # Separated bounding boxes (or an empty side) share no point at all
+        if (
+            self._bbox_lo is None
+            or other._bbox_lo is None
+            or _separated_kernel(self._dimension)(
+                self._bbox_lo, self._bbox_hi, other._bbox_lo, other._bbox_hi
+            )
+        ):
+            return BoxSet()
+
+        if self._is_1d_with(other):
+            # 1D sets take the sorted sweep of IntervalSet instead
+            return BoxSet._from_interval_set(
+                self._to_interval_set() & other._to_interval_set()
+            )
+
         # Result is Union(A_i & B_j) for all i, j.
         # Since A_i disjoint and B_j disjoint, the results (A_i & B_j) are automatically disjoint?
         # Proof:
@@ -761,21 +1993,27 @@ class BoxSet:
         # (A1 & B1) vs (A2 & B2). Disjoint.
         # So yes! We just collect all pairwise intersections.
 
+        # Probe the indexed side with the boxes of the other one so each
+        # query only visits nearby candidates instead of all n * m pairs.
+        probe, indexed = (other, self) if self._index else (self, other)
+
+        # Each pair is tested on the bound columns with the overlap kernel,
+        # so boxes are only built for the pairs that actually intersect.
+        overlap = _overlap_kernel(self._dimension)
         result_boxes = []
-        for b1 in self._boxes:
-            for b2 in other.boxes:
-                if b1.overlaps(b2):
-                    inter = b1.intersection(b2)
-                    # overlaps() guarantees non-empty intersection
-                    result_boxes.append(inter)
-
-        # Manually create region to bypass normalization checks?
-        # Or just use constructor (which attempts normalization but here inputs are already disjoint).
-        # But BoxSet() constructor calls add() which runs difference logic.
-        # If we pass disjoint boxes to constructor, add() loop will just verify validity (overlap check fails).
-        # So it is safe but maybe O(N^2) instead of O(N)?
-        # For now, safe constructor.
-        return BoxSet(result_boxes)
+        for b1 in probe._boxes:
+            lo1, hi1, closed1 = b1._lo, b1._hi, b1._closed
+            up1 = closed1 << 1
+            for b2 in indexed._candidates(b1):
+                closed2 = b2._closed
+                if overlap(
+                    lo1, hi1, b2._lo, b2._hi, closed1 & (closed2 << 1), closed2 & up1
+                ):
+                    # A positive overlap guarantees a non-empty intersection
+                    result_boxes.append(b1.intersection(b2))
+
+        # The pieces are disjoint already, so skip the normalization in add()
+        return BoxSet._from_disjoint(result_boxes)
 
     def difference(
         self, other: Union[Box, "BoxSet", "Interval", "IntervalSet"]
@@ -794,26 +2032,30 @@ class BoxSet:
         if self._dimension and other.dimension and self._dimension != other.dimension:
             raise ValueError("Dimension mismatch")
 
+        if self._is_1d_with(other):
+            return BoxSet._from_interval_set(
+                self._to_interval_set() - other._to_interval_set()
+            )
+
+        if self.is_empty() or other.is_empty():
+            return BoxSet._from_disjoint(self._boxes)
+
         final_boxes = []
+        separated = _separated_kernel(self._dimension)
+        other_lo, other_hi = other._bbox_lo, other._bbox_hi
 
         for a_box in self._boxes:
-            # We start with A_i and chop parts off it
-            current_fragments = [a_box]
-
-            for b_box in other.boxes:
-                next_fragments = []
-                for frag in current_fragments:
-                    if frag.overlaps(b_box):
-                        next_fragments.extend(frag.difference(b_box))
-                    else:
-                        next_fragments.append(frag)
-                current_fragments = next_fragments
-                if not current_fragments:
-                    break
+            a_lo, a_hi = a_box._lo, a_box._hi
+            # Strictly outside the bounding box of B: nothing to subtract
+            if separated(a_lo, a_hi, other_lo, other_hi):
+                final_boxes.append(a_box)
+                continue
 
-            final_boxes.extend(current_fragments)
+            # We start with A_i and chop off the nearby B_j
+            final_boxes.extend(_carve(a_box, other._candidates(a_box), separated))
 
-        return BoxSet(final_boxes)
+        # Fragments of disjoint boxes, sliced apart: disjoint by construction
+        return BoxSet._from_disjoint(final_boxes)
 
     def union(self, other: Union[Box, "BoxSet", Interval, IntervalSet]) -> "BoxSet":
         """
@@ -822,8 +2064,14 @@ class BoxSet:
 
         Complexity: O(m * n * 2^d) due to pairwise subtraction for normalization.
         """
-        # Promotion handled by add()
-        new_set = BoxSet(self._boxes)
+        if isinstance(other, BoxSet) and self._is_1d_with(other):
+            # 1D sets take the sorted merge of IntervalSet instead
+            return BoxSet._from_interval_set(
+                self._to_interval_set() | other._to_interval_set()
+            )
+
+        # Promotion handled by add(); the own boxes are disjoint already
+        new_set = BoxSet._from_disjoint(self._boxes)
         new_set.add(other)
         return new_set
 
@@ -836,9 +2084,41 @@ class BoxSet:
         if not isinstance(other, BoxSet):
             other = BoxSet([other])
 
-        diff1 = self.difference(other)
-        diff2 = other.difference(self)
-        return diff1.union(diff2)
+        if self._dimension and other.dimension and self._dimension != other.dimension:
+            raise ValueError("Dimension mismatch")
+
+        if self.is_empty() or other.is_empty():
+            return BoxSet._from_disjoint(self._boxes + other._boxes)
+
+        # A - B lies outside B and B - A inside it, so the two halves are
+        # disjoint and are joined without the re-slicing done by union().
+        if self._is_1d_with(other):
+            # Each 1D difference is a sorted sweep already
+            return BoxSet._from_disjoint(
+                self.difference(other)._boxes + other.difference(self)._boxes
+            )
+
+        # Pair up the touching components with one broad-phase pass; A - B
+        # and B - A then slice every box by its partners alone.
+        separated = _separated_kernel(self._dimension)
+        probe, indexed = (other, self) if self._index else (self, other)
+        probe_cuts = []
+        indexed_cuts: Dict[int, List[Box]] = {id(box): [] for box in indexed._boxes}
+        for p_box in probe._boxes:
+            p_lo, p_hi = p_box._lo, p_box._hi
+            cuts = []
+            for i_box in indexed._candidates(p_box):
+                if not separated(p_lo, p_hi, i_box._lo, i_box._hi):
+                    cuts.append(i_box)
+                    indexed_cuts[id(i_box)].append(p_box)
+            probe_cuts.append(cuts)
+
+        pieces = []
+        for p_box, cuts in zip(probe._boxes, probe_cuts):
+            pieces.extend(_carve(p_box, cuts, separated))
+        for i_box in indexed._boxes:
+            pieces.extend(_carve(i_box, indexed_cuts[id(i_box)], separated))
+        return BoxSet._from_disjoint(pieces)
 
     def __or__(self, other: Union[Box, "BoxSet", Interval, IntervalSet]) -> "BoxSet":
         return self.union(other)
@@ -860,7 +2140,9 @@ class BoxSet:
         if self.is_empty() or len(self._boxes) <= 1:
             return True
 
-        return len(self.connected_components()) == 1
+        # Only the labels are needed, not the component sets
+        roots = self._component_roots()
+        return roots.count(roots[0]) == len(roots)
 
     def connected_components(self) -> List["BoxSet"]:
         """
@@ -873,49 +2155,58 @@ class BoxSet:
         if self._dimension is None:
             return []
 
-        n = len(self._boxes)
-        adj: List[List[int]] = [[] for _ in range(n)]
+        # Components in order of their first box; their boxes are disjoint
+        # already, so each one is built without normalization
+        groups: Dict[int, List[Box]] = {}
+        for root, box in zip(self._component_roots(), self._boxes):
+            groups.setdefault(root, []).append(box)
+        return [BoxSet._from_disjoint(group) for group in groups.values()]
 
-        # Build adjacency list
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Check if closures overlap in all dimensions
-                is_adj = True
-                for k in range(self._dimension):
-                    # We use Interval.closure() followed by overlaps()
-                    if (
-                        not self._boxes[i]
-                        .intervals[k]
-                        .closure()
-                        .overlaps(self._boxes[j].intervals[k].closure())
-                    ):
-                        is_adj = False
-                        break
-
-                if is_adj:
-                    adj[i].append(j)
-                    adj[j].append(i)
-
-        components = []
-        visited = [False] * n
-
-        for root in range(n):
-            if not visited[root]:
-                comp_indices = []
-                stack = [root]
-                visited[root] = True
-
-                while stack:
-                    curr = stack.pop()
-                    comp_indices.append(curr)
-                    for neighbor in adj[curr]:
-                        if not visited[neighbor]:
-                            visited[neighbor] = True
-                            stack.append(neighbor)
-
-                components.append(BoxSet([self._boxes[idx] for idx in comp_indices]))
-
-        return components
+    def _component_roots(self) -> List[int]:
+        """
+        Label each box of a non-empty set with the index of a representative
+        box of its connected component (union-find over touching boxes).
+
+        Stops looking for touching pairs once everything is merged.
+        """
+        boxes = self._boxes
+        n = len(boxes)
+        parent = list(range(n))
+        components = n
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # path halving
+                i = parent[i]
+            return i
+
+        # Closures intersect iff no axis separates the (closed) bounds. Sweep
+        # along one axis: with boxes ordered by lower bound, the candidates of
+        # a box are the ones starting no later than its end.
+        separated = _separated_kernel(self._dimension)
+        axis = self._sweep_axis()
+        order = sorted(range(n), key=lambda i: boxes[i]._lo[axis])
+        los = [boxes[i]._lo for i in order]
+        his = [boxes[i]._hi for i in order]
+        for pos, i in enumerate(order):
+            a_lo, a_hi = los[pos], his[pos]
+            a_end = a_hi[axis]
+            for q in range(pos + 1, n):
+                b_lo = los[q]
+                if b_lo[axis] > a_end:
+                    break
+                if not separated(a_lo, a_hi, b_lo, his[q]):
+                    root_i, root_j = find(i), find(order[q])
+                    if root_i != root_j:
+                        parent[root_j] = root_i
+                        components -= 1
+            if components == 1:
+                break
+        return [find(i) for i in range(n)]
+
+    def _sweep_axis(self) -> int:
+        """Axis along which the boxes of a non-empty set overlap least."""
+        return _least_overlap_axis(self._boxes, self._bbox_lo, self._bbox_hi)
 
     def minkowski_sum(
         self, other: Union["BoxSet", Box, Interval, IntervalSet, Sequence[float], float]
@@ -926,9 +2217,35 @@ class BoxSet:
         if self.is_empty():
             return self
 
+        if isinstance(other, (list, tuple)) and not all(
+            isinstance(x, (int, float)) for x in other
+        ):
+            # Per-axis summands such as Intervals make up a structuring box
+            other = Box([x if isinstance(x, Interval) else Point(x) for x in other])
+
         if isinstance(other, (int, float, list, tuple)):
-            # Shift all boxes
-            return BoxSet([box.minkowski_sum(other) for box in self._boxes])
+            shifted = [box.minkowski_sum(other) for box in self._boxes]
+            shift = (
+                other
+                if isinstance(other, (list, tuple))
+                else [other] * self._boxes[0]._dimension
+            )
+            if _shift_keeps_order(self._boxes, shift):
+                # Every bound comparison comes out as before, so the shifted
+                # boxes are still disjoint (a rounded empty one is dropped)
+                return BoxSet._from_disjoint(shifted)
+            # Rounding merged distinct bounds: the shifted boxes may now meet
+            return BoxSet(shifted)
+
+        # A single structuring box dilates every component directly; the
+        # constructor then merges the (possibly overlapping) results once.
+        if isinstance(other, (Box, Interval)):
+            if other.is_empty():
+                return BoxSet()
+            if isinstance(other, Interval):
+                other = Box([other])
+            self._check_summand(other)
+            return BoxSet([b_a._plus(other) for b_a in self._boxes])
 
         if not isinstance(other, BoxSet):
             other = BoxSet([other])  # type: ignore
@@ -936,12 +2253,24 @@ class BoxSet:
         if other.is_empty():
             return other
 
-        # Pairwise sums of boxes
-        results = []
+        # Pairwise sums of boxes, validated once for the whole cross product.
+        # Regular layouts produce the same sum from many pairs; a repeat adds
+        # nothing to the union, so only the first one is normalized.
+        self._check_summand(other)
+        others = other._boxes
+        sums: Dict[Tuple[Tuple[float, ...], Tuple[float, ...], int], Box] = {}
         for b_a in self._boxes:
-            for b_b in other.boxes:
-                results.append(b_a.minkowski_sum(b_b))
-        return BoxSet(results)
+            for b_b in others:
+                box = b_a._plus(b_b)
+                sums.setdefault((box._lo, box._hi, box._closed), box)
+        return BoxSet(sums.values())
+
+    def _check_summand(self, other: Union[Box, "BoxSet"]) -> None:
+        """Raise ValueError unless ``other`` has the dimension of this set."""
+        if other.dimension != self._dimension:
+            raise ValueError(
+                f"Box dimension {other.dimension} must match {self._dimension}"
+            )
 
     def minkowski_difference(
         self, other: Union["BoxSet", Box, Interval, IntervalSet]
@@ -961,12 +2290,8 @@ class BoxSet:
             if isinstance(other, Interval):
                 other = Box([other])
 
-            results = []
-            for b_a in self._boxes:
-                res = b_a.minkowski_difference(other)
-                if not res.is_empty():
-                    results.append(res)
-            return BoxSet(results)
+            self._check_summand(other)
+            return BoxSet._from_disjoint(self._erode_by_box(other))
 
         if isinstance(other, IntervalSet):
             other = BoxSet([other])
@@ -979,14 +2304,33 @@ class BoxSet:
         if other.is_empty():
             return BoxSet()
 
-        # Intersection of erosions by each component box
-        current_res: "BoxSet" = self
-        for b_b in other.boxes:
-            res_b = self.minkowski_difference(b_b)
-            current_res = current_res & res_b  # type: ignore
-            if current_res.is_empty():
+        # Intersection of erosions by each component box, folded over plain
+        # box lists swept along one axis; the set is only built at the end.
+        # The fold starts from the first erosion, not from A: unless B holds
+        # the origin, A - B need not lie inside A.
+        self._check_summand(other)
+        axis = self._sweep_axis()
+        first, *rest = other._boxes
+        current = self._erode_by_box(first)
+        for b_b in rest:
+            if not current:
                 break
-        return current_res
+            current = _sweep_intersection(current, self._erode_by_box(b_b), axis)
+        return BoxSet._from_disjoint(current)
+
+    def _erode_by_box(self, box: Box) -> List[Box]:
+        """
+        Erode every component by a non-empty box of this dimension, unchecked.
+
+        Returns the non-empty eroded components. They are disjoint: x + B
+        inside A_i rules out x + B inside any other A_j.
+        """
+        eroded = []
+        for b_a in self._boxes:
+            res = b_a._minus(box)
+            if res is not None:
+                eroded.append(res)
+        return eroded
 
     def dilate(
         self, other: Union["BoxSet", Box, Interval, IntervalSet, Sequence[float], float]
@@ -1005,10 +2349,31 @@ class BoxSet:
         """
         if epsilon == 0:
             return self
-        dim = self._dimension or 1
-        ebit = Interval.closed(-epsilon, epsilon)
-        ebox = Box([ebit] * dim)
-        return self.dilate(ebox)
+        if epsilon > 0 and epsilon < self._absorbed_epsilon():
+            return self
+        # Boxes are immutable, so the structuring box is built once per
+        # (epsilon, dimension) and reused by repeated dilations
+        return self.dilate(_epsilon_box(epsilon, self._dimension or 1))
+
+    def _absorbed_epsilon(self) -> float:
+        """
+        Bound on the offsets that every box bound absorbs when rounded.
+
+        Any ``0 <= e`` below it gives ``v - e == v == v + e`` for each bound
+        ``v``: a quarter of the spacing between floats at the smallest finite
+        bound magnitude (the spacing just below a power of two is half the
+        one above it). Dilating by such an epsilon reproduces every box, so
+        the result is exactly this set.
+        """
+        finite = [
+            abs(v)
+            for box in self._boxes
+            for v in box._lo + box._hi
+            if abs(v) < math.inf
+        ]
+        if not finite:
+            return math.inf
+        return math.ulp(min(finite)) / 4
 
     def __add__(
         self, other: Union["BoxSet", Box, Interval, IntervalSet, Sequence[float], float]
@@ -1023,6 +2388,23 @@ class BoxSet:
         Compute the morphological opening of this set by another.
         Opening(A, B) = dilation(erosion(A, B), B)
         """
+        if isinstance(other, (Box, Interval)) and not (
+            self.is_empty() or other.is_empty()
+        ):
+            struct = Box([other]) if isinstance(other, Interval) else other
+            self._check_summand(struct)
+            # Each A_i eroded and dilated again stays inside A_i, so the
+            # pieces are disjoint: both steps run box by box in one pass,
+            # without building the eroded set in between. Rounding in
+            # (a - b) + b can overshoot A_i by an ulp, into a neighbour
+            # touching it with an open bound, so each piece is clipped to A_i.
+            clip = _intersection_kernel(self._dimension)
+            pieces = []
+            for b_a in self._boxes:
+                eroded = b_a._minus(struct)
+                if eroded is not None:
+                    pieces.append(clip(eroded._plus(struct), b_a))
+            return BoxSet._from_disjoint([p for p in pieces if p is not None])
         return self.erode(other).dilate(other)
 
     def closing(self, other: Union["BoxSet", Box, Interval, IntervalSet]) -> "BoxSet":
@@ -1042,13 +2424,30 @@ class BoxSet:
             return True
         if self._dimension != other._dimension:
             return False
+        # Cheap necessary conditions first: equal regions have the same
+        # bounding box and (up to rounding of the tiling) the same volume.
+        if self._bbox_lo != other._bbox_lo or self._bbox_hi != other._bbox_hi:
+            return False
+        vol_a, vol_b = self._volume, other._volume
+        if (
+            math.isfinite(vol_a)
+            and math.isfinite(vol_b)
+            and not math.isclose(vol_a, vol_b, rel_tol=1e-9)
+        ):
+            return False
+        # The same tiling is the same region
+        if len(self._boxes) == len(other._boxes) and set(self._boxes) == set(
+            other._boxes
+        ):
+            return True
         # Disjoint boxes equality is tricky if they are not canonical.
         # But our add() ensures disjointness.
         # However, same region can be tiled differently.
-        # For strict equality, we'd need canonical form.
-        # For now, let's at least handle the easy case and volume check.
-        # Better: A == B iff (A - B) is empty and (B - A) is empty.
-        return (self - other).is_empty() and (other - self).is_empty()
+        # A == B iff every box of A is covered by B and vice versa, which
+        # stops at the first uncovered box instead of building A - B, B - A.
+        return all(map(other._covers, self._boxes)) and all(
+            map(self._covers, other._boxes)
+        )
 
     def __repr__(self) -> str:
         return f"BoxSet(dim={self._dimension}, boxes={len(self._boxes)})"
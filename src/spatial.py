@@ -2,7 +2,9 @@
 Generic R-tree implementation for spatial indexing.
 """
 
-from typing import List, Optional, Tuple, Union, TypeVar, Generic, Callable
+import heapq
+import math
+from typing import Iterable, List, Optional, Tuple, Union, TypeVar, Generic, Callable
 
 T = TypeVar("T")
 # MBR Type: expected to have a .volume() method and a .overlaps(other) method
@@ -13,6 +15,8 @@ MBR = TypeVar("MBR")
 class RTreeNode(Generic[T, MBR]):
     """A node in the R-tree."""
 
+    __slots__ = ("max_entries", "is_leaf", "children", "mbr", "parent")
+
     def __init__(self, max_entries: int, is_leaf: bool = False):
         self.max_entries = max_entries
         self.is_leaf = is_leaf
@@ -47,7 +51,11 @@ class RTreeNode(Generic[T, MBR]):
 class RTree(Generic[T, MBR]):
     """
     R-tree spatial index for fast intersection and containment queries.
-    Implemented with Quadratic Split algorithm.
+    Overflowing nodes are split with Guttman's quadratic split by default;
+    ``split="linear"`` uses his linear variant instead, which picks the
+    seeds and places the other children in O(k) callback calls rather than
+    O(k^2) in the fanout and suits large ``max_entries``. Both only go
+    through the MBR callbacks.
     """
 
     def __init__(
@@ -58,13 +66,17 @@ class RTree(Generic[T, MBR]):
         overlaps_func: Callable[[MBR, MBR], bool],
         min_entries: int = 2,
         max_entries: int = 4,
+        split: str = "quadratic",
     ):
+        if split not in ("quadratic", "linear"):
+            raise ValueError(f"Unknown split method: {split}")
         self.get_mbr = get_mbr_func
         self.expand_mbr = expand_mbr_func
         self.get_volume = get_volume_func
         self.overlaps = overlaps_func
         self.min_entries = min_entries
         self.max_entries = max_entries
+        self.split = split
         self.root: RTreeNode[T, MBR] = RTreeNode(max_entries, is_leaf=True)
 
     def insert(self, item: T) -> None:
@@ -78,59 +90,120 @@ class RTree(Generic[T, MBR]):
         else:
             self._adjust_tree(leaf)
 
-    def _choose_leaf(self, node: RTreeNode[T, MBR], item_mbr: MBR) -> RTreeNode[T, MBR]:
-        """Choose the leaf node where a new item should be inserted."""
-        if node.is_leaf:
-            return node
-
-        best_child: Optional[RTreeNode[T, MBR]] = None
-        min_enlargement = float("inf")
-        min_area = float("inf")
-
-        for child in node.children:
-            # Type guard for internal nodes
-            if not isinstance(child, RTreeNode):
-                continue
+    def bulk_load(self, items: List[T]) -> None:
+        """
+        Replace the contents of the tree with ``items``, packed bottom-up.
+
+        Consecutive runs of ``items`` become the leaves and consecutive runs
+        of nodes their parents, so a spatially sorted input (e.g. along a
+        Hilbert curve) yields tight, non-overlapping nodes without paying
+        for one insertion and split per item. Nodes hold at most
+        ``max_entries`` children and runs are balanced so no node is left
+        with a single child when it can be avoided.
+        """
+        self.root = RTreeNode(self.max_entries, is_leaf=True)
+        level: List[Union[RTreeNode[T, MBR], T]] = list(items)
+        if not level:
+            return
 
-            area_before = self.get_volume(child.mbr) if child.mbr is not None else 0.0
+        is_leaf = True
+        while True:
+            groups = -(-len(level) // self.max_entries)
+            size, extra = divmod(len(level), groups)
+            nodes: List[Union[RTreeNode[T, MBR], T]] = []
+            start = 0
+            for g in range(groups):
+                end = start + size + (g < extra)
+                node: RTreeNode[T, MBR] = RTreeNode(self.max_entries, is_leaf=is_leaf)
+                for child in level[start:end]:
+                    node.add_child(child, self.get_mbr(child), self.expand_mbr)
+                nodes.append(node)
+                start = end
+            if len(nodes) == 1:
+                self.root = nodes[0]  # type: ignore
+                return
+            level = nodes
+            is_leaf = False
 
-            # Temporary enlargement
-            new_mbr = self.expand_mbr(child.mbr, item_mbr)
-            area_after = self.get_volume(new_mbr)
+    def _choose_leaf(self, node: RTreeNode[T, MBR], item_mbr: MBR) -> RTreeNode[T, MBR]:
+        """Choose the leaf node where a new item should be inserted."""
+        expand, volume = self.expand_mbr, self.get_volume
 
+        def cost(child: RTreeNode[T, MBR]) -> Tuple[float, float, int]:
+            # Least enlargement, then least area, then fewest children
+            area_before = volume(child.mbr) if child.mbr is not None else 0.0
+            area_after = volume(expand(child.mbr, item_mbr))
             enlargement = area_after - area_before
+            if math.isnan(enlargement):
+                # inf - inf for unbounded boxes ranks after any finite growth
+                enlargement = math.inf
+            return (enlargement, area_after, len(child.children))
 
-            if enlargement < min_enlargement:
-                min_enlargement = enlargement
-                min_area = area_after
-                best_child = child
-            elif enlargement == min_enlargement:
-                if area_after < min_area:
-                    min_area = area_after
-                    best_child = child
-                elif area_after == min_area:
-                    if len(child.children) < len(best_child.children):  # type: ignore
-                        best_child = child
-
-        if best_child is None:  # Should not happen if tree is valid
-            return node
-
-        return self._choose_leaf(best_child, item_mbr)
+        while not node.is_leaf:
+            # Type guard for internal nodes
+            children = [c for c in node.children if isinstance(c, RTreeNode)]
+            if not children:  # Should not happen if tree is valid
+                return node
+            node = min(children, key=cost)
+        return node
 
     def _adjust_tree(self, node: RTreeNode[T, MBR]) -> None:
         """Propagate MBR changes up to the root."""
-        node.recalculate_mbr(self.get_mbr, self.expand_mbr)
-        if node.parent:
-            self._adjust_tree(node.parent)
+        current: Optional[RTreeNode[T, MBR]] = node
+        while current is not None:
+            current.recalculate_mbr(self.get_mbr, self.expand_mbr)
+            current = current.parent
 
     def _split_node(self, node: RTreeNode[T, MBR]) -> None:
-        """Split a node that exceeds max_entries using Quadratic Split."""
+        """
+        Split a node that exceeds max_entries with the configured split.
+
+        Overflowing ancestors are split in turn on the way up, iteratively.
+        """
+        while True:
+            group1, group2 = self._redistribute(node)
+
+            # Update hierarchy
+            if node == self.root:
+                new_root: RTreeNode[T, MBR] = RTreeNode(self.max_entries, is_leaf=False)
+                new_root.add_child(group1, group1.mbr, self.expand_mbr)  # type: ignore
+                new_root.add_child(group2, group2.mbr, self.expand_mbr)  # type: ignore
+                self.root = new_root
+                return
+
+            parent = node.parent
+            if parent is None:
+                return
+            parent.children.remove(node)
+            parent.add_child(group1, group1.mbr, self.expand_mbr)  # type: ignore
+            parent.add_child(group2, group2.mbr, self.expand_mbr)  # type: ignore
+
+            if len(parent.children) <= self.max_entries:
+                self._adjust_tree(parent)
+                return
+            node = parent
+
+    def _redistribute(
+        self, node: RTreeNode[T, MBR]
+    ) -> Tuple[RTreeNode[T, MBR], RTreeNode[T, MBR]]:
+        """
+        Move the children of ``node`` into two new sibling nodes.
+
+        The quadratic split weighs every pair for the seeds and takes the
+        most decided child next; the linear split picks its seeds in two
+        passes and places the others in their stored order.
+        """
+        linear = self.split == "linear"
         # 1. Pick seeds
-        c1, c2 = self._pick_seeds(node.children)
+        if linear:
+            c1, c2 = self._pick_linear_seeds(node.children)
+        else:
+            c1, c2 = self._pick_seeds(node.children)
 
-        # 2. Redistribute
-        node.children.remove(c1)
-        node.children.remove(c2)
+        # 2. Redistribute the rest, kept by identity so taking one is O(1)
+        pool = {id(c): c for c in node.children}
+        del pool[id(c1)], pool[id(c2)]
+        node.children = []
 
         group1: RTreeNode[T, MBR] = RTreeNode(self.max_entries, is_leaf=node.is_leaf)
         group2: RTreeNode[T, MBR] = RTreeNode(self.max_entries, is_leaf=node.is_leaf)
@@ -138,21 +211,22 @@ class RTree(Generic[T, MBR]):
         group1.add_child(c1, self.get_mbr(c1), self.expand_mbr)
         group2.add_child(c2, self.get_mbr(c2), self.expand_mbr)
 
-        while node.children:
-            if len(group1.children) + len(node.children) == self.min_entries:
-                for c in list(node.children):
+        while pool:
+            if len(group1.children) + len(pool) == self.min_entries:
+                for c in pool.values():
                     group1.add_child(c, self.get_mbr(c), self.expand_mbr)
-                    node.children.remove(c)
                 break
-            if len(group2.children) + len(node.children) == self.min_entries:
-                for c in list(node.children):
+            if len(group2.children) + len(pool) == self.min_entries:
+                for c in pool.values():
                     group2.add_child(c, self.get_mbr(c), self.expand_mbr)
-                    node.children.remove(c)
                 break
 
             # Pick next child to add
-            child = self._pick_next(node.children, group1.mbr, group2.mbr)  # type: ignore
-            node.children.remove(child)
+            if linear:
+                child = next(iter(pool.values()))
+            else:
+                child = self._pick_next(pool.values(), group1.mbr, group2.mbr)  # type: ignore
+            del pool[id(child)]
 
             # Add to group with less enlargement
             area1 = self.get_volume(group1.mbr) if group1.mbr is not None else 0.0  # type: ignore
@@ -181,23 +255,7 @@ class RTree(Generic[T, MBR]):
                     else:
                         group2.add_child(child, mbr_c, self.expand_mbr)
 
-        # 3. Update hierarchy
-        if node == self.root:
-            new_root: RTreeNode[T, MBR] = RTreeNode(self.max_entries, is_leaf=False)
-            new_root.add_child(group1, group1.mbr, self.expand_mbr)  # type: ignore
-            new_root.add_child(group2, group2.mbr, self.expand_mbr)  # type: ignore
-            self.root = new_root
-        else:
-            parent = node.parent
-            if parent is not None:
-                parent.children.remove(node)
-                parent.add_child(group1, group1.mbr, self.expand_mbr)  # type: ignore
-                parent.add_child(group2, group2.mbr, self.expand_mbr)  # type: ignore
-
-                if len(parent.children) > self.max_entries:
-                    self._split_node(parent)
-                else:
-                    self._adjust_tree(parent)
+        return group1, group2
 
     def _pick_seeds(
         self, children: List[Union[RTreeNode[T, MBR], T]]
@@ -205,37 +263,59 @@ class RTree(Generic[T, MBR]):
         max_waste = -1.0
         seed1, seed2 = children[0], children[1]
 
-        for i in range(len(children)):
+        # Each child's MBR and volume are looked up once, not once per pair
+        expand, volume = self.expand_mbr, self.get_volume
+        mbrs = [self.get_mbr(child) for child in children]
+        volumes = [volume(m) for m in mbrs]
+        for i, (m1, v1) in enumerate(zip(mbrs, volumes)):
             for j in range(i + 1, len(children)):
-                m1 = self.get_mbr(children[i])
-                m2 = self.get_mbr(children[j])
-
-                combined = self.expand_mbr(m1, m2)
-                waste = (
-                    self.get_volume(combined)
-                    - self.get_volume(m1)
-                    - self.get_volume(m2)
-                )
+                waste = volume(expand(m1, mbrs[j])) - v1 - volumes[j]
 
                 if waste > max_waste:
                     max_waste = waste
                     seed1, seed2 = children[i], children[j]
         return seed1, seed2
 
+    def _pick_linear_seeds(
+        self, children: List[Union[RTreeNode[T, MBR], T]]
+    ) -> Tuple[Union[RTreeNode[T, MBR], T], Union[RTreeNode[T, MBR], T]]:
+        """
+        Pick two far apart seeds in two linear passes.
+
+        The callbacks expose no coordinates, so instead of Guttman's
+        per-axis separation the first seed is the child wasting the most
+        volume when joined with the first child, and the second the one
+        wasting the most when joined with the first seed.
+        """
+        expand, volume = self.expand_mbr, self.get_volume
+        mbrs = [self.get_mbr(child) for child in children]
+        volumes = [volume(m) for m in mbrs]
+
+        def farthest(i: int) -> int:
+            # Unbounded MBRs can waste nan: fall back to any other child
+            best, max_waste = (1 if i == 0 else 0), -math.inf
+            for j, (m, v) in enumerate(zip(mbrs, volumes)):
+                if j != i:
+                    waste = volume(expand(mbrs[i], m)) - volumes[i] - v
+                    if waste > max_waste:
+                        best, max_waste = j, waste
+            return best
+
+        seed1 = farthest(0)
+        return children[seed1], children[farthest(seed1)]
+
     def _pick_next(
-        self, children: List[Union[RTreeNode[T, MBR], T]], mbr1: MBR, mbr2: MBR
+        self, children: Iterable[Union[RTreeNode[T, MBR], T]], mbr1: MBR, mbr2: MBR
     ) -> Union[RTreeNode[T, MBR], T]:
         max_diff = -1.0
-        best_child = children[0]
+        best_child = next(iter(children))
 
+        get_mbr, expand, volume = self.get_mbr, self.expand_mbr, self.get_volume
+        area1, area2 = volume(mbr1), volume(mbr2)
         for child in children:
-            m = self.get_mbr(child)
-
-            new_m1 = self.expand_mbr(mbr1, m)
-            d1 = self.get_volume(new_m1) - self.get_volume(mbr1)
-
-            new_m2 = self.expand_mbr(mbr2, m)
-            d2 = self.get_volume(new_m2) - self.get_volume(mbr2)
+            m = get_mbr(child)
+            d1 = volume(expand(mbr1, m)) - area1
+            d2 = volume(expand(mbr2, m)) - area2
 
             diff = abs(d1 - d2)
             if diff > max_diff:
@@ -246,23 +326,84 @@ class RTree(Generic[T, MBR]):
     def search(self, query_mbr: MBR) -> List[T]:
         """Find all items whose MBR overlaps with the query MBR."""
         results: List[T] = []
-        if self.root.mbr is None:
+        if self.root.mbr is None or not self.overlaps(self.root.mbr, query_mbr):
             return results
-        self._search_recursive(self.root, query_mbr, results)
-        return results
 
-    def _search_recursive(
-        self, node: RTreeNode[T, MBR], query_mbr: MBR, results: List[T]
-    ) -> None:
-        if node.mbr is None or not self.overlaps(node.mbr, query_mbr):
-            return
+        # Depth-first over an explicit stack; children are pushed in reverse
+        # so the items come out in tree order. Nodes carry their MBR, so
+        # get_mbr is only called on the items.
+        get_mbr, overlaps = self.get_mbr, self.overlaps
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                for child in node.children:
+                    if overlaps(get_mbr(child), query_mbr):  # type: ignore
+                        results.append(child)  # type: ignore
+            else:
+                for child in reversed(node.children):
+                    if isinstance(child, RTreeNode) and overlaps(
+                        child.mbr, query_mbr  # type: ignore
+                    ):
+                        stack.append(child)
+        return results
 
-        if node.is_leaf:
-            for child in node.children:
-                item_mbr = self.get_mbr(child)  # type: ignore
-                if self.overlaps(item_mbr, query_mbr):
-                    results.append(child)  # type: ignore
-        else:
+    def find(self, test: Callable[[MBR], bool]) -> Optional[T]:
+        """
+        Return an item whose MBR passes ``test``, or None if none does.
+
+        ``test`` must also pass for every MBR enclosing a passing one (a point
+        lying inside, say), so subtrees failing it are skipped. The search
+        stops at the first match instead of collecting all of them.
+        """
+        if self.root.mbr is None or not test(self.root.mbr):
+            return None
+        get_mbr = self.get_mbr
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                for child in node.children:
+                    if test(get_mbr(child)):  # type: ignore
+                        return child  # type: ignore
+            else:
+                for child in node.children:
+                    if isinstance(child, RTreeNode) and test(child.mbr):  # type: ignore
+                        stack.append(child)
+        return None
+
+    def nearest(
+        self, distance_func: Callable[[MBR], float], bound: float = float("inf")
+    ) -> Tuple[Optional[T], float]:
+        """
+        Find the item closest to a query by best-first branch-and-bound.
+
+        ``distance_func`` maps an MBR to its distance from the query; it must
+        be a lower bound for everything the MBR encloses. Items are measured
+        through their own MBR. Subtrees whose lower bound is not below the
+        best distance so far (or ``bound``) are pruned. Returns
+        ``(None, bound)`` when nothing is closer than ``bound``.
+        """
+        best_item: Optional[T] = None
+        best = bound
+        if self.root.mbr is None:
+            return best_item, best
+
+        # (lower bound, tie-breaker, node) so nodes are never compared
+        heap = [(distance_func(self.root.mbr), 0, self.root)]
+        get_mbr = self.get_mbr
+        counter = 1
+        while heap:
+            d, _, node = heapq.heappop(heap)
+            if d >= best:
+                break
             for child in node.children:
-                if isinstance(child, RTreeNode):
-                    self._search_recursive(child, query_mbr, results)
+                dc = distance_func(get_mbr(child) if node.is_leaf else child.mbr)
+                if dc >= best:
+                    continue
+                if node.is_leaf:
+                    best_item, best = child, dc  # type: ignore
+                else:
+                    heapq.heappush(heap, (dc, counter, child))
+                    counter += 1
+        return best_item, best
@@ -1,7 +1,12 @@
 import pytest
 import math
-from src.intervals import Interval, IntervalSet
-from src.multidimensional import Box, BoxSet
+from src.intervals import Interval, IntervalSet, Point
+from src.multidimensional import (
+    Box,
+    BoxSet,
+    _akl_toussaint_filter,
+    _hull_diameter_2d,
+)
 
 
 class TestAnalysis1D:
@@ -126,6 +131,81 @@ class TestAnalysisND:
         s_2d_empty._dimension = 2
         assert s_2d_empty.convex_hull().dimension == 2
 
+    def test_set_hull_and_diameter_cached_until_add(self):
+        s = BoxSet([Box([Interval(0, 1), Interval(0, 1)])])
+        hull = s.convex_hull()
+        assert s.convex_hull() is hull
+        assert s.diameter() == s.diameter() == math.sqrt(2)
+
+        s.add(Box([Interval(2, 3), Interval(0, 1)]))
+        assert s.convex_hull() == Box([Interval(0, 3), Interval(0, 1)])
+        assert s.diameter() == math.sqrt(10)
+
+    def test_set_diameter_non_convex(self):
+        # Plus shape: the bounding-box diagonal (sqrt(200)) is never attained
+        plus = BoxSet(
+            [
+                Box([Interval(0, 10), Interval(4, 6)]),
+                Box([Interval(4, 6), Interval(0, 10)]),
+            ]
+        )
+        assert plus.diameter() == pytest.approx(math.sqrt(10**2 + 2**2))
+
+        # Collinear corners along one axis
+        row = BoxSet(
+            [
+                Box([Interval(0, 1), Interval.point(0)]),
+                Box([Interval(3, 4), Interval.point(0)]),
+            ]
+        )
+        assert row.diameter() == 4.0
+        # Many collinear corners: the extreme polygon degenerates to a segment
+        segments = BoxSet(
+            [Box([Interval(3 * i, 3 * i + 1), Interval.point(0)]) for i in range(3)]
+        )
+        assert segments.diameter() == 7.0
+
+        # Grid of cells: interior corners are discarded before the hull
+        cells = [(x, y) for x in range(4) for y in range(4)]
+        survivors = _akl_toussaint_filter([(float(x), float(y)) for x, y in cells])
+        assert (1.0, 1.0) not in survivors
+        assert (0.0, 0.0) in survivors and (3.0, 3.0) in survivors
+
+        # Two isolated points
+        dots = BoxSet([Box([Point(0), Point(0)]), Box([Point(3), Point(4)])])
+        assert dots.diameter() == 5.0
+        assert _hull_diameter_2d([(1.0, 1.0)]) == 0.0
+
+        # 1D and 3D compare the farthest corners of every pair of boxes
+        assert BoxSet([Box([Interval(0, 1)]), Box([Interval(5, 7)])]).diameter() == 7.0
+        cubes = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(3, 4), Interval(0, 1), Interval(0, 1)]),
+            ]
+        )
+        assert cubes.diameter() == math.sqrt(4**2 + 1 + 1)
+        # Boxes far from the corners of the bounding box are never paired
+        triangle = BoxSet(
+            [Box([Point(x), Point(y), Point(0)]) for x, y in [(0, 0), (2, 1), (1, 2)]]
+        )
+        assert triangle.diameter() == math.sqrt(5)
+        # ...but every box of a diamond reaches beyond its diameter
+        diamond = BoxSet(
+            [
+                Box([Point(x), Point(y), Point(0)])
+                for x, y in [(1, 0), (0, 1), (2, 1), (1, 2)]
+            ]
+        )
+        assert diamond.diameter() == 2.0
+
+        # A single box is its own diameter
+        assert BoxSet([Box([Interval(0, 3), Interval(0, 4)])]).diameter() == 5.0
+
+        # Unbounded sets have infinite diameter
+        ray = BoxSet([Box([Interval(0, 1)]), Box([Interval(5, float("inf"))])])
+        assert ray.diameter() == float("inf")
+
     def test_properties_nd(self):
         # Boundedness
         b = Box([Interval(0, 1), Interval(0, 1)])
@@ -146,6 +226,15 @@ class TestAnalysisND:
         assert b_closed.is_compact()
         assert not b_open.is_compact()
 
+        # Decided on the bound columns: infinite ends are open, degenerate
+        # axes have an empty interior, empty boxes are neither
+        half = Box([Interval(float("-inf"), 1), Interval(0, float("inf"))])
+        assert half.is_closed() and not half.is_open() and not half.is_compact()
+        assert not Box([Interval(0, 1, open_end=True), Interval(0, 1)]).is_closed()
+        assert not Box([Interval.open(0, 1), Point(1)]).is_open()
+        assert not Box.empty(2).is_open() and not Box.empty(2).is_closed()
+        assert Box.empty(2).is_bounded()
+
         # BoxSet properties
         s = BoxSet([b_closed])
         assert s.is_closed()
@@ -182,6 +271,12 @@ class TestAnalysisND:
         b2 = Box([Interval(0, 1)])
         assert b1.distance(b2) == 4.0
 
+        # Bounds touching with both ends open are still at distance 0
+        left = Box([Interval(0, 1, open_end=True), Interval(0, 1)])
+        right = Box([Interval(1, 2, open_start=True), Interval(0, 1)])
+        assert left.distance(right) == 0.0
+        assert right.distance(left) == 0.0
+
         # distance with empty
         assert Box.empty(1).distance(b1) == float("inf")
         assert BoxSet().distance(BoxSet()) == float("inf")
@@ -194,3 +289,31 @@ class TestAnalysisND:
         # dimension check in distance
         with pytest.raises(ValueError):
             b1.distance(Box([Interval(0, 1), Interval(0, 1)]))
+
+    def test_set_distance_linear_scan(self):
+        # Below the indexing threshold distances come from the bound columns
+        row = BoxSet(
+            [Box([Interval(2 * x, 2 * x + 1), Interval(0, 1)]) for x in range(5)]
+        )
+        top = BoxSet(
+            [Box([Interval(2 * x, 2 * x + 1), Interval(5, 6)]) for x in range(5)]
+        )
+        assert row._index is None and top._index is None
+
+        assert row.distance(top) == 4.0
+        assert row.distance(row) == 0.0
+        assert row.distance_to_point((2.5, 4)) == 3.0
+        assert row.distance_to_point((0.5, 0.5)) == 0.0
+        # Right of the last box: (10 - 9, 2 - 1) -> sqrt(2)
+        assert row.distance_to_point((10, 2)) == math.sqrt(2)
+
+        with pytest.raises(ValueError, match="Dimension mismatch"):
+            row.distance(BoxSet([Box([Interval(0, 1)])]))
+        with pytest.raises(ValueError, match="Dimension mismatch"):
+            row.distance_to_point((1,))
+
+        # Boxes farther from the bounding box of the other side than the
+        # best pair so far are skipped without scanning their row
+        corner = BoxSet([Box([Interval(9, 10), Interval(7, 8)])])
+        assert row.distance(corner) == 6.0
+        assert corner.distance(row) == 6.0
@@ -1,5 +1,5 @@
 import pytest
-from src.intervals import Interval, IntervalSet
+from src.intervals import Interval, IntervalSet, Point
 from src.multidimensional import Box, BoxSet
 
 
@@ -80,6 +80,212 @@ class TestBoxSet:
         with pytest.raises(ValueError, match="match BoxSet dimension"):
             r.contains((2.5, 2.5))
 
+    def test_contains_open_boundary(self):
+        r = BoxSet([Box([Interval(0, 5, open_end=True), Interval(0, 5)])])
+        assert r.contains((0, 5))
+        assert not r.contains((5, 2))
+
+    def test_contains_many(self):
+        r = BoxSet(
+            [
+                Box([Interval(0, 2, open_end=True)]),
+                Box([Interval(2, 3, open_start=True)]),
+                Box([Interval(5, 8)]),
+            ]
+        )
+        pts = [(-1,), (0,), (2,), (2.5,), (4,), (8,), (9,)]
+        assert r.contains_many(pts) == [r.contains(p) for p in pts]
+        assert r.contains_many(pts) == [False, True, False, True, False, True, False]
+
+        with pytest.raises(ValueError, match="match BoxSet dimension"):
+            r.contains_many([(1, 1)])
+
+        # The sorted view behind 1D lookups follows additions
+        r.add(Box([Interval(-3, -1)]))
+        assert r.contains((-1,)) and r.contains_many(pts)[0]
+
+        r2 = BoxSet([Box([Interval(0, 5), Interval(0, 5)])])
+        assert r2.contains_many([(1, 1), (6, 1)]) == [True, False]
+        assert BoxSet().contains_many([(0,), (1,)]) == [False, False]
+
+    def test_1d_ops_use_interval_sweep(self):
+        a = BoxSet([Box([Interval(0, 2)]), Box([Interval(4, 6)])])
+        b = BoxSet([Box([Interval(1, 5)])])
+        diff = a - b
+        assert diff == BoxSet(
+            [
+                Box([Interval(0, 1, open_end=True)]),
+                Box([Interval(5, 6, open_start=True)]),
+            ]
+        )
+        assert diff._dimension == 1 and diff.volume() == 2.0
+        assert (a & b).volume() == 2.0
+        assert (a & Box([Interval(2, 4)])).boxes == [
+            Box([Interval(2, 2)]),
+            Box([Interval(4, 4)]),
+        ]
+        assert (a - a).is_empty()
+        assert (a - a).dimension is None
+        assert (a | b).boxes == [Box([Interval(0, 6)])]
+        assert (a | BoxSet()).boxes == a.boxes
+
+    def test_1d_broad_phase_bisects_sorted_starts(self):
+        s = BoxSet([Box([Interval(2 * i, 2 * i + 1)]) for i in range(12)])
+        assert s.contains((0,))  # builds the sorted view
+        s.add(Box([Interval(-2, 0.5)]))
+        s.add(Box([Point(30)]))
+        s.add(Box([Interval(30, 31, open_start=True)]))
+        ordered, starts = s._ordered
+        assert ordered == sorted(s.boxes, key=lambda b: (b._lo, b._hi))
+        assert starts == [b._lo[0] for b in ordered]
+
+        assert s._candidates(Box([Interval(3, 6)])) == [
+            Box([Interval(2, 3)]),
+            Box([Interval(4, 5)]),
+            Box([Interval(6, 7)]),
+        ]
+        assert s._candidates(Box([Interval(1.5, 1.8)])) == []
+        assert s._candidates(Box([Interval(30.5, 40)])) == [
+            Box([Interval(30, 31, open_start=True)])
+        ]
+        assert s.contains(Box([Interval(-2, 1)]))
+        assert not s.contains(Box([Interval(4, 6)]))
+        assert s.overlaps(Box([Interval(1, 2, open_start=True)]))
+        assert not s.overlaps(Box([Interval(1, 2, open_start=True, open_end=True)]))
+        assert s._rtree is None
+
+    def test_init_orders_boxes(self):
+        boxes = [
+            Box([Interval(2, 3), Interval(0, 1)]),
+            Box([Interval(0, 1), Interval(5, 6)]),
+            Box([Interval(0, 1), Interval(0, 1)]),
+        ]
+        expected = [boxes[2], boxes[1], boxes[0]]
+        assert BoxSet(boxes).boxes == expected
+        assert BoxSet(reversed(boxes)).boxes == expected
+
+    def test_init_slices_only_overlapping_boxes(self):
+        # Two chains of three overlapping boxes among boxes meeting nothing
+        chain = [Box([Interval(i, i + 2), Interval(0, 1)]) for i in range(3)]
+        other = [Box([Interval(i, i + 2), Interval(5, 6)]) for i in range(3)]
+        lone = [
+            Box([Interval(20 + 2 * i, 21 + 2 * i), Interval(0, 1)]) for i in range(8)
+        ]
+        boxes = chain + other + lone + [Box.empty(2)]
+        region = BoxSet(boxes)
+        expected = BoxSet()
+        for b in sorted(boxes, key=lambda b: b._lo):
+            expected.add(b)
+        assert region.boxes == expected.boxes
+        assert region.volume() == 16.0
+        assert region.boxes[-8:] == lone
+
+        with pytest.raises(ValueError, match="Dimension mismatch"):
+            BoxSet([Box([Interval(0, 1)]), Box([Interval(0, 1), Interval(0, 1)])])
+
+    def test_volume_tracks_add(self):
+        r = BoxSet()
+        assert r.volume() == 0.0
+        r.add(Box([Interval(0, 2), Interval(0, 2)]))
+        assert r.volume() == 4.0
+        # Only the non-overlapping fragments of the new box count
+        r.add(Box([Interval(1, 3), Interval(0, 2)]))
+        assert r.volume() == 6.0
+        assert r.volume() == sum(b.volume() for b in r.boxes)
+        assert (r - Box([Interval(0, 1), Interval(0, 1)])).volume() == 5.0
+
+    def test_bounding_box_tracks_add(self):
+        r = BoxSet()
+        assert r._bbox_lo is None and r._bbox_hi is None
+        r.add(Box([Interval(0, 2), Interval(0, 2)]))
+        # Outside the current bounding box: appended as is, without slicing
+        r.add(Box([Interval(5, 6, open_end=True), Interval(-1, 1)]))
+        assert len(r.boxes) == 2
+        assert (r._bbox_lo, r._bbox_hi) == ((0.0, -1.0), (6.0, 2.0))
+        # Touching the bounding box still goes through the overlap checks
+        r.add(Box([Interval(2, 3), Interval(0, 2)]))
+        assert r.volume() == 4.0 + 2.0 + 2.0
+
+        # Sets with separated bounding boxes do not intersect
+        far = BoxSet([Box([Interval(7, 8), Interval(0, 1)])])
+        assert (r & far).is_empty()
+        assert (far & r).is_empty()
+        assert (r & BoxSet()).is_empty()
+
+    def test_from_disjoint_skips_normalization(self):
+        boxes = [
+            Box([Interval(2, 3), Interval(0, 1)]),
+            Box.empty(2),
+            Box([Interval(0, 1), Interval(0, 1)]),
+        ]
+        s = BoxSet._from_disjoint(boxes)
+        assert s.boxes == BoxSet(boxes).boxes == [boxes[2], boxes[0]]
+        assert s.dimension == 2 and s.volume() == 2.0
+        assert BoxSet._from_disjoint([]).is_empty()
+
+        # Set operations hand their disjoint pieces straight through
+        a = BoxSet([Box([Interval(0, 4), Interval(0, 4)])])
+        b = BoxSet([Box([Interval(1, 2), Interval(1, 5)])])
+        assert (a & b).boxes == [Box([Interval(1, 2), Interval(1, 4)])]
+        assert (a - b).volume() == 13.0
+        assert a.interior().boxes == [Box([Interval.open(0, 4), Interval.open(0, 4)])]
+
+    def test_intersection_pairs_on_bound_columns(self):
+        a = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(2, 3), Interval(0, 1)]),
+            ]
+        )
+        b = BoxSet(
+            [
+                Box([Interval(1, 2), Interval(0, 1)]),
+                Box([Interval.open(3, 4), Interval(0, 1)]),
+            ]
+        )
+        # Closed faces meet in degenerate boxes, the open one is dropped
+        res = a & b
+        assert len(res.boxes) == 2
+        assert res.volume() == 0.0
+        assert [1, 0.5] in res and [2, 0.5] in res and [3, 0.5] not in res
+
+    def test_difference_skips_boxes_outside_bbox(self):
+        far = Box([Interval(10, 11), Interval(10, 11)])
+        near = Box([Interval(0, 4), Interval(0, 4)])
+        a = BoxSet([near, far])
+        b = BoxSet(
+            [
+                Box([Interval(1, 2), Interval(1, 2)]),
+                Box([Interval(3, 5), Interval(6, 7)]),
+            ]
+        )
+        res = a - b
+        # The far box is kept whole, the touching neighbour is skipped
+        assert far in res.boxes
+        assert res.volume() == 16.0
+        assert (a - BoxSet()).boxes == a.boxes
+        assert (BoxSet() - b).is_empty()
+
+    def test_contains_except(self):
+        world = BoxSet([Box([Interval(0, 10), Interval(0, 10)])])
+        hole = Box([Interval(2, 4, open_start=True), Interval(2, 4)])
+        for p in [(1, 1), (2, 3), (3, 3), (11, 1)]:
+            assert world.contains_except(p, hole) == (p in world - hole)
+        assert not world.contains_except((3, 3), BoxSet([hole]))
+        line = BoxSet([Box([Interval(0, 10)])])
+        assert line.contains_except((5,), Interval(6, 7))
+        assert not line.contains_except((5,), IntervalSet([Interval(4, 6)]))
+
+    def test_bounds_view_reset_on_add(self):
+        r = BoxSet([Box([Interval(0, 1), Interval(0, 1)])])
+        lo, hi = r._bounds()
+        assert lo == [(0.0, 0.0)] and hi == [(1.0, 1.0)]
+        assert r._bounds()[0] is lo
+        r.add(Box([Interval(2, 3), Interval(0, 1)]))
+        lo, hi = r._bounds()
+        assert lo == [(0.0, 0.0), (2.0, 0.0)]
+        assert hi == [(1.0, 1.0), (3.0, 1.0)]
+
     def test_dimension_property(self):
         r = BoxSet()
         assert r.dimension is None
@@ -93,6 +299,30 @@ class TestBoxSet:
         r.add(invalid_box)
         assert r.is_empty()
 
+    def test_overlaps(self):
+        r = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(5, 6), Interval(5, 6)]),
+            ]
+        )
+        assert r.overlaps(Box([Interval(0.5, 2), Interval(0.5, 2)]))
+        assert r.overlaps(BoxSet([Box([Interval(6, 7), Interval(6, 7)])]))
+        assert not r.overlaps(Box([Interval(2, 4), Interval(2, 4)]))
+        # Touching an open boundary is not a collision
+        assert not r.overlaps(Box([Interval(1, 2, open_start=True), Interval(0, 1)]))
+        assert not r.overlaps(BoxSet())
+        assert not BoxSet().overlaps(r)
+
+        with pytest.raises(ValueError, match="mismatch"):
+            r.overlaps(Box([Interval(0, 1)]))
+
+        # Indexed operand
+        grid = BoxSet([Box([Interval(i, i + 0.5), Interval(0, 1)]) for i in range(12)])
+        assert grid._index is not None
+        assert grid.overlaps(Box([Interval(3.2, 3.3), Interval(0, 1)]))
+        assert not grid.overlaps(Box([Interval(3.6, 3.9), Interval(0, 1)]))
+
     def test_intersection_coercion(self):
         """Cover Line 322: intersection with Box."""
         r = BoxSet([Box([Interval(0, 10)])])
@@ -189,7 +419,86 @@ class TestBoxSet:
         r2 = BoxSet([Box([Interval(5, 10)])])
         res = r1.union(r2)
         assert res.volume() == 10.0
-        assert len(res.boxes) == 2  # Assuming disjoint, normalization logic
+        assert len(res.boxes) == 1  # 1D unions merge through IntervalSet
+
+    def test_add_boxset_carves_in_one_pass(self):
+        a = BoxSet([Box([Interval(0, 2), Interval(0, 2)])])
+        b = BoxSet(
+            [
+                Box([Interval(1, 3), Interval(0, 1)]),
+                Box([Interval(5, 6), Interval(5, 6)]),
+            ]
+        )
+        s = BoxSet()
+        s.add(a)
+        assert s.boxes == a.boxes and s.dimension == 2
+        s.add(b)
+        assert s.volume() == 6.0 and s == a | b
+        assert s.boxes[0] == a.boxes[0]
+
+        # Nothing new to store
+        s.add(BoxSet([Box([Interval(0, 1), Interval(0, 1)])]))
+        assert s.volume() == 6.0 and len(s.boxes) == 3
+        s.add(BoxSet())
+        assert len(s.boxes) == 3
+
+        with pytest.raises(ValueError, match="Dimension mismatch"):
+            s.add(BoxSet([Box([Interval(0, 1)])]))
+
+    def test_contains_box_across_components(self):
+        """A box split over several components is covered piece by piece."""
+        r = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 2)]),
+                Box([Interval(1, 2, open_start=True), Interval(0, 2)]),
+            ]
+        )
+        assert r.contains(Box([Interval(0.5, 1.5), Interval(0, 1)]))
+        assert not r.contains(Box([Interval(0.5, 2.5), Interval(0, 1)]))
+        # Slicing by the first component leaves two fragments, and the
+        # second one only meets one of them
+        tiles = BoxSet(
+            [
+                Box([Interval(0, 1, open_end=True), Interval(0, 1)]),
+                Box([Interval(0, 1, open_end=True), Interval(1, 2, open_start=True)]),
+                Box([Interval(1, 3), Interval(0, 2)]),
+            ]
+        )
+        assert tiles.contains(Box([Interval(0, 3), Interval(0, 2)]))
+        # Cutting out the centre first leaves fragments far from the columns
+        ring = BoxSet(
+            [
+                Box([Interval(1, 2), Interval(1, 2)]),
+                Box([Interval(0, 1), Interval(0, 3)]),
+                Box([Interval(2, 3), Interval(0, 3)]),
+                Box([Interval(1, 2), Interval(0, 1)]),
+                Box([Interval(1, 2), Interval(2, 3)]),
+            ]
+        )
+        assert ring.contains(Box([Interval(0, 3), Interval(0, 3)]))
+        assert not ring.contains(Box([Interval(0, 3), Interval(0, 3.5)]))
+        # Re-tiled regions compare equal without building differences
+        assert r == BoxSet([Box([Interval(0, 2), Interval(0, 2)])])
+        with pytest.raises(ValueError):
+            r.contains(Box([Interval(0, 1)]))
+
+        # Whole sets: emptiness and the dimension are settled up front
+        assert r.contains(tiles & r) and not r.contains(tiles)
+        assert not BoxSet().contains(r)
+        with pytest.raises(ValueError):
+            r.contains(BoxSet([Box([Interval(0, 1)])]))
+        # A box holds a set exactly when it holds the hull of the set
+        assert Box([Interval(0, 2), Interval(0, 2)]).contains(r)
+        assert not Box([Interval(0, 2, open_end=True), Interval(0, 2)]).contains(r)
+
+    def test_union_keeps_own_boxes(self):
+        """The boxes of the left operand are carried over as they are."""
+        boxes = [Box([Interval(i, i + 1), Interval(0, 1)]) for i in range(0, 24, 2)]
+        r = BoxSet(boxes)
+        res = r | Box([Interval(0.5, 2.5), Interval(0, 1)])
+        assert all(any(b is own for own in res.boxes) for b in r.boxes)
+        assert res.volume() == 13.0
+        assert res._index is not None
 
     def test_add_promotion_interval(self):
         """Cover Line 267: Promotion of Interval to Box."""
@@ -224,6 +533,41 @@ class TestBoxSet:
         ):
             s.add("not a box")
 
+    def test_equality_prefilters(self):
+        square = Box([Interval(0, 2), Interval(0, 2)])
+        halves = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 2)]),
+                Box([Interval(1, 2), Interval(0, 2)]),
+            ]
+        )
+        # Same region, different tiling: decided by the set differences
+        assert BoxSet([square]) == halves
+        # Same bounding box, different volume
+        l_shape = BoxSet(
+            [
+                Box([Interval(0, 2), Interval(0, 1)]),
+                Box([Interval(0, 1), Interval(1, 2)]),
+            ]
+        )
+        assert l_shape != halves
+        # Different bounding box
+        assert BoxSet([Box([Interval(0, 2), Interval(0, 3)])]) != halves
+        # Same boxes in another order
+        assert BoxSet(halves.boxes[::-1]) == halves
+        # Only a boundary point differs: volumes agree, the differences do not
+        open_corner = BoxSet([Box([Interval(0, 2, open_end=True), Interval(0, 2)])])
+        assert open_corner != BoxSet([square])
+
+    def test_add_box_subclass(self):
+        class Cell(Box):
+            pass
+
+        s = BoxSet()
+        s.add(Cell([Interval(0, 1), Interval(0, 1)]))
+        s.add(Box([Interval(0.5, 2), Interval(0, 1)]))
+        assert s.volume() == 2.0
+
     def test_init_with_mixed_promotion(self):
         """Test constructor with mixed types."""
         b = Box([Interval(0, 1)])
@@ -281,6 +625,40 @@ class TestBoxSetOperators:
         res = s.symmetric_difference(b)
         assert res.volume() == 10.0
 
+    def test_symmetric_difference_joins_disjoint_halves(self):
+        a = BoxSet([Box([Interval(0, 2), Interval(0, 2)])])
+        b = BoxSet([Box([Interval(1, 3), Interval(1, 3)])])
+        res = a ^ b
+        # Each half is kept as sliced, nothing is re-fragmented
+        assert len(res.boxes) == len((a - b).boxes) + len((b - a).boxes)
+        assert res.volume() == 6.0
+        assert [1.5, 1.5] not in res and [0.5, 0.5] in res and [2.5, 2.5] in res
+        assert (a ^ a).is_empty()
+
+    def test_symmetric_difference_pairs_components_once(self):
+        def grid(offset):
+            return BoxSet(
+                Box([Interval(i + offset, i + offset + 0.5), Interval(0, 1)])
+                for i in range(12)
+            )
+
+        a, b = grid(0), grid(0.25)
+        res = a ^ b
+        assert res.volume() == 6.0
+        assert res == (a - b) | (b - a)
+        points = [[x / 8, 0.5] for x in range(100)]
+        assert [p in res for p in points] == [(p in a) != (p in b) for p in points]
+
+        # Without an index every component is a candidate, touching or not
+        c = BoxSet([Box([Interval(0, 1), Interval(0, 1)])])
+        c.add(Box([Interval(5, 6), Interval(0, 1)]))
+        d = BoxSet([Box([Interval(0.5, 2), Interval(0, 1)])])
+        assert (c ^ d).volume() == (d ^ c).volume() == 2.5
+
+        assert (a ^ BoxSet()).volume() == (BoxSet() ^ a).volume() == 6.0
+        with pytest.raises(ValueError, match="Dimension mismatch"):
+            a ^ Box([Interval(0, 1)])
+
     def test_coverage_gaps(self):
         """Address missing lines in multidimensional.py."""
         # convex_hull no dim (Line 632)
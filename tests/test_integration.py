@@ -96,3 +96,21 @@ class TestMathematicalProperties:
         assert intersection_result.is_empty()
         intersection_result2 = empty & a
         assert intersection_result2.is_empty()
+
+
+class TestPackageImports:
+    """Test the package-level namespace"""
+
+    def test_lazy_multidimensional_exports(self):
+        """Box and BoxSet resolve on first access from the package"""
+        import pytest
+        import src
+        from src.multidimensional import Box, BoxSet
+
+        assert src.Box is Box
+        assert src.BoxSet is BoxSet
+        for name in src.__all__:
+            assert hasattr(src, name)
+        assert set(src.__all__) <= set(dir(src))
+        with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+            src.Nope
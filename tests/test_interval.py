@@ -65,6 +65,11 @@ class TestIntervalCreation:
         right_open = Interval.right_open(1, 5)
         assert not right_open.open_start and right_open.open_end
 
+    def test_no_instance_dict(self):
+        """Intervals and Points are slotted, with no per-instance __dict__."""
+        assert not hasattr(Interval(0, 1), "__dict__")
+        assert not hasattr(Point(3), "__dict__")
+
 
 class TestIntervalValidation:
     """Test interval validation and error cases."""
@@ -140,6 +145,22 @@ class TestIntervalProperties:
 class TestIntervalContainment:
     """Test interval containment operations."""
 
+    def test_contains_many(self):
+        """Batched containment matches the scalar check."""
+        values = [-1, 0, 4.5, 5, 7]
+        i = Interval(0, 5, open_start=True)
+        assert i.contains_many(values) == [v in i for v in values]
+        assert i.contains_many(values) == [False, False, True, True, False]
+        assert Interval.empty().contains_many(values) == [False] * len(values)
+
+    def test_contains_value_edge_cases(self):
+        """The scalar fast path rejects NaN and everything for the empty set."""
+        assert float("nan") not in Interval(0, 5)
+        assert 0 not in Interval.empty()
+        assert float("inf") not in Interval(0, float("inf"))
+        assert 3 in Interval(0, float("inf"))
+        assert Interval(0, 5).contains(5) and not Interval(0, 5).contains(6)
+
     def test_contains_value(self):
         """Test value containment in intervals."""
         # Closed interval [0, 10]
@@ -274,6 +295,14 @@ class TestIntervalComparison:
 class TestIntervalStringRepresentation:
     """Test interval string representations."""
 
+    def test_repr_rendered_once(self):
+        """The rendered text is memoized on the interval."""
+        interval = Interval.left_open(0, 10)
+        text = repr(interval)
+        assert repr(interval) is text
+        assert str(interval) is text
+        assert repr(Interval.empty()) == "∅"
+
     def test_repr(self):
         """Test interval repr."""
         closed = Interval(0, 10)
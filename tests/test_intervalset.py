@@ -111,6 +111,47 @@ class TestSetProperties:
         s3 = IntervalSet([Interval.point(5), Interval(10, 20)])
         assert s3.measure() == 10  # 0 + 10
 
+    def test_measure_sums_bounds(self):
+        s = IntervalSet([Interval(0, 5), Interval.point(7), Interval(10, 12)])
+        assert s.measure() == 7
+        assert s.measure() == sum(i.length() for i in s)
+        assert IntervalSet().measure() == 0
+
+    def test_measure_follows_inplace_ops(self):
+        """The cached measure is recomputed when the intervals change."""
+        s = IntervalSet([Interval(0, 5)])
+        assert s.measure() == 5
+        s |= IntervalSet([Interval(10, 12)])
+        assert s.measure() == 7
+        s &= IntervalSet([Interval(11, 20)])
+        assert s.measure() == 1
+
+    def test_ior_splices_few_intervals(self):
+        base = [Interval(3 * i, 3 * i + 1) for i in range(10)]
+        s = IntervalSet(base)
+        # Bridges [3, 4] to [9, 10], touches [12, 13] and adds a lone point
+        s |= IntervalSet([Interval(4, 9, open_start=True), Interval(13, 14), 20])
+        expected = IntervalSet(base).union(
+            IntervalSet([Interval(4, 9), Interval(13, 14), 20])
+        )
+        assert list(s) == list(expected)
+        assert len(s) == 9 and 5 in s and 20 in s and 19.5 not in s
+
+        # Many intervals against few are merged in one sweep instead
+        few = IntervalSet([Interval(0.5, 1.5)])
+        few |= IntervalSet(base)
+        assert list(few) == list(IntervalSet(base + [Interval(0.5, 1.5)]))
+        one = IntervalSet([Interval(0, 10)])
+        one |= IntervalSet([Interval(1, 2), Interval(3, 4)])
+        assert list(one) == [Interval(0, 10)]
+
+    def test_infimum_supremum_from_sorted_ends(self):
+        s = IntervalSet([Interval(25, 30), Interval(0, 5), Interval(10, 20)])
+        assert s.infimum() == 0
+        assert s.supremum() == 30
+        assert IntervalSet().infimum() is None
+        assert IntervalSet().supremum() is None
+
     def test_bounds(self):
         """Test bounds calculation using first and last intervals."""
         # Single interval
@@ -150,6 +191,36 @@ class TestSetContainment:
         assert 10 in s
         assert 15 in s
 
+    def test_contains_many(self):
+        s = IntervalSet([Interval(0, 5, open_end=True), Interval.point(7)])
+        values = [-1, 0, 4.5, 5, 7, 8]
+        assert s.contains_many(values) == [v in s for v in values]
+        assert s.contains_many(values) == [False, True, True, False, True, False]
+        assert IntervalSet().contains_many([1, 2]) == [False, False]
+
+    def test_contains_value_binary_search(self):
+        """Membership only inspects the intervals around the value."""
+        s = IntervalSet(
+            [Interval(2 * k, 2 * k + 1, open_start=k % 2 == 1) for k in range(50)]
+        )
+        assert s._around(-1) == []
+        assert s._around(40.5) == [s._intervals[19], s._intervals[20]]
+        assert 40.5 in s and 41.5 not in s
+        assert 42 not in s  # open start of (42, 43]
+        assert 44 in s and 99 in s and 100 not in s
+
+    def test_start_bounds_follow_inplace_ops(self):
+        """The cached start column is rebuilt when the intervals change."""
+        s = IntervalSet([Interval(0, 1), Interval(5, 6)])
+        assert s._start_bounds() == [0.0, 5.0]
+        assert s._start_bounds() is s._start_bounds()
+        s |= IntervalSet([Interval(10, 11)])
+        assert s._start_bounds() == [0.0, 5.0, 10.0]
+        assert 10.5 in s
+        s -= IntervalSet([Interval(0, 6)])
+        assert s._start_bounds() == [10.0]
+        assert 0.5 not in s
+
     def test_contains_interval(self):
         """Test interval containment in sets."""
         s = IntervalSet([Interval(0, 10), Interval(20, 30)])
@@ -222,6 +293,30 @@ class TestSetOperations:
         assert isinstance(no_intersection, IntervalSet)
         assert no_intersection.is_empty()
 
+    def test_intersection_merge_sweep(self):
+        """Intersection and overlaps walk both sorted lists once."""
+        s1 = IntervalSet(
+            [Interval(0, 1, open_end=True), Interval(1, 3, open_start=True)]
+        )
+        s2 = IntervalSet([Interval(1, 1), Interval(2, 5), Interval(6, 7)])
+        # (1, 3] meets [1, 1] nowhere and [2, 5] on [2, 3]
+        assert s1 & s2 == Interval(2, 3)
+        assert s1.overlaps(s2)
+
+        s3 = IntervalSet([Interval(0, 1), Interval(2, 3, open_end=True)])
+        s4 = IntervalSet(
+            [Interval(1, 2, open_start=True, open_end=True), Interval(3, 4)]
+        )
+        assert (s3 & s4).is_empty()
+        assert not s3.overlaps(s4)
+        assert s3 & IntervalSet([Interval(0.5, 2.5)]) == IntervalSet(
+            [Interval(0.5, 1), Interval(2, 2.5)]
+        )
+        # Equal ends advance both sides
+        s5 = IntervalSet([Interval(0, 2), Interval(4, 6)])
+        s6 = IntervalSet([Interval(1, 2), Interval(5, 6)])
+        assert s5 & s6 == s6
+
     def test_difference_operator(self):
         """Test difference using - operator."""
         s1 = IntervalSet([Interval(0, 10)])
@@ -236,6 +331,25 @@ class TestSetOperations:
         complete_diff = s1 - s3
         assert complete_diff.is_empty()
 
+    def test_difference_subtrahend_spans_several(self):
+        """A subtrahend may cut several intervals, and one interval many times."""
+        s1 = IntervalSet([Interval(0, 2), Interval(3, 5), Interval(6, 8)])
+        s2 = IntervalSet([Interval(1, 4), Interval(4.5, 4.6), Interval(7, 9)])
+
+        difference = s1 - s2
+        assert difference == IntervalSet(
+            [
+                Interval(0, 1, open_end=True),
+                Interval(4, 4.5, open_start=True, open_end=True),
+                Interval(4.6, 5, open_start=True),
+                Interval(6, 7, open_end=True),
+            ]
+        )
+
+    def test_from_sorted_empty(self):
+        """Building from an empty sorted run gives the empty set."""
+        assert IntervalSet._from_sorted([]).is_empty()
+
     def test_complement(self):
         """Test complement operation."""
         # Complement requires explicit universe in this implementation
@@ -1,3 +1,6 @@
+import weakref
+
+from src import intervals
 from src.intervals import IntervalSet, Interval
 
 
@@ -47,6 +50,39 @@ def test_hausdorff_distance():
     assert s5.hausdorff_distance(s6) == 10.0
 
 
+def test_hausdorff_distance_is_remembered_until_changed():
+    cache = intervals._HAUSDORFF_CACHE
+    a = IntervalSet([Interval(0, 1)])
+    b = IntervalSet([Interval(0, 2)])
+    assert a.hausdorff_distance(b) == 1.0
+    entry = cache[(min(id(a), id(b)), max(id(a), id(b)))]
+    # Symmetric: the other argument order hits the same entry
+    assert b.hausdorff_distance(a) == 1.0
+    assert cache[(min(id(a), id(b)), max(id(a), id(b)))] is entry
+
+    # Either side changing invalidates the remembered distance
+    b |= IntervalSet([Interval(5, 6)])
+    assert a.hausdorff_distance(b) == 5.0
+    a |= IntervalSet([Interval(5, 7)])
+    assert a.hausdorff_distance(b) == 1.0
+    assert a.hausdorff_distance(IntervalSet([Interval(0, 7)])) == 2.0
+    a -= IntervalSet([Interval(5, 7)])
+    assert a.hausdorff_distance(b) == 5.0
+
+    # Bounded, and only weakly tied to the sets: a new set reusing the id
+    # of a collected one is never served its distance
+    unit = IntervalSet([Interval(0, 1)])
+    for i in range(20):
+        assert unit.hausdorff_distance(IntervalSet([Interval(i, i + 1)])) == i
+    kept = [IntervalSet([Interval(i, i + 1)]) for i in range(70)]
+    for i, s in enumerate(kept):
+        assert unit.hausdorff_distance(s) == i
+    assert len(cache) == intervals._HAUSDORFF_CACHE_SIZE
+    ref = weakref.ref(b)
+    del b
+    assert ref() is None
+
+
 def test_distance_edge_cases():
     """Test edge cases for IntervalSet distance."""
     s1 = IntervalSet([Interval(0, 1)])
@@ -1,6 +1,8 @@
+import math
+
 import pytest
-from src.intervals import Interval, IntervalSet
-from src.multidimensional import Box, BoxSet
+from src.intervals import Interval, IntervalSet, Point
+from src.multidimensional import Box, BoxSet, _epsilon_box
 
 
 class TestMinkowski1D:
@@ -201,6 +203,37 @@ class TestMinkowskiND:
         ints = list(iter(b1))
         assert ints[0] == Interval.closed(0, 1)
 
+    def test_box_minkowski_on_columns(self):
+        a = Box([Interval(0, 1, open_start=True), Interval(0, 2)])
+        b = Box([Interval(1, 2), Interval(1, 3, open_end=True)])
+        # Closed only where both summands are closed
+        res = a + b
+        assert res == Box(
+            [Interval(1, 3, open_start=True), Interval(1, 5, open_end=True)]
+        )
+        assert res._lo == (1, 1) and res._hi == (3, 5)
+        assert (a + 1)._closed == a._closed
+
+        # A sequence of Intervals sums axis by axis
+        c = Box([Interval(0, 1), Interval(0, 1)])
+        assert c.minkowski_sum([Interval(0, 1), Interval(0, 2)]) == Box(
+            [Interval(0, 2), Interval(0, 3)]
+        )
+
+        # Unbounded and degenerate sums keep the Interval semantics
+        ray = Box([Interval(0, float("inf")), Interval(0, 1)])
+        assert (ray + [1, 1]).intervals[0] == Interval(1, float("inf"))
+        flat = Box([Point(1), Interval(0, 1)])
+        assert (flat + 1).intervals[0] == Point(2)
+        assert (a + float("inf")).is_empty()
+
+        # Set sums validate their operands once, not per pair
+        s = BoxSet([a])
+        with pytest.raises(ValueError, match="Box dimension 1 must match 2"):
+            s.minkowski_sum(BoxSet([Box([Interval(0, 1)])]))
+        with pytest.raises(ValueError, match="Box dimension 1 must match 2"):
+            s.minkowski_sum(Interval(0, 1))
+
     def test_set_minkowski(self):
         s = BoxSet([Box([Interval(0, 1), Interval(0, 1)])])
 
@@ -211,6 +244,21 @@ class TestMinkowskiND:
         # Reverse scalar shift (Line 753)
         assert (10 + s) == (s + 10)
 
+        # A shift that rounds two distinct bounds together re-normalizes
+        tiny = BoxSet([Box([Interval(0, 1e-17)]), Box([Interval(2e-17, 1)])])
+        moved = tiny + 1
+        assert moved.volume() == 1.0 and moved == BoxSet([Box([Interval(1, 2)])])
+        a, b = moved.boxes
+        assert not a.overlaps(b)
+        assert (tiny + float("inf")).is_empty()
+
+        # Per-axis Intervals act as a structuring box, not a translation
+        pair = BoxSet([Box([Interval(0, 1)]), Box([Interval(3, 4)])])
+        assert pair.minkowski_sum([Interval(0, 2)]) == BoxSet([Box([Interval(0, 6)])])
+        assert (s + [Interval(0, 1), 1]) == BoxSet(
+            [Box([Interval(0, 2), Interval(1, 2)])]
+        )
+
         # Empty self (Line 669)
         assert BoxSet().minkowski_sum(Box([Interval(0, 1)])) == BoxSet()
         # Other empty (Line 679)
@@ -260,6 +308,9 @@ class TestMinkowskiND:
         s_eps_res = s_eps.dilate_epsilon(1.0)
         assert s_eps_res.volume() == 9.0  # [-1, 2] x [-1, 2] = 3 * 3 = 9
         assert BoxSet().dilate_epsilon(1.0) == BoxSet()
+        # The structuring cube is built once per (epsilon, dimension)
+        assert _epsilon_box(1.0, 2) is _epsilon_box(1.0, 2)
+        assert _epsilon_box(1.0, 2) == Box([Interval(-1, 1), Interval(-1, 1)])
 
         # Opening/Closing aliases
         box_big = Box([Interval(0, 10), Interval(0, 10)])
@@ -268,11 +319,38 @@ class TestMinkowskiND:
         assert s_big.opening(box_small) == box_big
         assert s_big.closing(box_small) == box_big
 
+        # Opening by a box runs erosion and dilation box by box: thin
+        # components vanish, the others come back whole and disjoint
+        thin = Box([Interval(20, 20.5), Interval(0, 10)])
+        s_two = BoxSet([box_big, thin])
+        opened = s_two.opening(box_small)
+        assert opened == box_big and opened.boxes == [box_big]
+        # A structuring set takes the general erode-then-dilate path
+        assert s_two.opening(BoxSet([box_small])) == opened
+
+        # (a - b) + b rounds past A_i here; clipped, the halves stay disjoint
+        left = Box([Interval(math.sqrt(2) / 2, 2 * math.pi), Interval(0, 1)])
+        right = Box(
+            [Interval(2 * math.pi, 3 * math.pi, open_start=True), Interval(0, 1)]
+        )
+        struct = Box(
+            [Interval(-math.sqrt(5), math.sqrt(3) / 7 - math.sqrt(5)), Interval(0, 0.5)]
+        )
+        first, second = BoxSet([left, right]).opening(struct).boxes
+        assert not first.overlaps(second)
+        assert left.contains(first) and right.contains(second)
+
         # Coverage for BoxSet.minkowski_sum promotion and pairwise
         s_base = BoxSet([Box([Interval(0, 1)])])
         s_sum = s_base.minkowski_sum(Box([Interval(0, 1)]))  # Promote Box
         assert s_sum.volume() == 2.0
 
+        # Dilation by a single structuring element (Box, Interval, empty)
+        s_two = BoxSet([Box([Interval(0, 1)]), Box([Interval(2, 3)])])
+        assert s_two.dilate(Interval(0, 1)) == BoxSet([Box([Interval(0, 4)])])
+        assert s_two.dilate(Box([Interval.empty()])).is_empty()
+        assert s_two.dilate(IntervalSet([Interval(0, 1)])).volume() == 4.0
+
         s_pair1 = BoxSet([Box([Interval(0, 1)])])
         s_pair2 = BoxSet([Box([Interval(2, 3)])])
         s_pair_sum = s_pair1.dilate(s_pair2)  # dilate alias
@@ -406,3 +484,107 @@ class TestMinkowskiND:
         closed = s1.closing(s2)
         assert isinstance(closed, IntervalSet)
         assert closed == s1
+
+    def test_set_erosion_by_boxset_sweeps_box_lists(self):
+        # Two stacked rows and a post eroded by two unit boxes side by side:
+        # the rows both start at x = 0, so the sweep meets same-side
+        # neighbours too, and the post erodes to disjoint vertical segments
+        rows = BoxSet(
+            [
+                Box([Interval(0, 4), Interval(0, 2)]),
+                Box([Interval(0, 4), Interval(3, 5)]),
+                Box([Interval(5, 6), Interval(0, 5)]),
+            ]
+        )
+        pair = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(1, 2), Interval(0, 1)]),
+            ]
+        )
+        eroded = rows.erode(pair)
+        assert eroded == BoxSet(
+            [
+                Box([Interval(0, 2), Interval(0, 1)]),
+                Box([Interval(0, 2), Interval(3, 4)]),
+            ]
+        )
+        folded = rows.erode(pair.boxes[0]) & rows.erode(pair.boxes[1])
+        assert eroded == folded
+        assert len(eroded.boxes) == 2
+        # A structuring box wider than every component empties the fold
+        wide = BoxSet([pair.boxes[0], Box([Interval(10, 20), Interval(0, 1)])])
+        assert rows.erode(wide).is_empty()
+
+    def test_set_shift_keeps_boxes_disjoint(self):
+        s = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(1, 2, open_start=True), Interval(0, 1)]),
+            ]
+        )
+        shifted = s + [10, 20]
+        assert [b for b in shifted.boxes] == [b + [10, 20] for b in s.boxes]
+        assert shifted.volume() == 2
+        assert (shifted._bbox_lo, shifted._bbox_hi) == ((10, 20), (12, 21))
+        # A huge shift rounds the half-open side away
+        collapsed = BoxSet([Box([Interval(0, 1, open_start=True)])]) + 1e300
+        assert collapsed.is_empty()
+
+    def test_box_erosion_on_columns(self):
+        # x + B stays inside A at a bound A closes or B leaves open
+        closed = Box([Interval(0, 4), Interval(0, 3)])
+        opened = Box([Interval(0, 4, open_start=True), Interval(0, 3, open_end=True)])
+        struct = Box([Interval(0, 1, open_start=True), Interval(0, 1)])
+        assert closed.erode(struct) == Box([Interval(0, 3), Interval(0, 2)])
+        assert opened.erode(struct) == Box(
+            [Interval(0, 3), Interval(0, 2, open_end=True)]
+        )
+        assert closed._minus(Box([Interval(0, 5), Interval(0, 1)])) is None
+        # Degenerate and infinite results take the Interval path
+        assert closed.erode(Box([Interval(0, 4), Interval(0, 1)])) == Box(
+            [Interval(0, 0), Interval(0, 2)]
+        )
+        assert Box([Interval(0, float("inf")), Interval(0, 3)]).erode(struct) == Box(
+            [Interval(0, float("inf")), Interval(0, 2)]
+        )
+        # The structuring box is validated once for the whole set
+        with pytest.raises(ValueError):
+            BoxSet([closed]).erode(Box([Interval(0, 1)]))
+        with pytest.raises(ValueError):
+            BoxSet([closed]).erode(BoxSet([Box([Interval(0, 1)])]))
+        with pytest.raises(ValueError):
+            BoxSet([closed]).opening(Box([Interval(0, 1)]))
+
+    def test_dilate_epsilon_absorbed_by_bounds(self):
+        s = BoxSet([Box([Interval(1, 2), Interval(4, 8, open_end=True)])])
+        # Below the rounding step at the smallest bound: an exact no-op
+        assert s.dilate_epsilon(1e-17) is s
+        assert s.dilate(_epsilon_box(1e-17, 2)) == s
+        grown = s.dilate_epsilon(1e-9)
+        assert grown is not s and grown.volume() > s.volume()
+        # Infinite bounds absorb any offset
+        plane = BoxSet([Box([Interval(float("-inf"), float("inf"))])])
+        assert plane.dilate_epsilon(5) is plane
+
+    def test_set_sum_skips_repeated_pairs(self):
+        row = BoxSet._from_disjoint(
+            [Box([Interval(2 * i, 2 * i + 1)]) for i in range(4)]
+        )
+        # a_i + b_j only depends on i + j: 16 pairs, 7 distinct sums
+        total = row.minkowski_sum(row)
+        assert total == BoxSet([Box([Interval(0, 14)])])
+        assert total.volume() == 14
+        # Touching sums, not repeats, are still merged by normalization
+        spaced = BoxSet._from_disjoint([Box([Interval(0, 1)]), Box([Interval(3, 4)])])
+        assert spaced.minkowski_sum(row).volume() == 11
+
+    def test_set_erosion_off_origin(self):
+        line = BoxSet([Box([Interval(0, 10)])])
+        # Probes away from the origin move the erosion outside the set
+        probes = BoxSet([Box([Point(5)]), Box([Point(6)])])
+        assert line.erode(probes) == BoxSet([Box([Interval(-5, 4)])])
+        assert line.erode(BoxSet([Box([Point(5)])])) == line.erode(Box([Point(5)]))
+        # Nothing fits the first probe: the fold stops right away
+        wide = BoxSet([Box([Interval(0, 20)]), Box([Point(30)])])
+        assert line.erode(wide).is_empty()
@@ -1,6 +1,14 @@
 import pytest
-from src.intervals import Interval
-from src.multidimensional import Box
+from src.intervals import Interval, Point
+from src.multidimensional import (
+    Box,
+    _gap_kernel,
+    _inside_kernel,
+    _intersection_kernel,
+    _overlap_kernel,
+    _point_kernel,
+    _separated_kernel,
+)
 
 
 class TestBoxBasic:
@@ -23,6 +31,16 @@ class TestBoxBasic:
         b = Box([Interval(0, 5), Interval(0, 5)])
         assert b.volume() == 25.0
 
+    def test_volume_and_hash_memoized(self):
+        b = Box([Interval(0, 2), Interval(0, 3, open_end=True)])
+        assert not hasattr(b, "_volume")
+        assert b.volume() == 6.0
+        assert b._volume == 6.0
+
+        same = Box([Interval(0, 2), Interval(0, 3, open_end=True)])
+        assert hash(b) == hash(same) == b._hash
+        assert len({b, same, Box([Interval(0, 2), Interval(0, 3)])}) == 2
+
     def test_volume_3d_degenerate_point(self):
         # Point in 3D: [1,1] x [2,2] x [3,3]
         b = Box([Interval.point(1), Interval.point(2), Interval.point(3)])
@@ -35,6 +53,14 @@ class TestBoxBasic:
         assert not b.contains((-1, 5))
         assert not b.contains((2, 11))
 
+    def test_contains_point_open_bounds(self):
+        b = Box([Interval(0, 5, open_start=True), Interval(0, 10, open_end=True)])
+        # Bits 0/1: x closedness, bits 2/3: y closedness
+        assert b._closed == 0b0110
+        assert not b.contains((0, 1))
+        assert b.contains((5, 0))
+        assert not b.contains((5, 10))
+
     def test_contains_dimension_mismatch(self):
         b = Box([Interval(0, 1)])
         with pytest.raises(ValueError, match="must match Box dimension"):
@@ -54,6 +80,108 @@ class TestBoxBasic:
         b4 = Box([Interval(0, 5), Interval(6, 10)])
         assert not b1.overlaps(b4)
 
+    def test_separated_kernel(self):
+        k3 = _separated_kernel(3)
+        assert _separated_kernel(3) is k3  # generated once per dimension
+        assert not k3((0, 0, 0), (1, 1, 1), (1, 0, 0), (2, 1, 1))
+        assert k3((0, 0, 0), (1, 1, 1), (0, 0, 2), (1, 1, 3))
+        assert k3((0, 0, 5), (1, 1, 6), (0, 0, 2), (1, 1, 3))
+
+    def test_overlap_kernel(self):
+        k2 = _overlap_kernel(2)
+        assert _overlap_kernel(2) is k2  # generated once per dimension
+        assert k2((0, 0), (2, 2), (1, 1), (3, 3), 0, 0) is True
+        assert k2((0, 0), (1, 1), (2, 0), (3, 1), ~0, ~0) is False
+        # Touching in dimension 1: only the closedness bit 2 << 2 decides
+        assert k2((0, 0), (2, 1), (1, 1), (3, 2), 0b1000, 0) is True
+        assert k2((0, 0), (2, 1), (1, 1), (3, 2), 0b0010, ~0) is False
+
+    def test_containment_kernels(self):
+        p3 = _point_kernel(3)
+        assert _point_kernel(3) is p3
+        # [0, 1) x (0, 1] x {2}: closedness bits 0b11_10_01
+        lo, hi, closed = (0, 0, 2), (1, 1, 2), 0b111001
+        assert p3(lo, hi, closed, (0, 1, 2)) is True
+        assert p3(lo, hi, closed, (1, 0.5, 2)) is False
+        assert p3(lo, hi, closed, (0.5, 0, 2)) is False
+        assert p3(lo, hi, closed, [0.5, 0.5, 2.5]) is False
+
+        b2 = _inside_kernel(2)
+        assert _inside_kernel(2) is b2
+        assert b2((0, 0), (4, 4), (1, 0), (4, 2), 0) is True
+        # A bound shared with an open side of A is only inside if B is open too
+        assert b2((0, 0), (4, 4), (1, 0), (4, 2), 0b0010) is False
+        assert b2((0, 0), (4, 4), (1, -1), (2, 2), 0) is False
+
+        box = Box([Interval(0, 4, open_end=True), Interval(0, 4)])
+        assert box.contains(Box([Interval(1, 4, open_end=True), Interval(0, 4)]))
+        assert not box.contains(Box([Interval(1, 4), Interval(0, 4)]))
+        assert not Box.empty(2).contains(box)
+        assert Box.empty(2).contains(Box.empty(2))
+
+    def test_gap_kernel(self):
+        gap = _gap_kernel(3)
+        assert gap is _gap_kernel(3)
+        # Gaps below, above and none (overlap) on the three axes
+        assert gap((0, 0, 0), (1, 1, 1), (3, -5, 0.5), (4, -4, 2)) == 4 + 16
+        box = Box([Interval(0, 1, open_end=True), Interval(0, 1), Interval(0, 1)])
+        # Touching bounds are at distance 0 whatever their openness
+        assert box.distance(Box([Interval(1, 2)] * 3)) == 0.0
+        assert box.distance_to_point([4, 0.5, -4]) == 5.0
+
+    def test_intersection_kernel(self):
+        inter = _intersection_kernel(2)
+        assert inter is _intersection_kernel(2)
+        a = Box([Interval(0, 2), Interval(0, 2)])
+        b = Box([Interval(1, 3), Interval(2, 3, open_start=True)])
+        # Emptiness found on the last axis, past a non-empty one
+        assert inter(a, b) is None
+        assert inter(a, Box([Interval(2, 3), Interval(-1, 1)])) == Box(
+            [Point(2), Interval(0, 1)]
+        )
+        # Empty results share one box per dimension
+        assert a.intersection(b) is a.intersection(Box([Interval(5, 6)] * 2))
+
+    def test_overlaps_touching_boundaries(self):
+        b1 = Box([Interval(0, 5), Interval(0, 5)])
+        # Closed boundaries touching at x=5 share an edge
+        assert b1.overlaps(Box([Interval(5, 8), Interval(0, 5)]))
+        # Open boundary at x=5 leaves a gap
+        assert not b1.overlaps(Box([Interval(5, 8, open_start=True), Interval(0, 5)]))
+
+    def test_intersection_separated_bounds(self):
+        b1 = Box([Interval(0, 5), Interval(0, 5)])
+        b2 = Box([Interval(0, 5), Interval(7, 9)])
+        res = b1.intersection(b2)
+        assert res.is_empty()
+        assert res.dimension == 2
+
+        # Touching bounds with an open side also intersect to empty
+        b3 = Box([Interval(5, 8, open_start=True), Interval(0, 5)])
+        assert b1.intersection(b3).is_empty()
+
+    def test_intersection_bounds_and_openness(self):
+        a = Box([Interval(0, 5, open_start=True), Interval(0, 4), Interval(1, 3)])
+        b = Box([Interval(0, 6), Interval(4, 9), Interval(2, 3, open_end=True)])
+        res = a.intersection(b)
+        # Equal bounds stay closed only if both are; closed touching bounds
+        # leave a Point component, as Interval.intersection does
+        assert res.intervals == (
+            Interval(0, 5, open_start=True),
+            Point(4),
+            Interval(2, 3, open_end=True),
+        )
+        assert isinstance(res.intervals[1], Point)
+        rebuilt = Box(list(res.intervals))
+        assert (res._lo, res._hi, res._closed) == (
+            rebuilt._lo,
+            rebuilt._hi,
+            rebuilt._closed,
+        )
+
+        # Any empty operand gives the empty box
+        assert a.intersection(Box([Interval.empty()] * 3)) == Box.empty(3)
+
     def test_intersection(self):
         # Intersect two 2D boxes
         # [0, 5]x[0, 5] AND [3, 8]x[3, 8] -> [3, 5]x[3, 5]
@@ -128,6 +256,27 @@ class TestBoxBasic:
         assert len(diff) == 1
         assert diff[0].intervals[0] == Interval(0, 5, open_end=True)
 
+    def test_difference_slices_keep_bound_columns(self):
+        # Open overlap bounds leave point slices behind: [0, 4] \ (0, 4) x ...
+        a = Box([Interval(0, 4), Interval(0, 4, open_end=True)])
+        b = Box([Interval(0, 4, open_start=True, open_end=True), Interval(1, 9)])
+
+        diff = a.difference(b)
+        assert [d.intervals for d in diff] == [
+            (Interval.point(0), Interval(0, 4, open_end=True)),
+            (Interval.point(4), Interval(0, 4, open_end=True)),
+            (Interval.open(0, 4), Interval(0, 1, open_end=True)),
+        ]
+        for piece in diff:
+            rebuilt = Box(list(piece.intervals))
+            assert (piece._lo, piece._hi, piece._closed) == (
+                rebuilt._lo,
+                rebuilt._hi,
+                rebuilt._closed,
+            )
+            assert not piece.is_empty()
+        assert sum(d.volume() for d in diff) == a.volume() - a.intersection(b).volume()
+
     def test_coverage_gaps(self):
         # Line 35: Empty intervals
         with pytest.raises(ValueError, match="at least 1 dimension"):
@@ -1,4 +1,11 @@
-from src.multidimensional import Box, BoxSet
+import pytest
+from src.multidimensional import (
+    Box,
+    BoxSet,
+    _bounding_box,
+    _hilbert_key,
+    _hilbert_order,
+)
 from src.intervals import Interval, IntervalSet
 from src.spatial import RTree, RTreeNode
 from typing import Optional, Union
@@ -72,6 +79,32 @@ def test_rtree_choose_leaf_comprehensive():
     assert leaf == c1
 
 
+def test_rtree_choose_leaf_unbounded_boxes():
+    tree = RTree(get_mbr_internal, expand_mbr_internal, Box.volume, Box.overlaps)
+    node = RTreeNode(4, is_leaf=False)
+
+    def leaf(*boxes):
+        result = RTreeNode(4, is_leaf=True)
+        for box in boxes:
+            result.add_child(box, box, expand_mbr_internal)
+        node.add_child(result, result.mbr, expand_mbr_internal)
+        return result
+
+    leaf(Box([Interval(float("-inf"), 0)]), Box([Interval(float("-inf"), 1)]))
+    c2 = leaf(Box([Interval(float("-inf"), 5)]))
+
+    # Every enlargement is inf - inf; still descend, to the smaller leaf
+    assert tree._choose_leaf(node, Box([Interval(float("-inf"), 3)])) is c2
+
+    # A finite enlargement beats the undefined ones
+    c3 = leaf(Box([Interval(0, 1)]))
+    assert tree._choose_leaf(node, Box([Interval(1, 2)])) is c3
+
+    # Sets of unbounded boxes keep finding every component
+    s = BoxSet(Box([Interval(float("-inf"), i), Interval(i, i + 1)]) for i in range(40))
+    assert all([-1, i + 0.5] in s for i in range(40))
+
+
 def test_rtree_split_node_complex():
     def get_vol(b):
         return b.volume()
@@ -199,3 +232,307 @@ def test_intervals_hausdorff_midpoint_not_in_interval():
     A = IntervalSet([Interval(0, 1)])
     B = IntervalSet([Interval(5, 6), Interval(8, 9)])
     A.hausdorff_distance(B)
+
+
+def test_indexed_intersection_and_difference_match_linear_scan():
+    # A 2D grid of 16 unit cells is large enough to build the R-tree
+    grid = BoxSet(
+        [
+            Box([Interval(x, x + 1, open_end=True), Interval(y, y + 1, open_end=True)])
+            for x in range(4)
+            for y in range(4)
+        ]
+    )
+    assert grid._index is not None
+    probe = BoxSet([Box([Interval(0.5, 2.5), Interval(1.5, 3.5)])])
+    assert probe._index is None
+
+    # Either operand may carry the index
+    assert (grid & probe).volume() == 4.0
+    assert (probe & grid).volume() == 4.0
+    assert (grid - probe).volume() == 12.0
+    assert (probe - grid).is_empty()
+
+
+def test_index_mbr_from_bound_columns():
+    inf = float("inf")
+    mbr = _bounding_box((0.0, -inf, 2.0, 3.0), (1.0, 5.0, 2.0, inf))
+    expected = Box(
+        [Interval(0, 1), Interval(-inf, 5), Interval(2, 2), Interval(3, inf)]
+    )
+    assert mbr == expected
+    assert (mbr._lo, mbr._hi, mbr._closed) == (
+        expected._lo,
+        expected._hi,
+        expected._closed,
+    )
+
+    # The root MBR of an indexed set spans every component
+    cells = BoxSet(
+        [Box([Interval(x, x + 1, open_end=True), Interval(-x, 0)]) for x in range(12)]
+    )
+    assert cells._index.root.mbr == Box([Interval(0, 12), Interval(-11, 0)])
+
+    # The index tests entries on the bound columns, touching closed bounds
+    # included, and no entry overlaps an empty query
+    hits = cells._index.search(Box([Interval(2, 3), Interval(-1, -1)]))
+    assert sorted(hits, key=lambda b: b._lo) == [cells.boxes[2], cells.boxes[3]]
+    assert cells._index.search(Box([Interval(5, 5, open_start=True)] * 2)) == []
+
+
+def test_indexed_distance_matches_linear_scan():
+    # Sparse 2D cells, every other unit square of a 6x6 grid
+    grid = BoxSet(
+        [
+            Box([Interval(2 * x, 2 * x + 1), Interval(2 * y, 2 * y + 1)])
+            for x in range(6)
+            for y in range(6)
+        ]
+    )
+    assert grid._index is not None
+
+    for p in [(1.5, 1.5), (-3, 4), (20, 20), (5.5, 0.5)]:
+        expected = min(b.distance_to_point(p) for b in grid.boxes)
+        assert grid.distance_to_point(p) == expected
+
+    far = BoxSet([Box([Interval(30, 31), Interval(30, 31)])])
+    expected = min(b.distance(c) for b in grid.boxes for c in far.boxes)
+    assert grid.distance(far) == expected
+    assert far.distance(grid) == expected
+    assert grid.distance(grid) == 0.0
+
+
+def test_rtree_nearest():
+    tree = RTree(
+        get_mbr_internal,
+        expand_mbr_internal,
+        lambda b: b.volume(),
+        lambda b1, b2: b1.overlaps(b2),
+    )
+    assert tree.nearest(lambda m: 0.0) == (None, float("inf"))
+
+    # A lone leaf root drains the queue without pruning
+    tree.insert(Box([Interval(0, 1)]))
+    assert tree.nearest(lambda m: m.distance_to_point((4,)))[1] == 3.0
+
+    boxes = [Box([Interval(3 * i, 3 * i + 1)]) for i in range(1, 10)]
+    for b in boxes:
+        tree.insert(b)
+    item, d = tree.nearest(lambda m: m.distance_to_point((10,)))
+    assert item == boxes[2] and d == 0.0
+    # Nothing closer than the bound
+    assert tree.nearest(lambda m: m.distance_to_point((100,)), 5.0) == (None, 5.0)
+
+
+def test_rtree_deep_tree_by_insertion():
+    tree = RTree(
+        get_mbr_internal,
+        expand_mbr_internal,
+        lambda b: b.volume(),
+        lambda b1, b2: b1.overlaps(b2),
+    )
+    boxes = [Box([Interval(2 * i, 2 * i + 1)]) for i in range(300)]
+    for b in boxes:
+        tree.insert(b)
+
+    # Splits cascade up several levels; every node keeps its parent link
+    # and an MBR covering its children
+    depth, node = 0, tree.root
+    while not node.is_leaf:
+        node, depth = node.children[0], depth + 1
+    assert depth >= 4
+    stack = [tree.root]
+    while stack:
+        node = stack.pop()
+        for child in node.children:
+            mbr = get_mbr_internal(child)
+            assert node.mbr.contains(mbr)
+            if isinstance(child, RTreeNode):
+                assert child.parent is node
+                stack.append(child)
+    assert tree.search(Box([Interval(100.5, 104.5)])) == boxes[50:53]
+
+
+def test_rtree_linear_split():
+    with pytest.raises(ValueError):
+        RTree(
+            get_mbr_internal, expand_mbr_internal, Box.volume, Box.overlaps, split="x"
+        )
+
+    # Plain (lo, hi) tuples as MBRs: the split only goes through the callbacks
+    def get_mbr(item):
+        return item.mbr if isinstance(item, RTreeNode) else item
+
+    def expand(m1, m2):
+        return m2 if m1 is None else (min(m1[0], m2[0]), max(m1[1], m2[1]))
+
+    tree = RTree(
+        get_mbr,
+        expand,
+        lambda m: m[1] - m[0],
+        lambda m1, m2: m1[0] <= m2[1] and m2[0] <= m1[1],
+        max_entries=8,
+        split="linear",
+    )
+    items = [((i * 37) % 200, (i * 37) % 200 + 0.5) for i in range(200)]
+    for item in items:
+        tree.insert(item)
+    assert not tree.root.is_leaf
+    assert sorted(tree.search((10.7, 12.2))) == [(11, 11.5), (12, 12.5)]
+
+    stack = list(tree.root.children)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, RTreeNode):
+            assert tree.min_entries <= len(node.children) <= tree.max_entries
+            stack.extend(node.children)
+
+    # Unbounded MBRs waste nan volume, yet two distinct seeds are found
+    node = RTreeNode(8, is_leaf=True)
+    node.children = [(float("-inf"), i) for i in range(9)]
+    group1, group2 = tree._redistribute(node)
+    assert len(group1.children) >= 2 and len(group2.children) >= 2
+    assert sorted(group1.children + group2.children) == [
+        (float("-inf"), i) for i in range(9)
+    ]
+    assert node.children == []
+
+
+def test_rtree_find():
+    tree = RTree(
+        get_mbr_internal,
+        expand_mbr_internal,
+        lambda b: b.volume(),
+        lambda b1, b2: b1.overlaps(b2),
+    )
+    assert tree.find(lambda m: True) is None
+
+    boxes = [Box([Interval(3 * i, 3 * i + 1)]) for i in range(10)]
+    for b in boxes:
+        tree.insert(b)
+    assert not tree.root.is_leaf
+    assert tree.find(lambda m: m.contains((15.5,))) == boxes[5]
+    # Inside the root MBR but in a gap between the leaves
+    assert tree.find(lambda m: m.contains((14.0,))) is None
+    assert tree.find(lambda m: m.contains((100.0,))) is None
+
+
+def test_rtree_bulk_load():
+    tree = RTree(
+        get_mbr_internal,
+        expand_mbr_internal,
+        lambda b: b.volume(),
+        lambda b1, b2: b1.overlaps(b2),
+    )
+    tree.bulk_load([])
+    assert tree.root.is_leaf and tree.search(Box([Interval(0, 1)])) == []
+
+    boxes = [Box([Interval(2 * i, 2 * i + 1)]) for i in range(17)]
+    tree.bulk_load(boxes)
+
+    # Balanced runs: every node holds 2..max_entries children
+    def nodes(node):
+        yield node
+        if not node.is_leaf:
+            for child in node.children:
+                assert child.parent is node
+                yield from nodes(child)
+
+    for node in nodes(tree.root):
+        assert 2 <= len(node.children) <= tree.max_entries
+    assert tree.root.parent is None
+    assert tree.root.mbr == Box([Interval(0, 33)])
+    assert tree.search(Box([Interval(3.5, 6.5)])) == boxes[2:4]
+
+    # The packed tree keeps accepting single insertions
+    extra = Box([Interval(40, 41)])
+    tree.insert(extra)
+    assert tree.search(Box([Interval(39, 50)])) == [extra]
+
+
+def test_set_index_is_built_on_first_use():
+    boxes = [Box([Interval(2 * i, 2 * i + 1)]) for i in range(12)]
+    s = BoxSet._from_disjoint(boxes)
+    assert s._rtree is None
+    # Splitting into components never queries the index of the parts
+    row = [Box([Interval(i, i + 1, open_end=True)]) for i in range(12)]
+    parts = BoxSet._from_disjoint(row + [Box([Interval(100, 101)])])
+    components = parts.connected_components()
+    assert [len(part.boxes) for part in components] == [12, 1]
+    assert all(part._rtree is None for part in components)
+
+    # 1D points are found by bisection, other point lookups use the index
+    assert [5.5] not in s and [6.5] in s and s._rtree is None
+    square = BoxSet._from_disjoint(
+        [Box([b.intervals[0], Interval(0, 1)]) for b in boxes]
+    )
+    assert [5.5, 0.5] not in square and [6.5, 0.5] in square
+    tree = square._rtree
+    assert tree is not None and square._index is tree
+    # Later additions go into the same tree
+    square.add(Box([Interval(30, 31), Interval(0, 1)]))
+    assert square._index is tree and [30.5, 0.5] in square
+
+
+def test_set_index_scans_boxes_added_after_packing():
+    boxes = [Box([Interval(2 * i, 2 * i + 1), Interval(0, 1)]) for i in range(12)]
+    s = BoxSet._from_disjoint(boxes)
+    assert [6.5, 0.5] in s
+    tree = s._rtree
+    assert s._indexed == 12
+    # Additions stay out of the packed tree but are still found
+    s.add(Box([Interval(30, 31), Interval(0, 1)]))
+    assert s._rtree is tree and s._indexed == 12
+    probe = Box([Interval(29, 32), Interval(0, 1)])
+    assert tree.search(probe) == [] and s._candidates(probe) == s.boxes[12:]
+    assert s.overlaps(probe) and not s.overlaps(Box([Interval(32, 33), Interval(0, 1)]))
+    # Lookups through the index itself insert the tail first
+    assert [30.5, 0.5] in s and s._rtree is tree and s._indexed == 13
+
+    # A tail past the limit gets the whole set packed again
+    for i in range(20):
+        s.add(Box([Interval(100 + 2 * i, 101 + 2 * i), Interval(0, 1)]))
+    # ... by an addition inside the set, which slices against the index
+    s.add(Box([Interval(138, 139.5), Interval(0, 1)]))
+    assert s._rtree is not tree and s._indexed == len(s.boxes) - 1
+    assert s.volume() == 33.5
+    tree = s._rtree
+    for i in range(20):
+        s.add(Box([Interval(200 + 2 * i, 201 + 2 * i), Interval(0, 1)]))
+    # ... or by a lookup through the index
+    assert [238.5, 0.5] in s
+    assert s._rtree is not tree and s._indexed == len(s.boxes)
+
+
+def test_hilbert_order():
+    # 2x2 grid: the curve visits (0,0), (0,1), (1,1), (1,0)
+    keys = {_hilbert_key([x, y], 1): (x, y) for x in range(2) for y in range(2)}
+    assert [keys[k] for k in range(4)] == [(0, 0), (0, 1), (1, 1), (1, 0)]
+
+    # Consecutive keys are adjacent cells of a 4x4x4 grid
+    cells = [(x, y, z) for x in range(4) for y in range(4) for z in range(4)]
+    path = sorted(cells, key=lambda c: _hilbert_key(list(c), 2))
+    assert all(
+        sum(abs(a - b) for a, b in zip(p, q)) == 1 for p, q in zip(path, path[1:])
+    )
+
+    # Boxes follow their centres; infinite bounds are clamped
+    inf = float("inf")
+    boxes = [
+        Box([Interval(x, x + 1), Interval(y, y + 1)])
+        for x, y in [(3, 0), (0, 0), (0, 3)]
+    ]
+    ray = Box([Interval(3, inf), Interval(3, 4)])
+    assert _hilbert_order(boxes + [ray]) == [boxes[1], boxes[2], ray, boxes[0]]
+    line = [Box([Interval(-inf, inf)])]
+    assert _hilbert_order(line) == line
+    assert _hilbert_order(boxes, bits=8) == [boxes[1], boxes[2], boxes[0]]
+
+    # Centres and extents near the float limits do not overflow
+    edges = [1.7e308 * (1 - i / 400) for i in range(201)]
+    huge = [Box([Interval(edges[i + 1], edges[i]), Interval(0, 1)]) for i in range(200)]
+    huge += [
+        Box([Interval(-edges[i], -edges[i + 1]), Interval(0, 1)]) for i in range(200)
+    ]
+    assert sorted(map(id, _hilbert_order(huge))) == sorted(map(id, huge))
+    assert [1.7e308, 0.5] in BoxSet(huge)
@@ -9,6 +9,7 @@ class TestTopology1D:
         i = Interval.closed(0, 10)
         assert i.interior() == Interval.open(0, 10)
         assert i.closure() == Interval.closed(0, 10)
+        assert i.closure() is i
 
         # (0, 10)
         i2 = Interval.open(0, 10)
@@ -112,6 +113,41 @@ class TestTopologyND:
         # (1, 1) is a corner of the interior shared part, still on boundary
         assert (1, 1) in bound_l
 
+    def test_boundary_faces(self):
+        # Two unit cells side by side share the face x = 1
+        s = BoxSet(
+            [
+                Box([Interval(0, 1), Interval(0, 1)]),
+                Box([Interval(1, 2), Interval(0, 1)]),
+            ]
+        )
+        faces = list(s.boundary_faces())
+        # The shared face belongs to the boundary too, and is yielded once
+        assert len(faces) == s.boundary_face_count() == 7
+        assert faces.count(Box([Interval(1, 1), Interval(0, 1)])) == 1
+        assert Box([Interval(2, 2), Interval(0, 1)]) in faces
+        assert BoxSet(faces) == s.boundary()
+
+        # Partly shared faces and open sides: the faces still cover boundary()
+        t = BoxSet(
+            [
+                Box([Interval(0, 2), Interval(0, 1, open_end=True)]),
+                Box([Interval(1, 3, open_start=True), Interval(1, 2)]),
+            ]
+        )
+        assert BoxSet(list(t.boundary_faces())) == t.boundary()
+        for p in [(1.5, 1), (0.5, 1), (2.5, 1), (3, 1.5)]:
+            assert p in BoxSet(list(t.boundary_faces()))
+            assert p in t.boundary()
+
+        # No faces at infinity; a degenerate side yields one face
+        half = BoxSet([Box([Interval(0, float("inf")), Interval(3, 3)])])
+        assert list(half.boundary_faces()) == [
+            Box([Interval(0, 0), Interval(3, 3)]),
+            Box([Interval(0, float("inf")), Interval(3, 3)]),
+        ]
+        assert BoxSet().boundary_face_count() == 0
+
     def test_connectivity(self):
         # Connected: Two touching boxes
         b1 = Box([Interval(0, 1), Interval(0, 1)])
@@ -130,6 +166,47 @@ class TestTopologyND:
         assert BoxSet().is_connected()
         assert BoxSet().connected_components() == []
 
+    def test_connected_components_sweep(self):
+        # A ring of four bars: every bar touches two others, so the union of
+        # the last pair finds both already in one component. The column at
+        # x=10 overlaps the ring along x but is separated along y.
+        ring = [
+            Box([Interval(0, 3), Interval(0, 1, open_end=True)]),
+            Box([Interval(0, 1, open_end=True), Interval(1, 3)]),
+            Box([Interval(2, 3), Interval(1, 3)]),
+            Box([Interval.open(1, 2), Interval(2, 3)]),
+        ]
+        column = Box([Interval(2.5, 2.5), Interval(5, 6)])
+        far = Box([Interval(10, 11), Interval(0, 1)])
+        s = BoxSet(ring + [column, far])
+
+        components = s.connected_components()
+        assert [c.volume() for c in components] == [8.0, 0.0, 1.0]
+        assert [len(c.boxes) for c in components] == [4, 1, 1]
+        assert components[0] == BoxSet(ring)
+        # Components share the stored boxes instead of re-slicing them
+        assert set(map(id, components[0].boxes)) <= set(map(id, s.boxes))
+        assert not s.is_connected()
+
+    def test_connected_components_sweep_axis(self):
+        # Long horizontal strips: the sweep runs along y, where they are thin
+        strips = BoxSet(
+            [Box([Interval(0, 100), Interval(2 * j, 2 * j + 1)]) for j in range(5)]
+        )
+        assert strips._sweep_axis() == 1
+        assert len(strips.connected_components()) == 5
+
+        # Unbounded and flat axes are never chosen over a bounded one
+        inf = float("inf")
+        rays = BoxSet(
+            [
+                Box([Interval(0, inf), Interval(0, 1), Interval(3, 3)]),
+                Box([Interval(5, inf), Interval(1, 2), Interval(3, 3)]),
+            ]
+        )
+        assert rays._sweep_axis() == 1
+        assert len(rays.connected_components()) == 1
+
     def test_box_equality(self):
         """Cover Box.__eq__."""
         b1 = Box([Interval(0, 1)])